@@ -1,40 +1,251 @@
+"""Helpers for reading SOPS encrypted files.
+
+YAML and JSON documents are decrypted in process by `bridge.secrets.sops_engine`,
+falling back to the `sops` binary for other formats or when the native engine is unable
+to decrypt a file.  Set `BRIDGE_SOPS_BACKEND=subprocess` to always use the binary.
+
+Decrypted contents are cached in process, keyed by a hash of the ciphertext, so that
+repeated reads of the same file only pay for a single decryption.  Setting
+the `BRIDGE_SOPS_CACHE_KEY` environment variable to a Fernet key (generate one with
+`python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key())"`)
+additionally enables an on-disk store that keeps the decrypted values encrypted at
+rest, allowing separate Pulumi and PyInfra runs to share the work.
+"""
+import hashlib
 import json
 import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from platform import system
-from typing import Any
+from typing import Any, Iterable, Optional
 
 import yaml
+from cryptography.fernet import Fernet, InvalidToken
+
+from bridge.secrets.sops_engine import SopsEngineError, decrypt_document
 
 if system() == "Darwin":
     SOPS_BINARY = Path(__file__).parent.joinpath("bin", "sops_macos")
 else:
     SOPS_BINARY = Path(__file__).parent.joinpath("bin", "sops")
 
+DEFAULT_PREFETCH_WORKERS = 8
+SOPS_BACKEND_ENV = "BRIDGE_SOPS_BACKEND"
+SOPS_CACHE_KEY_ENV = "BRIDGE_SOPS_CACHE_KEY"
+SOPS_CACHE_DIR_ENV = "BRIDGE_SOPS_CACHE_DIR"
+DEFAULT_SOPS_CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME", Path.home().joinpath(".cache"))
+).joinpath("ol-infrastructure", "sops")
 
-def read_yaml_secrets(sops_file: Path) -> dict[str, Any]:
-    yaml_data = subprocess.run(
-        [SOPS_BINARY, "--decrypt", Path(__file__).parent.joinpath(sops_file)],
+
+@dataclass
+class SopsCacheStats:
+    """Counters describing how decryption requests were satisfied."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+
+class DecryptedSecretCache:
+    """Content-addressed cache of decrypted SOPS file contents.
+
+    Entries are keyed by the SHA-256 digest of the encrypted file so that any change
+    to the file produces a new key and the stale value is never served.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        encryption_key: Optional[bytes] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.stats = SopsCacheStats()
+        self._fernet = Fernet(encryption_key) if encryption_key else None
+        self._memo: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "DecryptedSecretCache":
+        """Build a cache, enabling the disk store if a key is present in the env.
+
+        :returns: A cache configured according to the `BRIDGE_SOPS_CACHE_*` environment
+                  variables.
+
+        :rtype: DecryptedSecretCache
+        """
+        encryption_key = os.environ.get(SOPS_CACHE_KEY_ENV)
+        if not encryption_key:
+            return cls()
+        return cls(
+            cache_dir=Path(os.environ.get(SOPS_CACHE_DIR_ENV, DEFAULT_SOPS_CACHE_DIR)),
+            encryption_key=encryption_key.encode("utf8"),
+        )
+
+    def decrypt(self, sops_file: Path) -> bytes:
+        """Return the decrypted contents of a SOPS file, decrypting only on a miss.
+
+        :param sops_file: The absolute path to the encrypted file.
+        :type sops_file: Path
+
+        :returns: The plaintext output of `sops --decrypt`.
+
+        :rtype: bytes
+        """
+        ciphertext = sops_file.read_bytes()
+        ciphertext_digest = hashlib.sha256(ciphertext).hexdigest()
+        with self._lock:
+            if ciphertext_digest in self._memo:
+                self.stats.hits += 1
+                return self._memo[ciphertext_digest]
+        plaintext = self._read_disk_entry(sops_file, ciphertext_digest)
+        if plaintext is not None:
+            with self._lock:
+                self.stats.disk_hits += 1
+                self._memo[ciphertext_digest] = plaintext
+            return plaintext
+        with self._lock:
+            self.stats.misses += 1
+        plaintext = decrypt_sops_file(sops_file, ciphertext)
+        if plaintext is None:
+            # Don't cache failures so that fixing credentials doesn't require a purge.
+            return b""
+        with self._lock:
+            self._memo[ciphertext_digest] = plaintext
+        self._write_disk_entry(sops_file, ciphertext_digest, plaintext)
+        return plaintext
+
+    def clear(self) -> None:
+        """Drop all in-process entries and reset the hit/miss counters."""
+        with self._lock:
+            self._memo.clear()
+            self.stats = SopsCacheStats()
+
+    def _entry_prefix(self, sops_file: Path) -> str:
+        return hashlib.sha256(str(sops_file).encode("utf8")).hexdigest()[:16]
+
+    def _read_disk_entry(
+        self, sops_file: Path, ciphertext_digest: str
+    ) -> Optional[bytes]:
+        if not (self.cache_dir and self._fernet):
+            return None
+        entry = self.cache_dir.joinpath(
+            f"{self._entry_prefix(sops_file)}-{ciphertext_digest}.bin"
+        )
+        try:
+            return self._fernet.decrypt(entry.read_bytes())
+        except (OSError, InvalidToken):
+            return None
+
+    def _write_disk_entry(
+        self, sops_file: Path, ciphertext_digest: str, plaintext: bytes
+    ) -> None:
+        if not (self.cache_dir and self._fernet):
+            return
+        prefix = self._entry_prefix(sops_file)
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Evict entries written for earlier revisions of the same file.
+        for stale_entry in self.cache_dir.glob(f"{prefix}-*.bin"):
+            stale_entry.unlink(missing_ok=True)
+        entry = self.cache_dir.joinpath(f"{prefix}-{ciphertext_digest}.bin")
+        entry.write_bytes(self._fernet.encrypt(plaintext))
+        entry.chmod(0o600)
+
+
+def decrypt_sops_file(
+    sops_file: Path,
+    ciphertext: Optional[bytes] = None,
+    backend: Optional[str] = None,
+) -> Optional[bytes]:
+    """Decrypt a SOPS file, bypassing the cache.
+
+    :param sops_file: The absolute path to the encrypted file.
+    :type sops_file: Path
+
+    :param ciphertext: The contents of the file if they have already been read.
+    :type ciphertext: Optional[bytes]
+
+    :param backend: Either `native` to decrypt in process, with the `sops` binary as a
+        fallback, or `subprocess` to only use the binary.  Defaults to the value of
+        the `BRIDGE_SOPS_BACKEND` environment variable, or `native` if that is unset.
+    :type backend: Optional[str]
+
+    :returns: The plaintext contents of the file, or None if decryption failed.
+
+    :rtype: Optional[bytes]
+    """
+    backend = backend or os.environ.get(SOPS_BACKEND_ENV, "native")
+    if backend == "native":
+        try:
+            return decrypt_document(sops_file, ciphertext)
+        except SopsEngineError:
+            pass
+    decrypted = subprocess.run(
+        [SOPS_BINARY, "--decrypt", sops_file],
         capture_output=True,
     )
-    return yaml.safe_load(yaml_data.stdout)
+    if decrypted.returncode != 0:
+        return None
+    return decrypted.stdout
+
+
+secret_cache = DecryptedSecretCache.from_env()
+
+
+def _decrypt(sops_file: Path) -> bytes:
+    return secret_cache.decrypt(Path(__file__).parent.joinpath(sops_file))
+
+
+def cache_stats() -> SopsCacheStats:
+    """Report how many secret reads were served from cache versus decrypted.
+
+    :returns: The hit and miss counters for the process-wide secret cache.
+
+    :rtype: SopsCacheStats
+    """
+    return secret_cache.stats
+
+
+def prefetch_secrets(
+    sops_files: Iterable[Path], max_workers: int = DEFAULT_PREFETCH_WORKERS
+) -> None:
+    """Decrypt a set of SOPS files concurrently to warm the secret cache.
+
+    Each decryption is an independent `sops` process (and KMS round trip), so running
+    them on a thread pool bounds the startup cost of a program by its slowest file
+    rather than the sum of all of them.  Subsequent calls to the `read_*_secrets`
+    functions for these files are then served from the cache.
+
+    :param sops_files: Paths to the encrypted files, relative to the secrets directory.
+    :type sops_files: Iterable[Path]
+
+    :param max_workers: The upper bound on concurrently running `sops` processes.
+    :type max_workers: int
+    """
+    unique_files = list(dict.fromkeys(Path(sops_file) for sops_file in sops_files))
+    if not unique_files:
+        return
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(unique_files)),
+        thread_name_prefix="sops-prefetch",
+    ) as executor:
+        # Consume the iterator so that any exception is raised to the caller.
+        list(executor.map(_decrypt, unique_files))
+
+
+def read_yaml_secrets(sops_file: Path) -> dict[str, Any]:
+    return yaml.safe_load(_decrypt(sops_file))
 
 
 def read_json_secrets(sops_file: Path) -> dict[str, Any]:
-    json_data = subprocess.run(
-        [SOPS_BINARY, "--decrypt", Path(__file__).parent.joinpath(sops_file)],
-        capture_output=True,
-    )
-    return json.loads(json_data.stdout.decode("utf8"))
+    return json.loads(_decrypt(sops_file).decode("utf8"))
 
 
 def set_env_secrets(sops_file: Path) -> None:
-    env_data = subprocess.run(
-        [SOPS_BINARY, "--decrypt", Path(__file__).parent.joinpath(sops_file)],
-        capture_output=True,
-    )
-    for line in env_data.stdout.decode("utf8").split("\n"):
+    for line in _decrypt(sops_file).decode("utf8").split("\n"):
         if "=" in line:
             env_key, env_value = line.split("=", maxsplit=1)
             os.environ[env_key] = env_value
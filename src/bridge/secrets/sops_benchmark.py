@@ -0,0 +1,114 @@
+"""Compare the `sops` binary against the in-process decryption engine.
+
+Usage: python -m bridge.secrets.sops_benchmark [--iterations N] [PATH ...]
+
+Each file is decrypted with the subprocess backend, then with the native engine from
+a cold data key cache (paying for the KMS/PGP unwrap) and finally with a warm data key
+cache.  Timings are the mean wall clock time per decryption in milliseconds.  Both
+backends bypass the content cache in `bridge.secrets.sops`.
+"""
+import argparse
+import time
+from pathlib import Path
+from statistics import mean
+from typing import Callable, Optional
+
+from bridge.secrets.sops import decrypt_sops_file
+from bridge.secrets.sops_engine import (
+    NATIVE_FORMATS,
+    SopsEngineError,
+    clear_data_key_cache,
+    decrypt_document,
+)
+
+SECRETS_DIR = Path(__file__).parent
+MILLISECONDS = 1000
+
+
+def _time_call(func: Callable[[], Optional[bytes]], iterations: int) -> Optional[float]:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        try:
+            decrypted = func()
+        except (OSError, SopsEngineError):
+            return None
+        timings.append(time.perf_counter() - start)
+        if decrypted is None:
+            return None
+    return mean(timings) * MILLISECONDS
+
+
+def _format_timing(timing: Optional[float]) -> str:
+    return "failed" if timing is None else f"{timing:.1f}"
+
+
+def _display_name(sops_file: Path) -> str:
+    if sops_file.resolve().is_relative_to(SECRETS_DIR):
+        return str(sops_file.resolve().relative_to(SECRETS_DIR))
+    return str(sops_file)
+
+
+def benchmark_file(sops_file: Path, iterations: int) -> dict[str, Optional[float]]:
+    """Time each decryption path for a single file.
+
+    :param sops_file: The encrypted file to decrypt.
+    :type sops_file: Path
+
+    :param iterations: How many times to decrypt the file with each backend.
+    :type iterations: int
+
+    :returns: Mean milliseconds per decryption for the `subprocess`, `native_cold` and
+              `native_warm` paths, or None where that path failed.
+
+    :rtype: Dict[str, Optional[float]]
+    """
+
+    def _native_cold() -> bytes:  # noqa: WPS430
+        clear_data_key_cache()
+        return decrypt_document(sops_file)
+
+    return {
+        "subprocess": _time_call(
+            lambda: decrypt_sops_file(sops_file, backend="subprocess"), iterations
+        ),
+        "native_cold": _time_call(_native_cold, iterations),
+        "native_warm": _time_call(lambda: decrypt_document(sops_file), iterations),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=3)
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="Files to benchmark. Defaults to all YAML/JSON files in bridge/secrets.",
+    )
+    args = parser.parse_args()
+    sops_files = args.paths or sorted(
+        secrets_file
+        for secrets_file in SECRETS_DIR.rglob("*")
+        if secrets_file.suffix in NATIVE_FORMATS and secrets_file.name != ".sops.yaml"
+    )
+    totals: dict[str, float] = {"subprocess": 0, "native_cold": 0, "native_warm": 0}
+    print(f"{'file':<55} {'subprocess':>11} {'native_cold':>12} {'native_warm':>12}")
+    for sops_file in sops_files:
+        timings = benchmark_file(sops_file, args.iterations)
+        for backend, timing in timings.items():
+            totals[backend] += timing or 0
+        print(
+            f"{_display_name(sops_file):<55} "
+            f"{_format_timing(timings['subprocess']):>11} "
+            f"{_format_timing(timings['native_cold']):>12} "
+            f"{_format_timing(timings['native_warm']):>12}"
+        )
+    print(
+        f"{'total (ms)':<55} {totals['subprocess']:>11.1f} "
+        f"{totals['native_cold']:>12.1f} {totals['native_warm']:>12.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
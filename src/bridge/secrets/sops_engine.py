@@ -0,0 +1,283 @@
+"""In-process decryption of SOPS encrypted YAML and JSON documents.
+
+This avoids the fork/exec of the `sops` binary for every read by parsing the SOPS
+metadata directly, unwrapping the file's data key with one of its master keys (AWS KMS,
+age or PGP), and decrypting each value with AES-GCM.  Unwrapped data keys are cached
+for the life of the process so that subsequent reads of any file encrypted with the
+same data key skip the KMS/PGP round trip entirely.
+
+The message authentication code stored in the file is verified after decryption.  Any
+document that can't be handled natively (dotenv/INI/binary formats, YAML with
+comments, Shamir key groups, missing credentials) raises `SopsEngineError` so that the
+caller can fall back to the `sops` binary.
+"""
+import base64
+import hashlib
+import json
+import os
+import re
+import subprocess
+import threading
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import boto3
+import yaml
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+ENCRYPTED_VALUE_PATTERN = re.compile(
+    r"^ENC\[AES256_GCM,data:(?P<data>[^,]*),iv:(?P<iv>[^,]+),"
+    r"tag:(?P<tag>[^,]+),type:(?P<type>[^\]]+)\]$"
+)
+NATIVE_FORMATS = {".yaml": "yaml", ".yml": "yaml", ".json": "json"}
+SopsTree = Union[dict[str, Any], list[Any], str, int, float, bool, None]
+
+
+class SopsEngineError(Exception):
+    """Raised when a document can't be decrypted without the `sops` binary."""
+
+
+_data_key_cache: dict[str, bytes] = {}
+_data_key_lock = threading.Lock()
+
+
+def _kms_data_key(master_key: dict[str, Any]) -> bytes:
+    session = boto3.session.Session(profile_name=master_key.get("aws_profile") or None)
+    kms_client = session.client("kms", region_name=master_key["arn"].split(":")[3])
+    response = kms_client.decrypt(
+        CiphertextBlob=base64.b64decode(master_key["enc"]),
+        EncryptionContext=master_key.get("context") or {},
+    )
+    return response["Plaintext"]
+
+
+def _age_data_key(master_key: dict[str, Any]) -> bytes:
+    try:
+        import pyrage  # noqa: WPS433
+    except ImportError as import_error:
+        raise SopsEngineError("pyrage is required for age keys") from import_error
+    identity_text = os.environ.get("SOPS_AGE_KEY", "")
+    key_file = os.environ.get("SOPS_AGE_KEY_FILE")
+    if key_file:
+        identity_text += "\n" + Path(key_file).read_text()
+    identities = [
+        pyrage.x25519.Identity.from_str(line.strip())
+        for line in identity_text.splitlines()
+        if line.strip().startswith("AGE-SECRET-KEY-")
+    ]
+    if not identities:
+        raise SopsEngineError("No age identities available")
+    return pyrage.decrypt(master_key["enc"].encode("utf8"), identities)
+
+
+def _pgp_data_key(master_key: dict[str, Any]) -> bytes:
+    gpg_result = subprocess.run(
+        ["gpg", "--quiet", "--batch", "--decrypt"],
+        input=master_key["enc"].encode("utf8"),
+        capture_output=True,
+    )
+    if gpg_result.returncode != 0:
+        raise SopsEngineError(gpg_result.stderr.decode("utf8", errors="replace"))
+    return gpg_result.stdout
+
+
+MASTER_KEY_UNWRAPPERS: dict[str, Callable[[dict[str, Any]], bytes]] = {
+    "kms": _kms_data_key,
+    "age": _age_data_key,
+    "pgp": _pgp_data_key,
+}
+
+
+def unwrap_data_key(metadata: dict[str, Any]) -> bytes:
+    """Retrieve the plaintext data key for a document, using the process cache.
+
+    Each master key type is attempted in turn (KMS first, since that is what is
+    available in CI and production) until one of them succeeds.
+
+    :param metadata: The `sops` section of the encrypted document.
+    :type metadata: Dict[str, Any]
+
+    :raises SopsEngineError: If none of the master keys could be used.
+
+    :returns: The 32 byte AES data key.
+
+    :rtype: bytes
+    """
+    if metadata.get("key_groups") or metadata.get("shamir_threshold"):
+        raise SopsEngineError("Shamir key groups are not supported")
+    master_keys = [
+        (key_type, master_key)
+        for key_type in MASTER_KEY_UNWRAPPERS
+        for master_key in metadata.get(key_type) or []
+    ]
+    cache_keys = [
+        hashlib.sha256(master_key["enc"].encode("utf8")).hexdigest()
+        for _, master_key in master_keys
+    ]
+    with _data_key_lock:
+        for cache_key in cache_keys:
+            if cache_key in _data_key_cache:
+                return _data_key_cache[cache_key]
+    errors = []
+    for (key_type, master_key), cache_key in zip(master_keys, cache_keys):
+        try:
+            data_key = MASTER_KEY_UNWRAPPERS[key_type](master_key)
+        except Exception as unwrap_error:  # noqa: B902, WPS424
+            errors.append(f"{key_type}: {unwrap_error}")
+            continue
+        with _data_key_lock:
+            _data_key_cache[cache_key] = data_key
+        return data_key
+    raise SopsEngineError(f"Unable to unwrap the data key. {errors}")
+
+
+def decrypt_value(ciphertext: str, data_key: bytes, additional_data: str) -> Any:
+    """Decrypt a single `ENC[AES256_GCM,...]` value.
+
+    :param ciphertext: The encrypted value as stored in the document.
+    :type ciphertext: str
+
+    :param data_key: The unwrapped data key for the document.
+    :type data_key: bytes
+
+    :param additional_data: The authenticated data for the value, which is the path
+        to it in the document joined and terminated by colons.  e.g. `foo:bar:`
+    :type additional_data: str
+
+    :raises SopsEngineError: If the value is malformed or fails authentication.
+
+    :returns: The decrypted value converted to its original type.
+
+    :rtype: Any
+    """
+    if ciphertext == "":
+        return ""
+    value_match = ENCRYPTED_VALUE_PATTERN.match(ciphertext)
+    if not value_match:
+        raise SopsEngineError("Value is not in the SOPS encrypted format")
+    encrypted_data = base64.b64decode(value_match.group("data"))
+    try:
+        plaintext = AESGCM(data_key).decrypt(
+            base64.b64decode(value_match.group("iv")),
+            encrypted_data + base64.b64decode(value_match.group("tag")),
+            additional_data.encode("utf8"),
+        )
+    except InvalidTag as tag_error:
+        message = f"Authentication failed for {additional_data}"
+        raise SopsEngineError(message) from tag_error
+    value_type = value_match.group("type")
+    if value_type == "bytes":
+        return plaintext
+    decoded = plaintext.decode("utf8")
+    if value_type == "int":
+        return int(decoded)
+    if value_type == "float":
+        return float(decoded)
+    if value_type == "bool":
+        return decoded.lower() == "true"
+    return decoded
+
+
+def _should_encrypt(path: list[str], metadata: dict[str, Any]) -> bool:
+    if metadata.get("unencrypted_suffix"):
+        return not any(key.endswith(metadata["unencrypted_suffix"]) for key in path)
+    if metadata.get("encrypted_suffix"):
+        return any(key.endswith(metadata["encrypted_suffix"]) for key in path)
+    if metadata.get("unencrypted_regex"):
+        return not any(re.search(metadata["unencrypted_regex"], key) for key in path)
+    if metadata.get("encrypted_regex"):
+        return any(re.search(metadata["encrypted_regex"], key) for key in path)
+    return True
+
+
+def _mac_bytes(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, bool):
+        return str(value).encode("utf8")
+    if isinstance(value, float):
+        # Match Go's strconv.FormatFloat(value, 'f', -1, 64) as used by SOPS.
+        formatted = format(Decimal(repr(value)), "f")
+        if "." in formatted:
+            formatted = formatted.rstrip("0").rstrip(".")
+        return formatted.encode("utf8")
+    return str(value).encode("utf8")
+
+
+class _TreeDecryptor:
+    def __init__(self, data_key: bytes, metadata: dict[str, Any]):
+        self.data_key = data_key
+        self.metadata = metadata
+        self.mac_only_encrypted = bool(metadata.get("mac_only_encrypted"))
+        self.digest = hashlib.sha512()
+
+    def walk(self, tree_node: SopsTree, path: list[str]) -> SopsTree:
+        if isinstance(tree_node, dict):
+            return {
+                node_key: self.walk(node_value, [*path, str(node_key)])
+                for node_key, node_value in tree_node.items()
+            }
+        if isinstance(tree_node, list):
+            return [self.walk(list_item, path) for list_item in tree_node]
+        encrypted = _should_encrypt(path, self.metadata)
+        if encrypted:
+            if not isinstance(tree_node, str):
+                raise SopsEngineError(f"Expected an encrypted string at {path}")
+            tree_node = decrypt_value(tree_node, self.data_key, ":".join(path) + ":")
+        if encrypted or not self.mac_only_encrypted:
+            self.digest.update(_mac_bytes(tree_node))
+        return tree_node
+
+    def verify_mac(self) -> None:
+        stored_mac = decrypt_value(
+            self.metadata["mac"], self.data_key, self.metadata["lastmodified"]
+        )
+        if stored_mac != self.digest.hexdigest().upper():
+            raise SopsEngineError("MAC mismatch, the document may have been modified")
+
+
+def decrypt_document(sops_file: Path, ciphertext: Optional[bytes] = None) -> bytes:
+    """Decrypt a SOPS YAML or JSON document without invoking the `sops` binary.
+
+    :param sops_file: The path to the encrypted document.
+    :type sops_file: Path
+
+    :param ciphertext: The contents of the document if they have already been read.
+    :type ciphertext: Optional[bytes]
+
+    :raises SopsEngineError: If the document can't be handled natively.
+
+    :returns: The plaintext document serialized in the same format as the source.
+
+    :rtype: bytes
+    """
+    document_format = NATIVE_FORMATS.get(sops_file.suffix)
+    if document_format is None:
+        raise SopsEngineError(f"Unsupported format for {sops_file.name}")
+    ciphertext = ciphertext if ciphertext is not None else sops_file.read_bytes()
+    if document_format == "yaml":
+        if re.search(rb"^\s*#ENC\[", ciphertext, re.MULTILINE):
+            # Comments are part of the MAC but are dropped by the YAML parser.
+            raise SopsEngineError("Encrypted YAML comments are not supported")
+        document = yaml.safe_load(ciphertext)
+    else:
+        document = json.loads(ciphertext)
+    if not isinstance(document, dict) or "sops" not in document:
+        raise SopsEngineError(f"{sops_file.name} has no SOPS metadata")
+    metadata = document.pop("sops")
+    decryptor = _TreeDecryptor(unwrap_data_key(metadata), metadata)
+    plaintext_document = decryptor.walk(document, [])
+    decryptor.verify_mac()
+    if document_format == "json":
+        return json.dumps(plaintext_document, indent=4).encode("utf8")
+    return yaml.safe_dump(
+        plaintext_document, default_flow_style=False, sort_keys=False
+    ).encode("utf8")
+
+
+def clear_data_key_cache() -> None:
+    """Forget all unwrapped data keys held by this process."""
+    with _data_key_lock:
+        _data_key_cache.clear()
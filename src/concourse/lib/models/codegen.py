@@ -0,0 +1,122 @@
+"""Generate the runtime pipeline models from the documented models.
+
+`pipeline_docs.py` is the output of datamodel-codegen for the Concourse pipeline schema.
+Almost all of its size is the documentation attached to each field, which every
+pipeline script would otherwise parse and keep in memory when building its models.
+This strips the field descriptions and class docstrings, leaving the same classes,
+fields, types, defaults and aliases, and writes the result to `pipeline.py`.  It also
+drops postponed evaluation of annotations, which saves pydantic from compiling each
+annotation from a string while building the classes.
+
+To update the models:
+    datamodel-codegen --input concourse_pipeline_schema.json \\
+        --output src/concourse/lib/models/pipeline_docs.py
+    python -m concourse.lib.models.codegen
+
+black and isort, which format the output, are development dependencies, so they are
+only imported when generating the models.
+"""
+import argparse
+import ast
+from pathlib import Path
+
+MODELS_DIR = Path(__file__).parent
+DOCS_MODULE = MODELS_DIR.joinpath("pipeline_docs.py")
+RUNTIME_MODULE = MODELS_DIR.joinpath("pipeline.py")
+RUNTIME_HEADER = (
+    "# generated by concourse.lib.models.codegen from pipeline_docs.py, do not edit.\n"
+    "# The documentation for these models is in pipeline_docs.py\n\n"
+)
+
+
+class _StripDocumentation(ast.NodeTransformer):
+    """Remove descriptions and docstrings, and evaluate annotations eagerly.
+
+    Postponed annotations are parsed and evaluated by pydantic for every field when
+    the classes are built, so only annotations which reference a class that is not
+    defined yet are kept as strings, to be resolved by `update_forward_refs`.
+    """
+
+    def __init__(self, class_names: set[str]):
+        self.pending_classes = set(class_names)
+
+    def visit_Module(self, node: ast.Module) -> ast.Module:  # noqa: N802
+        node.body = [
+            statement
+            for statement in node.body
+            if not (
+                isinstance(statement, ast.ImportFrom)
+                and statement.module == "__future__"
+            )
+        ]
+        self.generic_visit(node)
+        return node
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> ast.AnnAssign:  # noqa: N802
+        self.generic_visit(node)
+        referenced_names = {
+            name.id for name in ast.walk(node.annotation) if isinstance(name, ast.Name)
+        }
+        if referenced_names & self.pending_classes:
+            node.annotation = ast.Constant(ast.unparse(node.annotation))
+        return node
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.ClassDef:  # noqa: N802
+        self.generic_visit(node)
+        self.pending_classes.discard(node.name)
+        if ast.get_docstring(node) is not None:
+            node.body = node.body[1:] or [ast.Pass()]
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.expr:  # noqa: N802
+        self.generic_visit(node)
+        if not (isinstance(node.func, ast.Name) and node.func.id == "Field"):
+            return node
+        node.keywords = [
+            keyword for keyword in node.keywords if keyword.arg != "description"
+        ]
+        if len(node.args) == 1 and not node.keywords:
+            # Field(None) is the same as a plain default of None.
+            return node.args[0]
+        return node
+
+
+def runtime_source(docs_source: str) -> str:
+    """Remove the documentation from the source of the documented models.
+
+    :param docs_source: The source of the module generated by datamodel-codegen.
+    :type docs_source: str
+
+    :returns: The formatted source of the runtime models.
+
+    :rtype: str
+    """
+    import black  # noqa: WPS433
+    import isort  # noqa: WPS433
+
+    docs_module = ast.parse(docs_source)
+    class_names = {
+        statement.name
+        for statement in docs_module.body
+        if isinstance(statement, ast.ClassDef)
+    }
+    module = _StripDocumentation(class_names).visit(docs_module)
+    return black.format_str(
+        isort.code(
+            RUNTIME_HEADER + ast.unparse(ast.fix_missing_locations(module)),
+            profile="black",
+        ),
+        mode=black.Mode(),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs-module", type=Path, default=DOCS_MODULE)
+    parser.add_argument("--output", type=Path, default=RUNTIME_MODULE)
+    args = parser.parse_args()
+    args.output.write_text(runtime_source(args.docs_module.read_text()))
+
+
+if __name__ == "__main__":
+    main()
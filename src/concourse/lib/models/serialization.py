@@ -0,0 +1,141 @@
+"""Serialize pipeline models to the JSON or YAML documents that Concourse consumes.
+
+`BaseModel.json()` copies every model into dictionaries before encoding, emits a `null`
+for every unset field and ignores aliases such as `try` unless told otherwise.  These
+functions walk the model tree once, skipping fields that are None and using field
+aliases, and write the encoded document to any number of file handles without
+serializing the pipeline again for each one.
+"""
+import json
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Literal, Optional, TextIO
+
+import yaml
+from pydantic import BaseModel
+
+try:
+    from yaml import CSafeDumper as SafeDumper  # noqa: WPS433
+except ImportError:
+    from yaml import SafeDumper  # type: ignore # noqa: WPS433, WPS440
+
+OutputFormat = Literal["json", "yaml"]
+
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+# Maps a model class to the name each of its attributes is serialized with.
+_field_aliases: dict[type, dict[str, str]] = {}
+
+
+def _aliases(model_class: type[BaseModel]) -> dict[str, str]:
+    try:
+        return _field_aliases[model_class]
+    except KeyError:
+        _field_aliases[model_class] = {
+            field_name: model_field.alias
+            for field_name, model_field in model_class.__fields__.items()
+        }
+        return _field_aliases[model_class]
+
+
+def _model_primitives(model: BaseModel) -> Any:
+    if "__root__" in model.__fields__:
+        return to_primitives(model.__root__)
+    aliases = _aliases(type(model))
+    return {
+        aliases.get(field_name, field_name): to_primitives(field_value)
+        for field_name, field_value in model.__dict__.items()
+        if field_value is not None
+    }
+
+
+def to_primitives(value: Any) -> Any:  # noqa: WPS212, WPS231
+    """Convert a model tree into dictionaries, lists and scalars.
+
+    :param value: A pipeline model, or a value of one of its fields.
+    :type value: Any
+
+    :returns: The JSON compatible representation of the value, omitting None fields.
+
+    :rtype: Any
+    """
+    # Exact type checks first, since scalars, lists and dicts make up most of the tree.
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return value
+    if value_type is list:
+        return [to_primitives(item) for item in value]
+    if value_type is dict:
+        return {str(key): to_primitives(item) for key, item in value.items()}
+    if isinstance(value, BaseModel):
+        return _model_primitives(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, str):
+        # Constrained strings such as Identifier are str subclasses, which the YAML
+        # dumper would otherwise tag with their Python type.
+        return str(value)
+    if isinstance(value, (list, tuple, set)):
+        return [to_primitives(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): to_primitives(item) for key, item in value.items()}
+    if isinstance(value, PurePath):
+        return str(value)
+    return value
+
+
+def serialize_pipeline(
+    pipeline: BaseModel,
+    output_format: OutputFormat = "json",
+    indent: Optional[int] = 2,
+) -> str:
+    """Render a pipeline as the document that Concourse consumes.
+
+    :param pipeline: The pipeline, or any other pipeline model, to serialize.
+    :type pipeline: BaseModel
+
+    :param output_format: Either `json` or `yaml`.
+    :type output_format: str
+
+    :param indent: The indentation of JSON output.  None produces compact JSON, which
+        is encoded several times faster.
+    :type indent: Optional[int]
+
+    :returns: The pipeline definition.
+
+    :rtype: str
+    """
+    pipeline_document = to_primitives(pipeline)
+    if output_format == "yaml":
+        return yaml.dump(
+            pipeline_document,
+            Dumper=SafeDumper,
+            sort_keys=False,
+            default_flow_style=False,
+        )
+    return json.dumps(pipeline_document, indent=indent)
+
+
+def dump_pipeline(
+    pipeline: BaseModel,
+    *handles: TextIO,
+    output_format: OutputFormat = "json",
+    indent: Optional[int] = 2,
+) -> None:
+    """Encode a pipeline once and write the document to each of the file handles.
+
+    :param pipeline: The pipeline, or any other pipeline model, to serialize.
+    :type pipeline: BaseModel
+
+    :param handles: The file handles to write the document to.  e.g. an open
+        definition.json and sys.stdout
+    :type handles: TextIO
+
+    :param output_format: Either `json` or `yaml`.
+    :type output_format: str
+
+    :param indent: The indentation of JSON output.  None produces compact JSON.
+    :type indent: Optional[int]
+    """
+    pipeline_definition = serialize_pipeline(pipeline, output_format, indent)
+    for handle in handles:
+        handle.write(pipeline_definition)
@@ -0,0 +1,180 @@
+"""Fetch independent resources in parallel by grouping consecutive `get` steps.
+
+Concourse runs the steps of a plan one after another, so a job that starts with
+several `get` steps waits for each fetch in turn.  Consecutive `get` steps don't
+consume each other's outputs, so they can be wrapped in an `in_parallel` step without
+changing what the job does.  A `get` is kept out of a group if it fetches into the
+same artifact name as an earlier `get` in the group, or if its params refer to files in
+one of their artifacts, so that any ordering between them is preserved.
+
+Apply it to a whole pipeline with `parallelize_pipeline_gets(pipeline)`.
+"""
+from typing import Any, Optional
+
+from concourse.lib.models.pipeline import (
+    DoStep,
+    GetStep,
+    InParallelConfig,
+    InParallelStep,
+    Job,
+    Number,
+    Pipeline,
+    Step,
+)
+from concourse.lib.pipeline_graph import JOB_HOOKS
+
+
+def _param_strings(param_value: Any) -> list[str]:
+    if isinstance(param_value, str):
+        return [param_value]
+    if isinstance(param_value, dict):
+        return [
+            nested for item in param_value.values() for nested in _param_strings(item)
+        ]
+    if isinstance(param_value, (list, tuple)):
+        return [nested for item in param_value for nested in _param_strings(item)]
+    return []
+
+
+def _depends_on(step: GetStep, artifacts: set[str]) -> bool:
+    if str(step.get) in artifacts:
+        return True
+    return any(
+        param_string.startswith(f"{artifact}/")
+        for param_string in _param_strings(step.params or {})
+        for artifact in artifacts
+    )
+
+
+def _group(
+    get_steps: list[GetStep], limit: Optional[int], fail_fast: Optional[bool]
+) -> Step:
+    if len(get_steps) == 1:
+        return get_steps[0]
+    if limit is None and fail_fast is None:
+        return InParallelStep(in_parallel=get_steps)
+    return InParallelStep(
+        in_parallel=InParallelConfig(
+            steps=get_steps,
+            limit=Number(__root__=limit) if limit is not None else None,
+            fail_fast=fail_fast,
+        )
+    )
+
+
+def parallelize_gets(
+    steps: list[Step],
+    limit: Optional[int] = None,
+    fail_fast: Optional[bool] = None,
+    leading_only: bool = False,
+) -> list[Step]:
+    """Group each run of consecutive `get` steps into an `in_parallel` step.
+
+    :param steps: The steps of a plan, or of a `do` step.
+    :type steps: List[Step]
+
+    :param limit: The maximum number of resources to fetch at once.  No limit if None.
+    :type limit: Optional[int]
+
+    :param fail_fast: Abort the other fetches in a group as soon as one fails.
+    :type fail_fast: Optional[bool]
+
+    :param leading_only: Only group the `get` steps at the start of the steps.
+    :type leading_only: bool
+
+    :returns: The steps, with `get` steps grouped.  The original steps are unchanged.
+
+    :rtype: List[Step]
+    """
+    parallelized: list[Step] = []
+    pending: list[GetStep] = []
+    seen_other_step = False
+    for step in steps:
+        if isinstance(step, GetStep) and not (leading_only and seen_other_step):
+            if _depends_on(step, {str(pending_step.get) for pending_step in pending}):
+                parallelized.append(_group(pending, limit, fail_fast))
+                pending = []
+            pending.append(step)
+            continue
+        if pending:
+            parallelized.append(_group(pending, limit, fail_fast))
+            pending = []
+        seen_other_step = True
+        if isinstance(step, DoStep) and not leading_only:
+            step = step.copy(
+                update={"do": parallelize_gets(step.do or [], limit, fail_fast)}
+            )
+        parallelized.append(step)
+    if pending:
+        parallelized.append(_group(pending, limit, fail_fast))
+    return parallelized
+
+
+def parallelize_job_gets(
+    job: Job,
+    limit: Optional[int] = None,
+    fail_fast: Optional[bool] = None,
+    leading_only: bool = False,
+) -> Job:
+    """Group the consecutive `get` steps in a job's plan and hooks.
+
+    :param job: The job to transform.
+    :type job: Job
+
+    :param limit: The maximum number of resources to fetch at once.  No limit if None.
+    :type limit: Optional[int]
+
+    :param fail_fast: Abort the other fetches in a group as soon as one fails.
+    :type fail_fast: Optional[bool]
+
+    :param leading_only: Only group the `get` steps at the start of the plan.
+    :type leading_only: bool
+
+    :returns: A copy of the job with its `get` steps grouped.
+
+    :rtype: Job
+    """
+    updates: dict[str, Any] = {
+        "plan": parallelize_gets(job.plan or [], limit, fail_fast, leading_only)
+    }
+    for hook in JOB_HOOKS:
+        hook_step = getattr(job, hook)
+        if isinstance(hook_step, DoStep):
+            updates[hook] = parallelize_gets(
+                [hook_step], limit, fail_fast, leading_only
+            )[0]
+    return job.copy(update=updates)
+
+
+def parallelize_pipeline_gets(
+    pipeline: Pipeline,
+    limit: Optional[int] = None,
+    fail_fast: Optional[bool] = None,
+    leading_only: bool = False,
+) -> Pipeline:
+    """Group the consecutive `get` steps in every job of a pipeline.
+
+    :param pipeline: The pipeline to transform.
+    :type pipeline: Pipeline
+
+    :param limit: The maximum number of resources to fetch at once.  No limit if None.
+    :type limit: Optional[int]
+
+    :param fail_fast: Abort the other fetches in a group as soon as one fails.
+    :type fail_fast: Optional[bool]
+
+    :param leading_only: Only group the `get` steps at the start of each plan.
+    :type leading_only: bool
+
+    :returns: A copy of the pipeline with the `get` steps of its jobs grouped.
+
+    :rtype: Pipeline
+    """
+    return pipeline.copy(
+        update={
+            "jobs": [
+                parallelize_job_gets(job, limit, fail_fast, leading_only)
+                for job in pipeline.jobs or []
+            ]
+        }
+    )
@@ -0,0 +1,361 @@
+"""Analyze the job graph of a pipeline before it is deployed.
+
+Jobs depend on each other through the `passed` constraints of their `get` steps.  The
+report covers the longest chain of dependent jobs, measured both in jobs and in the
+number of steps that have to run one after another, how many jobs fan in to and out
+of each job, runs of `get` steps that run serially but could be fetched in parallel,
+resources fetched by several jobs, and jobs which nothing triggers.  It is written as
+JSON so that CI can track changes to the shape of a pipeline over time.
+
+Usage:
+    python -m concourse.lib.pipeline_graph MODULE:FUNCTION [ARG ...]
+        [--format {json,text}] [--max-critical-path-steps N]
+
+e.g. python -m concourse.lib.pipeline_graph concourse.pipelines.open_edx.mfe.meta:meta_pipeline
+"""  # noqa: E501
+import argparse
+import importlib
+import json
+import sys
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from concourse.lib.models.pipeline import (
+    DoStep,
+    GetStep,
+    InParallelConfig,
+    InParallelStep,
+    Job,
+    Pipeline,
+    PutStep,
+    Step,
+    TryStep,
+)
+
+JOB_HOOKS = ("on_success", "on_failure", "on_error", "on_abort", "ensure")
+
+
+def parallel_steps(step: InParallelStep) -> list[Step]:
+    if isinstance(step.in_parallel, InParallelConfig):
+        return step.in_parallel.steps or []
+    return step.in_parallel or []
+
+
+def child_steps(step: Step) -> list[Step]:
+    """The steps nested directly inside of a step.
+
+    :param step: A step of a job's plan.
+    :type step: Step
+
+    :returns: The steps run by an `in_parallel`, `do` or `try` step.
+
+    :rtype: List[Step]
+    """
+    if isinstance(step, InParallelStep):
+        return parallel_steps(step)
+    if isinstance(step, DoStep):
+        return step.do or []
+    if isinstance(step, TryStep) and step.try_ is not None:
+        return [step.try_]
+    return []
+
+
+def iter_steps(steps: Iterable[Step]) -> Iterator[Step]:
+    """Walk a list of steps and every step nested inside of them, depth first.
+
+    :param steps: The steps to walk.  e.g. the plan of a job
+    :type steps: Iterable[Step]
+
+    :returns: Each step, followed by the steps nested inside of it.
+
+    :rtype: Iterator[Step]
+    """
+    for step in steps:
+        yield step
+        yield from iter_steps(child_steps(step))
+
+
+def job_steps(job: Job) -> Iterator[Step]:
+    hooks = [getattr(job, hook) for hook in JOB_HOOKS if getattr(job, hook)]
+    return iter_steps([*(job.plan or []), *hooks])
+
+
+def get_resource(step: GetStep) -> str:
+    return str(step.resource or step.get)
+
+
+def serial_depth(steps: Iterable[Step]) -> int:
+    """The number of steps that run one after another when running a list of steps.
+
+    :param steps: The steps, which run in sequence.
+    :type steps: Iterable[Step]
+
+    :returns: The length of the longest sequence of steps, where the steps of an
+              `in_parallel` step only add the depth of the deepest one.
+
+    :rtype: int
+    """
+    depth = 0
+    for step in steps:
+        if isinstance(step, InParallelStep):
+            depth += max(
+                (
+                    serial_depth([parallel_step])
+                    for parallel_step in parallel_steps(step)
+                ),
+                default=0,
+            )
+        elif isinstance(step, (DoStep, TryStep)):
+            depth += serial_depth(child_steps(step))
+        else:
+            depth += 1
+    return depth
+
+
+def serial_get_chains(steps: list[Step]) -> list[list[str]]:
+    """Find runs of consecutive `get` steps, which Concourse fetches one at a time.
+
+    :param steps: The steps of a plan or of a `do` step.
+    :type steps: List[Step]
+
+    :returns: The resources fetched by each run of two or more `get` steps.
+
+    :rtype: List[List[str]]
+    """
+    chains = []
+    chain: list[str] = []
+    for step in [*steps, None]:
+        if isinstance(step, GetStep):
+            chain.append(get_resource(step))
+            continue
+        if len(chain) > 1:
+            chains.append(chain)
+        chain = []
+        if step is not None and not isinstance(step, InParallelStep):
+            for child_step_list in _sequential_children(step):
+                chains.extend(serial_get_chains(child_step_list))
+    return chains
+
+
+def _sequential_children(step: Step) -> list[list[Step]]:
+    if isinstance(step, DoStep):
+        return [step.do or []]
+    if isinstance(step, TryStep) and step.try_ is not None:
+        return [[step.try_]]
+    return []
+
+
+@dataclass
+class SerialGetChain:
+    job: str
+    resources: list[str]
+
+
+@dataclass
+class PipelineReport:
+    jobs: int = 0
+    resources: int = 0
+    critical_path: list[str] = field(default_factory=list)
+    critical_path_steps: int = 0
+    max_parallel_jobs: int = 0
+    job_steps: dict[str, int] = field(default_factory=dict)
+    fan_in: dict[str, int] = field(default_factory=dict)
+    fan_out: dict[str, int] = field(default_factory=dict)
+    serial_get_chains: list[SerialGetChain] = field(default_factory=list)
+    shared_resources: dict[str, list[str]] = field(default_factory=dict)
+    untriggered_jobs: list[str] = field(default_factory=list)
+    unused_resources: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def job_dependencies(pipeline: Pipeline) -> dict[str, set[str]]:
+    """Map each job to the jobs named in the `passed` constraints of its `get` steps.
+
+    :param pipeline: The pipeline to analyze.
+    :type pipeline: Pipeline
+
+    :returns: The upstream jobs of each job, keyed by job name.
+
+    :rtype: Dict[str, Set[str]]
+    """
+    job_names = {str(job.name) for job in pipeline.jobs or []}
+    return {
+        str(job.name): {
+            str(upstream)
+            for step in job_steps(job)
+            if isinstance(step, GetStep)
+            for upstream in step.passed or []
+            if str(upstream) in job_names
+        }
+        for job in pipeline.jobs or []
+    }
+
+
+def _waves(dependencies: dict[str, set[str]]) -> list[list[str]]:
+    remaining = {job: set(upstream) for job, upstream in dependencies.items()}
+    waves = []
+    while remaining:
+        wave = sorted(job for job, upstream in remaining.items() if not upstream)
+        if not wave:
+            # The remaining jobs form a cycle of passed constraints.
+            wave = sorted(remaining)
+        waves.append(wave)
+        for job in wave:
+            remaining.pop(job)
+        for upstream in remaining.values():
+            upstream.difference_update(wave)
+    return waves
+
+
+def _critical_path(
+    dependencies: dict[str, set[str]], step_counts: dict[str, int]
+) -> tuple[list[str], int]:
+    longest: dict[str, tuple[int, list[str]]] = {}
+    for wave in _waves(dependencies):
+        for job in wave:
+            steps, path = max(
+                (
+                    longest[upstream]
+                    for upstream in dependencies[job]
+                    if upstream in longest
+                ),
+                default=(0, []),
+                key=lambda path_length: path_length[0],
+            )
+            longest[job] = (steps + step_counts[job], [*path, job])
+    steps, path = max(
+        longest.values(), default=(0, []), key=lambda path_length: path_length[0]
+    )
+    return path, steps
+
+
+def analyze_pipeline(pipeline: Pipeline) -> PipelineReport:  # noqa: WPS210
+    """Build the job graph of a pipeline and summarize its shape.
+
+    :param pipeline: The pipeline to analyze.
+    :type pipeline: Pipeline
+
+    :returns: The report on the pipeline's job graph.
+
+    :rtype: PipelineReport
+    """
+    jobs = pipeline.jobs or []
+    dependencies = job_dependencies(pipeline)
+    step_counts = {}
+    fetched_by: dict[str, set[str]] = defaultdict(set)
+    used_resources = set()
+    report = PipelineReport(jobs=len(jobs), resources=len(pipeline.resources or []))
+    for job in jobs:
+        job_name = str(job.name)
+        step_counts[job_name] = serial_depth(job.plan or [])
+        triggered = False
+        for step in job_steps(job):
+            if isinstance(step, GetStep):
+                fetched_by[get_resource(step)].add(job_name)
+                used_resources.add(get_resource(step))
+                triggered = triggered or bool(step.trigger)
+            elif isinstance(step, PutStep):
+                used_resources.add(str(step.resource or step.put))
+        if not triggered:
+            report.untriggered_jobs.append(job_name)
+        report.serial_get_chains.extend(
+            SerialGetChain(job=job_name, resources=chain)
+            for chain in serial_get_chains(job.plan or [])
+        )
+    downstream: dict[str, set[str]] = defaultdict(set)
+    for job_name, upstream_jobs in dependencies.items():
+        for upstream in upstream_jobs:
+            downstream[upstream].add(job_name)
+    report.job_steps = step_counts
+    report.fan_in = {job: len(upstream) for job, upstream in dependencies.items()}
+    report.fan_out = {job: len(downstream[job]) for job in dependencies}
+    report.critical_path, report.critical_path_steps = _critical_path(
+        dependencies, step_counts
+    )
+    report.max_parallel_jobs = max(
+        (len(wave) for wave in _waves(dependencies)), default=0
+    )
+    report.shared_resources = {
+        resource: sorted(job_names)
+        for resource, job_names in sorted(fetched_by.items())
+        if len(job_names) > 1
+    }
+    report.unused_resources = sorted(
+        str(resource.name)
+        for resource in pipeline.resources or []
+        if str(resource.name) not in used_resources
+    )
+    return report
+
+
+def load_pipeline(reference: str, args: list[str]) -> Pipeline:
+    """Call the function that builds a pipeline.
+
+    :param reference: The function, as `module:function`.
+    :type reference: str
+
+    :param args: Positional arguments to pass to the function.
+    :type args: List[str]
+
+    :returns: The pipeline returned by the function.
+
+    :rtype: Pipeline
+    """
+    module_name, _, function_name = reference.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)(*args)
+
+
+def _print_text(report: PipelineReport) -> None:
+    print(
+        f"{report.jobs} jobs, {report.resources} resources, up to "
+        f"{report.max_parallel_jobs} jobs can run at once"
+    )
+    print(
+        f"Critical path: {len(report.critical_path)} jobs, "
+        f"{report.critical_path_steps} serial steps: "
+        f"{' -> '.join(report.critical_path)}"
+    )
+    for chain in report.serial_get_chains:
+        print(f"Serial gets in {chain.job}: {', '.join(chain.resources)}")
+    for resource, job_names in report.shared_resources.items():
+        print(f"{resource} is fetched by {len(job_names)} jobs")
+    for job_name in report.untriggered_jobs:
+        print(f"{job_name} has no triggering get step")
+    for resource_name in report.unused_resources:
+        print(f"{resource_name} is not used by any job")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Analyze a pipeline's job graph.")
+    parser.add_argument(
+        "pipeline", help="Function that builds the pipeline, as module:function"
+    )
+    parser.add_argument("args", nargs="*", help="Arguments for the function")
+    parser.add_argument("--format", choices=["json", "text"], default="json")
+    parser.add_argument(
+        "--max-critical-path-steps",
+        type=int,
+        help="Exit with an error if the critical path has more serial steps.",
+    )
+    args = parser.parse_args(argv)
+    report = analyze_pipeline(load_pipeline(args.pipeline, args.args))
+    if args.format == "json":
+        print(json.dumps(report.to_dict(), indent=2, sort_keys=True))
+    else:
+        _print_text(report)
+    if (
+        args.max_critical_path_steps is not None
+        and report.critical_path_steps > args.max_critical_path_steps
+    ):
+        sys.exit(
+            f"The critical path has {report.critical_path_steps} serial steps, more "
+            f"than the limit of {args.max_critical_path_steps}"
+        )
+
+
+if __name__ == "__main__":
+    main()
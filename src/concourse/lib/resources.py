@@ -65,3 +65,35 @@ def pulumi_provisioner(
             "source_dir": project_path,
         },
     )
+
+
+def registry_image(
+    name: Identifier,
+    image_repository: str,
+    image_tag: str = "latest",
+    username: str = "((dockerhub.username))",
+    password: str = "((dockerhub.password))",  # noqa: S107
+) -> Resource:
+    return Resource(
+        name=name,
+        type="registry-image",
+        icon="docker",
+        source={
+            "repository": image_repository,
+            "tag": image_tag,
+            "username": username,
+            "password": password,
+        },
+    )
+
+
+def s3_object(name: Identifier, bucket: str, object_regex: str) -> Resource:
+    return Resource(
+        name=name,
+        type="s3",
+        icon="bucket",
+        source={
+            "bucket": bucket,
+            "regexp": object_regex,
+        },
+    )
@@ -16,6 +16,8 @@ from concourse.lib.models.pipeline import (
     TaskConfig,
     TaskStep,
 )
+from concourse.lib.models.serialization import dump_pipeline
+from concourse.lib.parallelize import parallelize_pipeline_gets
 from concourse.lib.resource_types import (
     packer_build,
     packer_validate,
@@ -183,28 +185,30 @@ def pulumi_job(env_stage: str, previous_env_stage: str = None) -> Job:
 
 
 def concourse_pipeline() -> Pipeline:
-    return Pipeline(
-        resource_types=[
-            packer_validate_type,
-            packer_build_type,
-            pulumi_provisioner_resource_type,
-        ],
-        resources=[
-            concourse_release,
-            concourse_image_code,
-            packer_validate_resource,
-            packer_build_resource,
-            pulumi_deploy,
-        ],
-        jobs=ami_jobs()
-        + [
-            pulumi_job(env_stage, previous_env_stage=previous_env)
-            for env_stage, previous_env in [
-                ("CI", None),
-                ("QA", "CI"),
-                ("Production", "QA"),
-            ]
-        ],
+    return parallelize_pipeline_gets(
+        Pipeline(
+            resource_types=[
+                packer_validate_type,
+                packer_build_type,
+                pulumi_provisioner_resource_type,
+            ],
+            resources=[
+                concourse_release,
+                concourse_image_code,
+                packer_validate_resource,
+                packer_build_resource,
+                pulumi_deploy,
+            ],
+            jobs=ami_jobs()
+            + [
+                pulumi_job(env_stage, previous_env_stage=previous_env)
+                for env_stage, previous_env in [
+                    ("CI", None),
+                    ("QA", "CI"),
+                    ("Production", "QA"),
+                ]
+            ],
+        )
     )
 
 
@@ -212,5 +216,4 @@ if __name__ == "__main__":
     import sys
 
     with open("definition.json", "wt") as definition:
-        definition.write(concourse_pipeline().json(indent=2))
-    sys.stdout.write(concourse_pipeline().json(indent=2))
+        dump_pipeline(concourse_pipeline(), definition, sys.stdout)
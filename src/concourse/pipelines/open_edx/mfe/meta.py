@@ -10,12 +10,20 @@ from concourse.lib.models.pipeline import (
     Output,
     Pipeline,
     Platform,
+    PutStep,
     SetPipelineStep,
     TaskConfig,
     TaskStep,
 )
-from concourse.lib.resources import git_repo
-from concourse.pipelines.open_edx.mfe.pipeline import MFEAppVars, OpenEdxVars
+from concourse.lib.models.serialization import dump_pipeline
+from concourse.lib.resources import git_repo, registry_image
+from concourse.pipelines.open_edx.mfe.pipeline import (
+    MFE_BUILDER_REPOSITORY,
+    MFEAppVars,
+    OpenEdxVars,
+    mfe_builder_tag,
+    pipeline_vars,
+)
 from concourse.pipelines.open_edx.mfe.values import apps, deployments
 
 
@@ -25,6 +33,17 @@ def meta_job(
     open_edx_environments: list[OpenEdxVars],
     mfe_vars: MFEAppVars,
 ) -> Job:
+    wait_for_builder_image = []
+    if mfe_vars.use_builder_image:
+        # Only set the pipeline once the image that it compiles the MFE in exists.
+        image_tag = mfe_builder_tag(mfe_vars.node_major_version)
+        wait_for_builder_image.append(
+            GetStep(
+                get=f"mfe-builder-image-{image_tag}",
+                passed=[f"build-mfe-builder-image-{image_tag}"],
+                params={"skip_download": True},
+            )
+        )
     return Job(
         name=Identifier(f"create-{open_edx_deployment}-{mfe_app_name}-mfe-pipeline"),
         plan=[
@@ -32,6 +51,7 @@ def meta_job(
                 get="mfe-pipeline-definitions",
                 trigger=True,
             ),
+            *wait_for_builder_image,
             TaskStep(
                 task=Identifier(
                     f"generate-{open_edx_deployment}-{mfe_app_name}-mfe-pipeline-file"
@@ -70,8 +90,57 @@ def meta_job(
     )
 
 
+def builder_image_job(node_version: int) -> Job:
+    """Build the image that MFEs are compiled in for a major version of Node.
+
+    A job is generated for each version of Node used by an MFE pipeline, so a new
+    image is built when an app moves to a new major version as well as whenever the
+    Dockerfile changes.  The jobs which set the app pipelines wait for the image to
+    pass this job, so on the first run an app pipeline is set once its image exists.
+
+    :param node_version: The major version of Node to build the image for.
+    :type node_version: int
+
+    :returns: A job which builds the image and pushes it to the registry.
+
+    :rtype: Job
+    """
+    image_tag = mfe_builder_tag(node_version)
+    return Job(
+        name=Identifier(f"build-mfe-builder-image-{image_tag}"),
+        plan=[
+            GetStep(
+                get="mfe-builder-dockerfile",
+                trigger=True,
+            ),
+            TaskStep(
+                task=Identifier("build-mfe-builder-image"),
+                privileged=True,
+                config=TaskConfig(
+                    platform=Platform.linux,
+                    image_resource=AnonymousResource(
+                        type="registry-image",
+                        source={"repository": "concourse/oci-build-task"},
+                    ),
+                    inputs=[Input(name=Identifier("mfe-builder-dockerfile"))],
+                    outputs=[Output(name=Identifier("image"))],
+                    params={
+                        "CONTEXT": "mfe-builder-dockerfile/dockerfiles/mfe-builder",
+                        "BUILD_ARG_NODE_MAJOR_VERSION": str(node_version),
+                    },
+                    run=Command(path="build"),
+                ),
+            ),
+            PutStep(
+                put=f"mfe-builder-image-{image_tag}",
+                params={"image": "image/image.tar"},
+            ),
+        ],
+    )
+
+
 def meta_pipeline() -> Pipeline:
-    combinations = itertools.product(deployments.keys(), apps.keys())
+    combinations = list(itertools.product(deployments.keys(), apps.keys()))
     mfe_definitions = git_repo(
         name=Identifier("mfe-pipeline-definitions"),
         uri="https://github.com/mitodl/ol-infrastructure",
@@ -81,10 +150,40 @@ def meta_pipeline() -> Pipeline:
         "src/concourse/pipelines/open_edx/mfe/",
         "src/concourse/lib/",
     ]
-    pipeline_jobs = [
-        meta_job(deployment, app, deployments[deployment], apps[app])
+    combination_vars = {
+        (deployment, app): pipeline_vars(
+            deployment, app, deployments[deployment], apps[app]
+        )
         for deployment, app in combinations
+    }
+    pipeline_jobs = [
+        meta_job(deployment, app, open_edx_vars, mfe_vars)
+        for (deployment, app), (open_edx_vars, mfe_vars) in combination_vars.items()
+    ]
+    node_versions = sorted(
+        {
+            mfe_vars.node_major_version
+            for _, mfe_vars in combination_vars.values()
+            if mfe_vars.use_builder_image
+        }
+    )
+    builder_dockerfile = git_repo(
+        name=Identifier("mfe-builder-dockerfile"),
+        uri="https://github.com/mitodl/ol-infrastructure",
+        branch="main",
+        paths=["dockerfiles/mfe-builder/"],
+    )
+    builder_images = [
+        registry_image(
+            name=Identifier(f"mfe-builder-image-{mfe_builder_tag(node_version)}"),
+            image_repository=MFE_BUILDER_REPOSITORY,
+            image_tag=mfe_builder_tag(node_version),
+        )
+        for node_version in node_versions
     ]
+    pipeline_jobs.extend(
+        builder_image_job(node_version) for node_version in node_versions
+    )
     pipeline_jobs.append(
         Job(
             name=Identifier("set-mfe-meta-pipeline"),
@@ -124,7 +223,7 @@ def meta_pipeline() -> Pipeline:
         )
     )
     return Pipeline(
-        resources=[mfe_definitions],
+        resources=[mfe_definitions, builder_dockerfile, *builder_images],
         jobs=pipeline_jobs,
     )
 
@@ -133,5 +232,4 @@ if __name__ == "__main__":
     import sys
 
     with open("definition.json", "wt") as definition:
-        definition.write(meta_pipeline().json(indent=2))
-    sys.stdout.write(meta_pipeline().json(indent=2))
+        dump_pipeline(meta_pipeline(), definition, sys.stdout)
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 from concourse.lib.models.pipeline import (
     AnonymousResource,
+    Cache,
     Command,
     GetStep,
     Identifier,
@@ -18,14 +19,28 @@ from concourse.lib.models.pipeline import (
     TaskConfig,
     TaskStep,
 )
+from concourse.lib.models.serialization import dump_pipeline
+from concourse.lib.parallelize import parallelize_pipeline_gets
 from concourse.lib.resource_types import rclone
-from concourse.lib.resources import git_repo
+from concourse.lib.resources import git_repo, s3_object
+
+MFE_BUILDER_REPOSITORY = "mitodl/mfe-builder"
+# MFEs for the maple release of Open edX don't build with newer versions of Node
+MAPLE_NODE_MAJOR_VERSION = 12
 
 
 class MFEAppVars(BaseModel):
     node_major_version: int
     path: str
     repository: str
+    # Compile in the prebuilt builder image, which has the toolchain installed,
+    # instead of installing it in the stock Node image on every build.  The image for
+    # each version of Node is built by the meta pipeline, which only sets the app
+    # pipelines that use it once it has been pushed.
+    use_builder_image: bool = True
+    # Compile the MFE once for each commit and deploy the same bundle to each
+    # environment, injecting the environment's settings when it is deployed.
+    build_once: bool = False
 
 
 class OpenEdxVars(BaseModel):
@@ -75,12 +90,100 @@ def mfe_params(open_edx: OpenEdxVars, mfe: MFEAppVars) -> dict[str, Optional[str
     }
 
 
-def mfe_job(open_edx: OpenEdxVars, mfe: MFEAppVars, previous_job: str = None) -> Job:
+def mfe_builder_tag(node_major_version: int) -> str:
+    return f"node-{node_major_version}"
+
+
+def node_major_version(open_edx_envs: list[OpenEdxVars], mfe: MFEAppVars) -> int:
+    """The major version of Node to compile an MFE with for an Open edX deployment.
+
+    :param open_edx_envs: The environments of the Open edX deployment.
+    :type open_edx_envs: List[OpenEdxVars]
+
+    :param mfe: The MFE to compile.
+    :type mfe: MFEAppVars
+
+    :returns: The major version of Node.
+
+    :rtype: int
+    """
+    if "maple" in open_edx_envs[0].release_name:
+        return MAPLE_NODE_MAJOR_VERSION
+    return mfe.node_major_version
+
+
+def pipeline_vars(
+    deployment: str,
+    app: str,
+    open_edx_envs: list[OpenEdxVars],
+    mfe: MFEAppVars,
+) -> tuple[list[OpenEdxVars], MFEAppVars]:
+    """The settings that the pipeline for an MFE of an Open edX deployment is built from.
+
+    Some MFEs are built from a different branch or fork than the rest of the
+    deployment, which can also change the version of Node they are compiled with.
+
+    :param deployment: The name of the Open edX deployment.  e.g. mitxonline
+    :type deployment: str
+
+    :param app: The name of the MFE.  e.g. learn
+    :type app: str
+
+    :param open_edx_envs: The environments of the Open edX deployment.
+    :type open_edx_envs: List[OpenEdxVars]
+
+    :param mfe: The MFE to build.
+    :type mfe: MFEAppVars
+
+    :returns: Copies of the environments and the MFE with the overrides applied.
+
+    :rtype: Tuple[List[OpenEdxVars], MFEAppVars]
+    """
+    open_edx_envs = [open_edx.copy() for open_edx in open_edx_envs]
+    mfe = mfe.copy()
+    release_name = None
+    if app == "learn" and deployment == "mitxonline":
+        mfe.repository = "https://github.com/mitodl/frontend-app-learning.git"
+        release_name = "open-learning"
+    if app == "authoring":
+        release_name = "master"
+    if release_name:
+        for open_edx in open_edx_envs:
+            open_edx.release_name = release_name
+    mfe.node_major_version = node_major_version(open_edx_envs, mfe)
+    return open_edx_envs, mfe
+
+
+def _image_source(mfe: MFEAppVars) -> dict[str, str]:
+    if mfe.use_builder_image:
+        return {
+            "repository": MFE_BUILDER_REPOSITORY,
+            "tag": mfe_builder_tag(mfe.node_major_version),
+        }
+    return {"repository": "node", "tag": f"{mfe.node_major_version}-bullseye-slim"}
+
+
+def compile_mfe_step(
+    mfe: MFEAppVars, params: dict[str, Optional[str]], package: bool = False
+) -> TaskStep:
+    """Install the dependencies of an MFE and compile it into the compiled-mfe output.
+
+    :param mfe: The MFE to compile.
+    :type mfe: MFEAppVars
+
+    :param params: The configuration of the MFE, which the build inlines into the
+        bundle.
+    :type params: Dict[str, Optional[str]]
+
+    :param package: Also write the compiled MFE to a tarball in the mfe-artifact
+        output, named for the timestamp of the commit it was built from.
+    :type package: bool
+
+    :returns: The task which compiles the MFE.
+
+    :rtype: TaskStep
+    """
     mfe_dir = f"mfe-app-{mfe.path}"
-    clone_git_repo = GetStep(
-        get=f"mfe-app-{mfe.path}",
-        trigger=previous_job is None,
-    )
     branding_overrides = textwrap.dedent(
         """\
         npm install @edx/frontend-component-footer@npm:@mitodl/frontend-component-footer-mitol@latest --legacy-peer-deps
@@ -90,95 +193,346 @@ def mfe_job(open_edx: OpenEdxVars, mfe: MFEAppVars, previous_job: str = None) ->
     # uses v17 and our override plugins use v16
     if mfe.path == "authoring":
         branding_overrides = ""
+    install_toolchain = ""
+    if not mfe.use_builder_image:
+        install_toolchain = textwrap.dedent(
+            """\
+            apt-get update
+            apt-get install -q -y python build-essential git"""
+        )
+    outputs = [Output(name=Identifier("compiled-mfe"), path=f"{mfe_dir}/dist")]
+    package_artifact = ""
+    if package:
+        outputs.append(Output(name=Identifier("mfe-artifact")))
+        package_artifact = (
+            f"tar -czf ../mfe-artifact/mfe-{mfe.path}-"
+            "$(git log -1 --format=%ct).tgz -C dist ."
+        )
+    return TaskStep(
+        task=Identifier("compile-mfe"),
+        config=TaskConfig(
+            platform=Platform.linux,
+            image_resource=AnonymousResource(
+                type="registry-image",
+                source=_image_source(mfe),
+            ),
+            # Keep the npm cache and the installed packages between builds on a
+            # worker so that npm only fetches what has changed.
+            caches=[
+                Cache(path="npm-cache"),
+                Cache(path=f"{mfe_dir}/node_modules"),
+            ],
+            inputs=[Input(name=Identifier(mfe_dir))],
+            outputs=outputs,
+            params=params,
+            run=Command(
+                path="sh",
+                dir=mfe_dir,
+                args=[
+                    "-exc",
+                    textwrap.dedent(
+                        f"""\
+                        export npm_config_cache="$(pwd)/../npm-cache"
+                        {install_toolchain}
+                        npm install --prefer-offline --no-audit
+                        {branding_overrides}
+                        NODE_ENV=production npm run build
+                        {package_artifact}
+                        """
+                    ),
+                ],
+            ),
+        ),
+    )
+
+
+def deploy_mfe_step(open_edx: OpenEdxVars, mfe: MFEAppVars, source: str) -> PutStep:
+    return PutStep(
+        put="mfe-app-bucket",
+        params={
+            "source": source,
+            "destination": [
+                {
+                    "command": "sync",
+                    "dir": f"s3-remote:{open_edx.environment}-edxapp-mfe/{mfe.path}/",
+                }
+            ],
+        },
+    )
+
+
+def mfe_job(open_edx: OpenEdxVars, mfe: MFEAppVars, previous_job: str = None) -> Job:
+    clone_git_repo = GetStep(
+        get=f"mfe-app-{mfe.path}",
+        trigger=previous_job is None,
+    )
     if previous_job:
         clone_git_repo.passed = [previous_job]
     return Job(
         name=Identifier(f"compile-and-deploy-mfe-{mfe.path}-to-{open_edx.environment}"),
         plan=[
             clone_git_repo,
+            compile_mfe_step(mfe, mfe_params(open_edx, mfe)),
+            deploy_mfe_step(open_edx, mfe, "compiled-mfe"),
+        ],
+    )
+
+
+def placeholder(param_name: str) -> str:
+    return f"__MFE_CONFIG_{param_name}__"
+
+
+def build_once_params(
+    open_edx_envs: list[OpenEdxVars], mfe: MFEAppVars
+) -> dict[str, Optional[str]]:
+    """The configuration to compile an MFE with once for all of the environments.
+
+    Settings which are the same in every environment are compiled in as they are.
+    Settings which differ get a placeholder, which each environment replaces with
+    its own value when it deploys the compiled MFE.
+
+    :param open_edx_envs: The environments the compiled MFE is deployed to.
+    :type open_edx_envs: List[OpenEdxVars]
+
+    :param mfe: The MFE to compile.
+    :type mfe: MFEAppVars
+
+    :returns: The configuration to compile the MFE with.
+
+    :rtype: Dict[str, Optional[str]]
+    """
+    env_params = [mfe_params(open_edx, mfe) for open_edx in open_edx_envs]
+    return {
+        param_name: (
+            param_value
+            if all(params[param_name] == param_value for params in env_params)
+            else placeholder(param_name)
+        )
+        for param_name, param_value in env_params[0].items()
+    }
+
+
+# Copies the compiled MFE from the directory in the first argument to the directory in
+# the second argument, replacing the placeholder of each setting named in the remaining
+# arguments with the value of the environment variable of the same name.  Values are
+# escaped for the type of file they are injected into, where the placeholder is inside a
+# string literal or an HTML attribute.
+INJECT_CONFIG_SCRIPT = textwrap.dedent(
+    """\
+    const fs = require("fs");
+    const path = require("path");
+    const [source, destination, ...paramNames] = process.argv.slice(1);
+    const textFile = /\\.(css|html|js|json|map|txt)$/;
+    const jsonString = (value) => JSON.stringify(value).slice(1, -1);
+    const htmlEntities = {
+      "&": "&amp;",
+      "<": "&lt;",
+      ">": "&gt;",
+      '"': "&quot;",
+      "'": "&#39;",
+    };
+    const escapers = {
+      ".html": (value) => value.replace(/[&<>"']/g, (char) => htmlEntities[char]),
+      ".js": (value) => jsonString(value).replace(/['`]/g, "\\\\$&"),
+      ".json": jsonString,
+      ".map": jsonString,
+    };
+    function inject(sourceDir, destinationDir) {
+      fs.mkdirSync(destinationDir, { recursive: true });
+      for (const entry of fs.readdirSync(sourceDir, { withFileTypes: true })) {
+        const sourcePath = path.join(sourceDir, entry.name);
+        const destinationPath = path.join(destinationDir, entry.name);
+        if (entry.isDirectory()) {
+          inject(sourcePath, destinationPath);
+        } else if (!textFile.test(entry.name)) {
+          fs.copyFileSync(sourcePath, destinationPath);
+        } else {
+          const escape = escapers[path.extname(entry.name)] || ((value) => value);
+          let content = fs.readFileSync(sourcePath, "utf8");
+          for (const paramName of paramNames) {
+            content = content
+              .split(`__MFE_CONFIG_${paramName}__`)
+              .join(escape(process.env[paramName] || ""));
+          }
+          const leftover = content.match(/__MFE_CONFIG_[A-Z_]+__/);
+          if (leftover) {
+            throw new Error(`No value for ${leftover[0]} in ${sourcePath}`);
+          }
+          fs.writeFileSync(destinationPath, content);
+        }
+      }
+    }
+    inject(source, destination);
+    """
+)
+
+
+def build_mfe_job(open_edx_envs: list[OpenEdxVars], mfe: MFEAppVars) -> Job:
+    return Job(
+        name=Identifier(f"compile-mfe-{mfe.path}"),
+        plan=[
+            GetStep(get=f"mfe-app-{mfe.path}", trigger=True),
+            compile_mfe_step(mfe, build_once_params(open_edx_envs, mfe), package=True),
+            PutStep(
+                put="mfe-artifact",
+                params={"file": f"mfe-artifact/mfe-{mfe.path}-*.tgz"},
+            ),
+        ],
+    )
+
+
+def deploy_mfe_job(
+    open_edx: OpenEdxVars,
+    mfe: MFEAppVars,
+    placeholder_params: list[str],
+    previous_job: str,
+    trigger: bool = False,
+) -> Job:
+    """Configure an MFE compiled by `build_mfe_job` for an environment and deploy it.
+
+    :param open_edx: The environment to deploy the MFE to.
+    :type open_edx: OpenEdxVars
+
+    :param mfe: The MFE to deploy.
+    :type mfe: MFEAppVars
+
+    :param placeholder_params: The settings which were compiled as placeholders.
+    :type placeholder_params: List[str]
+
+    :param previous_job: The job which compiled or last deployed the artifact.
+    :type previous_job: str
+
+    :param trigger: Deploy each new artifact as soon as it passes the previous job.
+    :type trigger: bool
+
+    :returns: A job which deploys the same artifact as the previous job.
+
+    :rtype: Job
+    """
+    env_params = mfe_params(open_edx, mfe)
+    return Job(
+        name=Identifier(f"deploy-mfe-{mfe.path}-to-{open_edx.environment}"),
+        plan=[
+            GetStep(get="mfe-artifact", passed=[previous_job], trigger=trigger),
             TaskStep(
-                task=Identifier("compile-and-deploy-mfe"),
+                task=Identifier("configure-mfe"),
                 config=TaskConfig(
                     platform=Platform.linux,
                     image_resource=AnonymousResource(
                         type="registry-image",
-                        source={
-                            "repository": "node",
-                            "tag": f"{mfe.node_major_version}-bullseye-slim",
-                        },
+                        source=_image_source(mfe),
                     ),
-                    inputs=[Input(name=Identifier(mfe_dir))],
-                    outputs=[
-                        Output(name=Identifier("compiled-mfe"), path=f"{mfe_dir}/dist")
-                    ],
-                    params=mfe_params(open_edx, mfe),
+                    inputs=[Input(name=Identifier("mfe-artifact"))],
+                    outputs=[Output(name=Identifier("configured-mfe"))],
+                    params={
+                        "INJECT_CONFIG_SCRIPT": INJECT_CONFIG_SCRIPT,
+                        **{
+                            param_name: env_params[param_name]
+                            for param_name in placeholder_params
+                        },
+                    },
                     run=Command(
                         path="sh",
-                        dir=mfe_dir,
                         args=[
                             "-exc",
                             textwrap.dedent(
                                 f"""\
-                                apt-get update
-                                apt-get install -q -y python build-essential
-                                npm install
-                                {branding_overrides}
-                                NODE_ENV=production npm run build
-                                """
+                                mkdir compiled-mfe
+                                tar -xzf mfe-artifact/mfe-{mfe.path}-*.tgz -C compiled-mfe
+                                node -e "$INJECT_CONFIG_SCRIPT" compiled-mfe configured-mfe {" ".join(placeholder_params)}
+                                """  # noqa: E501
                             ),
                         ],
                     ),
                 ),
             ),
-            PutStep(
-                put="mfe-app-bucket",
-                params={
-                    "source": "compiled-mfe",
-                    "destination": [
-                        {
-                            "command": "sync",
-                            "dir": f"s3-remote:{open_edx.environment}-edxapp-mfe/{mfe.path}/",
-                        }
-                    ],
-                },
-            ),
+            deploy_mfe_step(open_edx, mfe, "configured-mfe"),
         ],
     )
 
 
-def mfe_pipeline(open_edx_envs: list[OpenEdxVars], mfe: MFEAppVars) -> Pipeline:
-    jobs_list: list[Job] = []
+def build_once_jobs(open_edx_envs: list[OpenEdxVars], mfe: MFEAppVars) -> list[Job]:
+    """Compile an MFE once for each commit and promote it through the environments.
+
+    :param open_edx_envs: The environments to deploy the MFE to, in order.
+    :type open_edx_envs: List[OpenEdxVars]
+
+    :param mfe: The MFE to compile and deploy.
+    :type mfe: MFEAppVars
+
+    :returns: The job which compiles the MFE, followed by a job for each
+        environment which deploys the artifact that passed the job before it.
+
+    :rtype: List[Job]
+    """
+    placeholder_params = [
+        param_name
+        for param_name, param_value in build_once_params(open_edx_envs, mfe).items()
+        if param_value == placeholder(param_name)
+    ]
+    jobs_list = [build_mfe_job(open_edx_envs, mfe)]
     for edx_env in open_edx_envs:
-        try:
-            prev_job = jobs_list[-1].name
-        except IndexError:
-            prev_job = None
-        jobs_list.append(mfe_job(edx_env, mfe, prev_job))
-    return Pipeline(
-        resource_types=[rclone()],
-        resources=[
-            git_repo(
-                name=Identifier(f"mfe-app-{mfe.path}"),
-                uri=mfe.repository,
-                branch=open_edx_envs[0].release_name,
-            ),
-            Resource(
-                name=Identifier("mfe-app-bucket"),
-                type="rclone",
-                source={
-                    "config": textwrap.dedent(
-                        """\
-                    [s3-remote]
-                    type = s3
-                    provider = AWS
-                    env_auth = true
-                    region = us-east-1
-                    """
-                    )
-                },
-            ),
-        ],
-        jobs=jobs_list,
+        jobs_list.append(
+            deploy_mfe_job(
+                edx_env,
+                mfe,
+                placeholder_params,
+                previous_job=jobs_list[-1].name,
+                trigger=len(jobs_list) == 1,
+            )
+        )
+    return jobs_list
+
+
+def mfe_pipeline(open_edx_envs: list[OpenEdxVars], mfe: MFEAppVars) -> Pipeline:
+    resources = [
+        git_repo(
+            name=Identifier(f"mfe-app-{mfe.path}"),
+            uri=mfe.repository,
+            branch=open_edx_envs[0].release_name,
+        ),
+        Resource(
+            name=Identifier("mfe-app-bucket"),
+            type="rclone",
+            source={
+                "config": textwrap.dedent(
+                    """\
+                [s3-remote]
+                type = s3
+                provider = AWS
+                env_auth = true
+                region = us-east-1
+                """
+                )
+            },
+        ),
+    ]
+    if mfe.build_once:
+        resources.append(
+            s3_object(
+                name=Identifier("mfe-artifact"),
+                bucket="ol-eng-artifacts",
+                object_regex=(
+                    f"mfe/{open_edx_envs[0].environment}/{mfe.path}/"
+                    rf"mfe-{mfe.path}-(\d+)\.tgz"
+                ),
+            )
+        )
+        jobs_list = build_once_jobs(open_edx_envs, mfe)
+    else:
+        jobs_list = []
+        for edx_env in open_edx_envs:
+            try:
+                prev_job = jobs_list[-1].name
+            except IndexError:
+                prev_job = None
+            jobs_list.append(mfe_job(edx_env, mfe, prev_job))
+    return parallelize_pipeline_gets(
+        Pipeline(
+            resource_types=[rclone()],
+            resources=resources,
+            jobs=jobs_list,
+        )
     )
 
 
@@ -192,18 +546,9 @@ if __name__ == "__main__":
 
     deployment = sys.argv[1]
     app = sys.argv[2]
-    open_edx_vars = deployments[deployment]
-    mfe_vars = apps[app]
-    if app == "learn" and deployment == "mitxonline":
-        mfe_vars.repository = "https://github.com/mitodl/frontend-app-learning.git"
-        for edx_var in open_edx_vars:
-            edx_var.release_name = "open-learning"
-    if app == "authoring":
-        for edx_var in open_edx_vars:  # noqa: WPS440
-            edx_var.release_name = "master"
-    if "maple" in open_edx_vars[0].release_name:
-        mfe_vars.node_major_version = 12
+    open_edx_vars, mfe_vars = pipeline_vars(
+        deployment, app, deployments[deployment], apps[app]
+    )
     pipeline = mfe_pipeline(open_edx_vars, mfe_vars)
     with open("definition.json", "wt") as definition:
-        definition.write(pipeline.json(indent=2))
-    sys.stdout.write(pipeline.json(indent=2))
+        dump_pipeline(pipeline, definition, sys.stdout)
@@ -9,7 +9,7 @@ from pathlib import Path
 import pulumi_consul as consul
 import pulumi_vault as vault
 import yaml
-from pulumi import Config, Output, StackReference, export
+from pulumi import Config, Output, export
 from pulumi_aws import ec2, get_caller_identity, iam, route53
 from pulumi_consul import Node, Service, ServiceCheckArgs
 
@@ -37,7 +37,7 @@ from ol_infrastructure.lib.aws.ec2_helper import InstanceTypes, default_egress_a
 from ol_infrastructure.lib.aws.iam_helper import IAM_POLICY_VERSION, lint_iam_policy
 from ol_infrastructure.lib.consul import get_consul_provider
 from ol_infrastructure.lib.ol_types import AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 from ol_infrastructure.lib.stack_defaults import defaults
 from ol_infrastructure.lib.vault import setup_vault_provider
 
@@ -49,11 +49,11 @@ if Config("vault_server").get("env_namespace"):
     setup_vault_provider()
 stack_info = parse_stack()
 airbyte_config = Config("airbyte")
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
-policy_stack = StackReference("infrastructure.aws.policies")
-dns_stack = StackReference("infrastructure.aws.dns")
-consul_stack = StackReference(f"infrastructure.consul.data.{stack_info.name}")
-vault_stack = StackReference(f"infrastructure.vault.operations.{stack_info.name}")
+network_stack = stack_reference(f"infrastructure.aws.network.{stack_info.name}")
+policy_stack = stack_reference("infrastructure.aws.policies")
+dns_stack = stack_reference("infrastructure.aws.dns")
+consul_stack = stack_reference(f"infrastructure.consul.data.{stack_info.name}")
+vault_stack = stack_reference(f"infrastructure.vault.operations.{stack_info.name}")
 
 mitodl_zone_id = dns_stack.require_output("odl_zone_id")
 
@@ -14,7 +14,7 @@ from pathlib import Path
 
 import pulumi_vault as vault
 import yaml
-from pulumi import Config, Output, StackReference
+from pulumi import Config, Output
 from pulumi_aws import acm, autoscaling, ec2, get_caller_identity, iam, lb, route53
 from pulumi_consul import Node, Service, ServiceCheckArgs
 
@@ -35,10 +35,10 @@ from ol_infrastructure.lib.aws.ec2_helper import (
     InstanceTypes,
     default_egress_args,
 )
-from ol_infrastructure.lib.aws.iam_helper import lint_iam_policy
+from ol_infrastructure.lib.aws.iam_helper import lint_iam_policies
 from ol_infrastructure.lib.consul import get_consul_provider
 from ol_infrastructure.lib.ol_types import AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 from ol_infrastructure.lib.stack_defaults import defaults
 from ol_infrastructure.lib.vault import setup_vault_provider
 
@@ -104,11 +104,11 @@ if Config("vault_server").get("env_namespace"):
     setup_vault_provider()
 concourse_config = Config("concourse")
 stack_info = parse_stack()
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
-policy_stack = StackReference("infrastructure.aws.policies")
-dns_stack = StackReference("infrastructure.aws.dns")
-consul_stack = StackReference(f"infrastructure.consul.operations.{stack_info.name}")
-vault_stack = StackReference(f"infrastructure.vault.operations.{stack_info.name}")
+network_stack = stack_reference(f"infrastructure.aws.network.{stack_info.name}")
+policy_stack = stack_reference("infrastructure.aws.policies")
+dns_stack = stack_reference("infrastructure.aws.dns")
+consul_stack = stack_reference(f"infrastructure.consul.operations.{stack_info.name}")
+vault_stack = stack_reference(f"infrastructure.vault.operations.{stack_info.name}")
 mitodl_zone_id = dns_stack.require_output("odl_zone_id")
 
 target_vpc_name = concourse_config.get("target_vpc") or f"{stack_info.env_prefix}_vpc"
@@ -172,21 +172,29 @@ iam_policy_names = set(
     all_iam_policy_names + (concourse_config.get_object("web_iam_polcies") or [])
 )
 
+policy_modules = {
+    iam_policy: importlib.import_module(f"iam_policies.{iam_policy}")
+    for iam_policy in iam_policy_names or []
+}
+lint_iam_policies(
+    {
+        iam_policy: policy_module.policy_definition
+        for iam_policy, policy_module in policy_modules.items()
+    },
+    parliament_config={
+        "PERMISSIONS_MANAGEMENT_ACTIONS": {
+            "ignore_locations": [{"actions": ["ec2:modifysnapshotattributte"]}]
+        },
+        "RESOURCE_STAR": {},
+    },
+).raise_for_findings()
+
 iam_policy_objects = {}
-for iam_policy in iam_policy_names or []:
-    policy_module = importlib.import_module(f"iam_policies.{iam_policy}")
+for iam_policy, policy_module in policy_modules.items():
     iam_policy_object = iam.Policy(
         f"cicd-iam-permissions-policy-{iam_policy}-{stack_info.env_suffix}",
         path=f"/ol-infrastructure/iam/cicd-{stack_info.env_suffix}/",
-        policy=lint_iam_policy(
-            policy_module.policy_definition,
-            parliament_config={
-                "PERMISSIONS_MANAGEMENT_ACTIONS": {
-                    "ignore_locations": [{"actions": ["ec2:modifysnapshotattributte"]}]
-                },
-                "RESOURCE_STAR": {},
-            },
-        ),
+        policy=policy_module.policy_definition,
         name_prefix=f"cicd-policy-{iam_policy}-{stack_info.env_suffix}",
         tags=aws_config.tags,
     )
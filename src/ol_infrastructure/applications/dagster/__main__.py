@@ -16,7 +16,7 @@ from typing import Any, Union
 import pulumi_consul as consul
 import pulumi_vault as vault
 import yaml
-from pulumi import ResourceOptions, StackReference, export
+from pulumi import ResourceOptions, export
 from pulumi.config import get_config
 from pulumi_aws import ec2, get_caller_identity, iam, route53, s3
 from pulumi_consul import Node, Service, ServiceCheckArgs
@@ -32,23 +32,45 @@ from ol_infrastructure.lib.aws.ec2_helper import DiskTypes
 from ol_infrastructure.lib.aws.iam_helper import lint_iam_policy
 from ol_infrastructure.lib.consul import get_consul_provider
 from ol_infrastructure.lib.ol_types import AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import (
+    DNS_STACK,
+    POLICY_STACK,
+    dns_zone_id,
+    iam_policy_arns,
+    network_stack_name,
+    parse_stack,
+    prefetch_stack_references,
+    security_groups,
+    stack_reference,
+    vpc_output,
+)
 from ol_infrastructure.lib.stack_defaults import defaults
 from ol_infrastructure.lib.vault import setup_vault_provider
 
 setup_vault_provider()
 stack_info = parse_stack()
-data_warehouse_stack = StackReference(
+consul_stack_name = f"infrastructure.consul.data.{stack_info.name}"
+prefetch_stack_references(
+    f"infrastructure.aws.data_warehouse.{stack_info.name}",
+    DNS_STACK,
+    network_stack_name(stack_info),
+    POLICY_STACK,
+    f"infrastructure.vault.operations.{stack_info.name}",
+    consul_stack_name,
+    f"applications.edxapp.mitxonline.{stack_info.name}",
+    f"infrastructure.mongodb_atlas.mitxonline.{stack_info.name}",
+    f"infrastructure.mongodb_atlas.mitx.{stack_info.name}",
+    f"applications.edxapp.xpro.{stack_info.name}",
+    f"infrastructure.mongodb_atlas.xpro.{stack_info.name}",
+)
+data_warehouse_stack = stack_reference(
     f"infrastructure.aws.data_warehouse.{stack_info.name}"
 )
-dns_stack = StackReference("infrastructure.aws.dns")
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
-policy_stack = StackReference("infrastructure.aws.policies")
-vault_stack = StackReference(f"infrastructure.vault.operations.{stack_info.name}")
-consul_stack = StackReference(f"infrastructure.consul.data.{stack_info.name}")
-mitodl_zone_id = dns_stack.require_output("odl_zone_id")
-data_vpc = network_stack.require_output("data_vpc")
-operations_vpc = network_stack.require_output("operations_vpc")
+vault_stack = stack_reference(f"infrastructure.vault.operations.{stack_info.name}")
+consul_stack = stack_reference(consul_stack_name)
+mitodl_zone_id = dns_zone_id()
+data_vpc = vpc_output(stack_info, "data_vpc")
+operations_vpc = vpc_output(stack_info, "operations_vpc")
 athena_warehouse = data_warehouse_stack.require_output("athena_data_warehouse")
 dagster_environment = f"data-{stack_info.env_suffix}"
 aws_config = AWSBase(
@@ -56,18 +78,18 @@ aws_config = AWSBase(
 )
 consul_provider = get_consul_provider(stack_info)
 
-consul_security_groups = consul_stack.require_output("security_groups")
+consul_security_groups = security_groups(consul_stack_name)
 aws_account = get_caller_identity()
 
-mitxonline_stack = StackReference(f"applications.edxapp.mitxonline.{stack_info.name}")
-mitxonline_mongodb_stack = StackReference(
+mitxonline_stack = stack_reference(f"applications.edxapp.mitxonline.{stack_info.name}")
+mitxonline_mongodb_stack = stack_reference(
     f"infrastructure.mongodb_atlas.mitxonline.{stack_info.name}"
 )
-residential_mongodb_stack = StackReference(
+residential_mongodb_stack = stack_reference(
     f"infrastructure.mongodb_atlas.mitx.{stack_info.name}"
 )
-xpro_stack = StackReference(f"applications.edxapp.xpro.{stack_info.name}")
-xpro_mongodb_stack = StackReference(
+xpro_stack = stack_reference(f"applications.edxapp.xpro.{stack_info.name}")
+xpro_mongodb_stack = stack_reference(
     f"infrastructure.mongodb_atlas.xpro.{stack_info.name}"
 )
 
@@ -315,7 +337,7 @@ iam.RolePolicyAttachment(
 
 iam.RolePolicyAttachment(
     f"dagster-describe-instance-role-policy-{stack_info.env_suffix}",
-    policy_arn=policy_stack.require_output("iam_policies")["describe_instances"],
+    policy_arn=iam_policy_arns()["describe_instances"],
     role=dagster_role.name,
 )
 
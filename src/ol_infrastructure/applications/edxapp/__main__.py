@@ -10,7 +10,6 @@
 import base64
 import json
 import textwrap
-from functools import partial
 from pathlib import Path
 from string import Template
 
@@ -19,7 +18,7 @@ import pulumi_fastly as fastly
 import pulumi_mongodbatlas as atlas
 import pulumi_vault as vault
 import yaml
-from pulumi import Config, Output, ResourceOptions, StackReference, export
+from pulumi import Config, Output, ResourceOptions, export
 from pulumi_aws import (
     acm,
     autoscaling,
@@ -42,7 +41,7 @@ from bridge.lib.magic_numbers import (
     DEFAULT_REDIS_PORT,
     IAM_ROLE_NAME_PREFIX_MAX_LENGTH,
 )
-from bridge.secrets.sops import read_yaml_secrets
+from bridge.secrets.sops import prefetch_secrets, read_yaml_secrets
 from ol_infrastructure.components.aws.cache import OLAmazonCache, OLAmazonRedisConfig
 from ol_infrastructure.components.aws.database import OLAmazonDB, OLMariaDBConfig
 from ol_infrastructure.components.services.vault import (
@@ -55,18 +54,33 @@ from ol_infrastructure.lib.aws.ec2_helper import (
     default_egress_args,
 )
 from ol_infrastructure.lib.aws.iam_helper import IAM_POLICY_VERSION, lint_iam_policy
-from ol_infrastructure.lib.aws.route53_helper import acm_certificate_validation_records
-from ol_infrastructure.lib.consul import get_consul_provider
-from ol_infrastructure.lib.fastly import get_fastly_provider
+from ol_infrastructure.lib.aws.route53_helper import acm_certificate_validation
+from ol_infrastructure.lib.consul import setup_consul_provider
+from ol_infrastructure.lib.fastly import setup_fastly_provider
+from ol_infrastructure.lib.mongodb_atlas import setup_mongodb_atlas_provider
 from ol_infrastructure.lib.ol_types import Apps, AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 from ol_infrastructure.lib.stack_defaults import defaults
 from ol_infrastructure.lib.vault import mysql_role_statements, setup_vault_provider
 
 stack_info = parse_stack()
+prefetch_secrets(
+    [
+        Path(f"edxapp/{stack_info.env_prefix}.{stack_info.env_suffix}.yaml"),
+        Path("pulumi/mongodb_atlas.yaml"),
+        Path(
+            f"pulumi/mongodb_atlas.{stack_info.env_prefix}.{stack_info.env_suffix}.yaml"
+        ),
+        Path(f"pulumi/consul.{stack_info.env_suffix}.yaml"),
+        Path(f"vector/grafana.{stack_info.env_suffix}.yaml"),
+    ]
+)
 edxapp_config = Config("edxapp")
 if Config("vault").get("address"):
     setup_vault_provider()
+setup_consul_provider(stack_info)
+setup_fastly_provider()
+setup_mongodb_atlas_provider()
 #############
 # Constants #
 #############
@@ -80,14 +94,14 @@ FIVE_MINUTES = 60 * 5
 #####################
 # Stack Information #
 #####################
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
-policy_stack = StackReference("infrastructure.aws.policies")
-dns_stack = StackReference("infrastructure.aws.dns")
-consul_stack = StackReference(
+network_stack = stack_reference(f"infrastructure.aws.network.{stack_info.name}")
+policy_stack = stack_reference("infrastructure.aws.policies")
+dns_stack = stack_reference("infrastructure.aws.dns")
+consul_stack = stack_reference(
     f"infrastructure.consul.{stack_info.env_prefix}.{stack_info.name}"
 )
-kms_stack = StackReference(f"infrastructure.aws.kms.{stack_info.name}")
-vault_stack = StackReference(f"infrastructure.vault.operations.{stack_info.name}")
+kms_stack = stack_reference(f"infrastructure.aws.kms.{stack_info.name}")
+vault_stack = stack_reference(f"infrastructure.vault.operations.{stack_info.name}")
 
 #############
 # Variables #
@@ -104,8 +118,6 @@ aws_config = AWSBase(
     }
 )
 consul_security_groups = consul_stack.require_output("security_groups")
-consul_provider = get_consul_provider(stack_info)
-fastly_provider = get_fastly_provider()
 edxapp_release = edxapp_config.require("edxapp_release")
 edxapp_domains = edxapp_config.require_object("domains")
 edxapp_mfes = edxapp_config.require_object("enabled_mfes")
@@ -575,7 +587,6 @@ edxapp_db_consul_node = Node(
     "edxapp-instance-db-node",
     name="edxapp-mysql",
     address=edxapp_db.db_instance.address,
-    opts=consul_provider,
 )
 
 edxapp_db_consul_service = Service(
@@ -599,7 +610,6 @@ edxapp_db_consul_service = Service(
             ).apply(lambda db: "{address}:{port}".format(**db)),
         )
     ],
-    opts=consul_provider,
 )
 
 #######################
@@ -607,14 +617,6 @@ edxapp_db_consul_service = Service(
 #######################
 mongodb_config = Config("mongodb")
 atlas_project_id = mongodb_config.get("atlas_project_id")
-atlas_creds = read_yaml_secrets(Path("pulumi/mongodb_atlas.yaml"))
-atlas_provider = ResourceOptions(
-    provider=atlas.Provider(
-        "mongodb-atlas-provider",
-        private_key=atlas_creds["private_key"],
-        public_key=atlas_creds["public_key"],
-    )
-)
 mongo_atlas_credentials = read_yaml_secrets(
     Path(f"pulumi/mongodb_atlas.{stack_info.env_prefix}.{stack_info.env_suffix}.yaml")
 )
@@ -625,7 +627,7 @@ edxapp_mongo_user = atlas.DatabaseUser(
     password=Output.secret(mongo_atlas_credentials["edxapp"]),
     username="edxapp",
     roles=[atlas.DatabaseUserRoleArgs(database_name="edxapp", role_name="readWrite")],
-    opts=atlas_provider.merge(ResourceOptions(delete_before_replace=True)),
+    opts=ResourceOptions(delete_before_replace=True),
 )
 forum_mongo_user = atlas.DatabaseUser(
     "mongodb-atlas-forum-user",
@@ -634,7 +636,7 @@ forum_mongo_user = atlas.DatabaseUser(
     password=Output.secret(mongo_atlas_credentials["forum"]),
     username="forum",
     roles=[atlas.DatabaseUserRoleArgs(database_name="forum", role_name="readWrite")],
-    opts=atlas_provider.merge(ResourceOptions(delete_before_replace=True)),
+    opts=ResourceOptions(delete_before_replace=True),
 )
 vault.generic.Secret(
     "edxapp-mongodb-atlas-user-password",
@@ -698,7 +700,6 @@ edxapp_redis_consul_node = Node(
     "edxapp-redis-cache-node",
     name="edxapp-redis",
     address=edxapp_redis_cache.address,
-    opts=consul_provider,
 )
 
 edxapp_redis_consul_service = Service(
@@ -723,7 +724,6 @@ edxapp_redis_consul_service = Service(
             ).apply(lambda cluster: "{address}:{port}".format(**cluster)),
         )
     ],
-    opts=consul_provider,
 )
 
 ########################################
@@ -845,7 +845,6 @@ consul.Keys(
         consul.KeysKeyArgs(path=f"edxapp/{key}", value=config_value)
         for key, config_value in consul_kv_data.items()
     ],
-    opts=consul_provider,
 )
 
 ##########################
@@ -922,21 +921,15 @@ edxapp_web_acm_cert = acm.Certificate(
     tags=aws_config.tags,
 )
 
-edxapp_acm_cert_validation_records = (
-    edxapp_web_acm_cert.domain_validation_options.apply(
-        partial(acm_certificate_validation_records, zone_id=edxapp_zone_id)
-    )
-)
-
-edxapp_web_acm_validated_cert = acm.CertificateValidation(
-    "wait-for-edxapp-acm-cert-validation",
-    certificate_arn=edxapp_web_acm_cert.arn,
-    validation_record_fqdns=edxapp_acm_cert_validation_records.apply(
-        lambda validation_records: [
-            validation_record.fqdn for validation_record in validation_records
-        ]
-    ),
+edxapp_acm_validation = acm_certificate_validation(
+    {"wait-for-edxapp-acm-cert-validation": edxapp_web_acm_cert},
+    zone_id=edxapp_zone_id,
+    name_prefix="edxapp-acm-cert-validation",
+    legacy_name_prefix="edxapp-acm-cert-validation-route53-record",
 )
+edxapp_web_acm_validated_cert = edxapp_acm_validation.validations[
+    "wait-for-edxapp-acm-cert-validation"
+]
 edxapp_web_alb_http_listener = lb.Listener(
     "edxapp-web--alb-listener-http",
     load_balancer_arn=web_lb.arn,
@@ -1411,7 +1404,6 @@ edxapp_fastly_service = fastly.ServiceVcl(
             type="error",
         ),
     ],
-    opts=fastly_provider,
 )
 
 
@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pulumi_vault as vault
 import yaml
-from pulumi import Config, StackReference
+from pulumi import Config
 from pulumi_aws import ec2, get_caller_identity, iam
 
 from bridge.lib.magic_numbers import FORUM_SERVICE_PORT
@@ -22,22 +22,22 @@ from ol_infrastructure.components.aws.auto_scale_group import (
 from ol_infrastructure.lib.aws.ec2_helper import InstanceTypes, default_egress_args
 from ol_infrastructure.lib.consul import get_consul_provider
 from ol_infrastructure.lib.ol_types import AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 from ol_infrastructure.lib.vault import setup_vault_provider
 
 stack_info = parse_stack()
 forum_config = Config("forum")
 if Config("vault").get("address"):
     setup_vault_provider()
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
-policy_stack = StackReference("infrastructure.aws.policies")
-dns_stack = StackReference("infrastructure.aws.dns")
-consul_stack = StackReference(
+network_stack = stack_reference(f"infrastructure.aws.network.{stack_info.name}")
+policy_stack = stack_reference("infrastructure.aws.policies")
+dns_stack = stack_reference("infrastructure.aws.dns")
+consul_stack = stack_reference(
     f"infrastructure.consul.{stack_info.env_prefix}.{stack_info.name}"
 )
 
-vault_stack = StackReference(f"infrastructure.vault.operations.{stack_info.name}")
-edxapp = StackReference(
+vault_stack = stack_reference(f"infrastructure.vault.operations.{stack_info.name}")
+edxapp = stack_reference(
     f"applications.edxapp.{stack_info.env_prefix}.{stack_info.name}"
 )
 
@@ -1,4 +1,4 @@
-from pulumi import StackReference, export
+from pulumi import export
 from pulumi_aws import route53
 
 from ol_infrastructure.components.aws.s3_cloudfront_site import (
@@ -7,10 +7,10 @@ from ol_infrastructure.components.aws.s3_cloudfront_site import (
     S3ServerlessSiteConfig,
 )
 from ol_infrastructure.lib.ol_types import Apps, AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 
 fifteen_minutes = 60 * 15
-dns_stack = StackReference("infrastructure.aws.dns")
+dns_stack = stack_reference("infrastructure.aws.dns")
 stack_info = parse_stack()
 mitx_environment = f"mitx-{stack_info.env_suffix}"
 aws_config = AWSBase(
@@ -8,7 +8,7 @@ import json
 
 import pulumi_consul as consul
 import pulumi_vault as vault
-from pulumi import Config, StackReference, export
+from pulumi import Config, export
 from pulumi_aws import ec2, iam, s3
 
 from bridge.lib.magic_numbers import DEFAULT_POSTGRES_PORT
@@ -19,14 +19,14 @@ from ol_infrastructure.components.services.vault import (
 )
 from ol_infrastructure.lib.aws.iam_helper import lint_iam_policy
 from ol_infrastructure.lib.ol_types import AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 from ol_infrastructure.lib.stack_defaults import defaults
 from ol_infrastructure.lib.vault import setup_vault_provider
 
 setup_vault_provider()
 mitxonline_config = Config("mitxonline")
 stack_info = parse_stack()
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
+network_stack = stack_reference(f"infrastructure.aws.network.{stack_info.name}")
 mitxonline_vpc = network_stack.require_output("mitxonline_vpc")
 operations_vpc = network_stack.require_output("operations_vpc")
 mitxonline_environment = f"mitxonline-{stack_info.env_suffix}"
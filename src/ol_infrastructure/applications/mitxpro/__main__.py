@@ -9,7 +9,7 @@
 
 from string import Template
 
-from pulumi import Config, StackReference, export
+from pulumi import Config, export
 from pulumi_aws import ec2
 from pulumi_consul import Node, Service
 
@@ -19,14 +19,14 @@ from ol_infrastructure.components.services.vault import (
     OLVaultMysqlDatabaseConfig,
 )
 from ol_infrastructure.lib.ol_types import Apps, AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 from ol_infrastructure.lib.stack_defaults import defaults
 from ol_infrastructure.lib.vault import mysql_role_statements
 
 stack_info = parse_stack()
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
-dns_stack = StackReference("infrastructure.aws.dns")
-dagster_app = StackReference(f"applications.dagster.{stack_info.name}")
+network_stack = stack_reference(f"infrastructure.aws.network.{stack_info.name}")
+dns_stack = stack_reference("infrastructure.aws.dns")
+dagster_app = stack_reference(f"applications.dagster.{stack_info.name}")
 mitodl_zone_id = dns_stack.require_output("odl_zone_id")
 xpro_vpc = network_stack.require_output("xpro_vpc")
 operations_vpc = network_stack.require_output("operations_vpc")
@@ -14,14 +14,14 @@ content to the OCW site's S3 buckets.
 
 TODO: consul cloud autojoin functionality
 """
-from pulumi import ResourceOptions, StackReference, export
+from pulumi import ResourceOptions, export
 from pulumi.config import get_config
 from pulumi_aws import ec2, iam, route53, s3
 
 from ol_infrastructure.lib.aws.ec2_helper import build_userdata, debian_10_ami
 from ol_infrastructure.lib.aws.iam_helper import lint_iam_policy
 from ol_infrastructure.lib.ol_types import AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 from ol_infrastructure.providers.salt.minion import (
     OLSaltStackMinion,
     OLSaltStackMinionInputs,
@@ -38,8 +38,8 @@ env_nomenclature = {
 }
 
 stack_info = parse_stack()
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
-dns_stack = StackReference("infrastructure.aws.dns")
+network_stack = stack_reference(f"infrastructure.aws.network.{stack_info.name}")
+dns_stack = stack_reference("infrastructure.aws.dns")
 mitodl_zone_id = dns_stack.require_output("odl_zone_id")
 apps_vpc = network_stack.require_output("applications_vpc")
 ocw_next_build_environment = f"applications-{stack_info.env_suffix}"
@@ -2,7 +2,7 @@ import json
 from pathlib import Path
 
 import pulumi_fastly as fastly
-from pulumi import Config, ResourceOptions, StackReference, export
+from pulumi import Config, ResourceOptions, export
 from pulumi_aws import iam, route53, s3
 
 from bridge.lib.constants import FASTLY_A_TLS_1_2, FASTLY_CNAME_TLS_1_3
@@ -16,7 +16,7 @@ from bridge.lib.magic_numbers import (
 )
 from ol_infrastructure.lib.aws.iam_helper import lint_iam_policy
 from ol_infrastructure.lib.ol_types import AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 
 ocw_site_config = Config("ocw_site")
 stack_info = parse_stack()
@@ -27,7 +27,7 @@ aws_config = AWSBase(
     }
 )
 
-dns_stack = StackReference("infrastructure.aws.dns")
+dns_stack = stack_reference("infrastructure.aws.dns")
 ocw_zone = dns_stack.require_output("ocw")
 # Create S3 buckets
 # There are two buckets for each environment (QA, Production):
@@ -9,10 +9,10 @@ from pathlib import Path
 
 import pulumi_github as github
 import pulumi_vault as vault
-from pulumi import Config, InvokeOptions, ResourceOptions, StackReference, export
+from pulumi import Config, InvokeOptions, ResourceOptions, export
 from pulumi_aws import cloudwatch, ec2, iam, mediaconvert, s3, sns
 
-from bridge.secrets.sops import read_yaml_secrets
+from bridge.secrets.sops import prefetch_secrets, read_yaml_secrets
 from ol_infrastructure.components.aws.database import OLAmazonDB, OLPostgresDBConfig
 from ol_infrastructure.components.services.vault import (
     OLVaultDatabaseBackend,
@@ -20,10 +20,17 @@ from ol_infrastructure.components.services.vault import (
 )
 from ol_infrastructure.lib.aws.iam_helper import lint_iam_policy
 from ol_infrastructure.lib.ol_types import AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 from ol_infrastructure.lib.stack_defaults import defaults
 from ol_infrastructure.lib.vault import setup_vault_provider
 
+stack_info = parse_stack()
+prefetch_secrets(
+    [
+        Path("pulumi/github_provider.yaml"),
+        Path(f"ocw_studio/ocw_studio.{stack_info.env_suffix}.yaml"),
+    ]
+)
 setup_vault_provider()
 github_provider = github.Provider(
     "github-provider",
@@ -32,8 +39,7 @@ github_provider = github.Provider(
 )
 github_options = ResourceOptions(provider=github_provider)
 ocw_studio_config = Config("ocw_studio")
-stack_info = parse_stack()
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
+network_stack = stack_reference(f"infrastructure.aws.network.{stack_info.name}")
 apps_vpc = network_stack.require_output("applications_vpc")
 operations_vpc = network_stack.require_output("operations_vpc")
 aws_config = AWSBase(
@@ -22,7 +22,7 @@ from pathlib import Path
 import pulumi_consul as consul
 import pulumi_vault as vault
 import yaml
-from pulumi import Config, StackReference, export
+from pulumi import Config, export
 from pulumi.config import get_config
 from pulumi_aws import ec2, get_ami, get_caller_identity, iam, route53
 
@@ -46,17 +46,17 @@ from ol_infrastructure.components.services.vault import (
 from ol_infrastructure.lib.aws.ec2_helper import InstanceTypes, default_egress_args
 from ol_infrastructure.lib.consul import get_consul_provider
 from ol_infrastructure.lib.ol_types import AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 from ol_infrastructure.lib.stack_defaults import defaults
 from ol_infrastructure.lib.vault import setup_vault_provider
 
 redash_config = Config("redash")
 salt_config = Config("saltstack")
 stack_info = parse_stack()
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
-consul_stack = StackReference(f"infrastructure.consul.data.{stack_info.name}")
-dns_stack = StackReference("infrastructure.aws.dns")
-policy_stack = StackReference("infrastructure.aws.policies")
+network_stack = stack_reference(f"infrastructure.aws.network.{stack_info.name}")
+consul_stack = stack_reference(f"infrastructure.consul.data.{stack_info.name}")
+dns_stack = stack_reference("infrastructure.aws.dns")
+policy_stack = stack_reference("infrastructure.aws.policies")
 mitodl_zone_id = dns_stack.require_output("odl_zone_id")
 data_vpc = network_stack.require_output("data_vpc")
 operations_vpc = network_stack.require_output("operations_vpc")
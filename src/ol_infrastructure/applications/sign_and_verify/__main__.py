@@ -17,19 +17,19 @@ import json
 import os
 from pathlib import Path
 
-from pulumi import Config, Output, StackReference
+from pulumi import Config, Output
 from pulumi_aws import acm, ecs, iam, lb, route53, secretsmanager
 
 from bridge.lib.magic_numbers import DEFAULT_HTTPS_PORT
 from bridge.secrets.sops import read_json_secrets
 from ol_infrastructure.lib.aws.iam_helper import lint_iam_policy
 from ol_infrastructure.lib.ol_types import AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 
 stack_info = parse_stack()
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
-dns_stack = StackReference("infrastructure.aws.dns")
-iam_policies = StackReference("infrastructure.aws.policies").require_output(
+network_stack = stack_reference(f"infrastructure.aws.network.{stack_info.name}")
+dns_stack = stack_reference("infrastructure.aws.dns")
+iam_policies = stack_reference("infrastructure.aws.policies").require_output(
     "iam_policies"
 )
 mitodl_zone_id = dns_stack.require_output("odl_zone_id")
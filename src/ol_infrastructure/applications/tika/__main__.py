@@ -8,7 +8,7 @@ from pathlib import Path
 
 import pulumi_vault as vault
 import yaml
-from pulumi import Config, StackReference
+from pulumi import Config
 from pulumi_aws import ec2, get_caller_identity, iam, route53
 
 from bridge.lib.magic_numbers import DEFAULT_HTTPS_PORT
@@ -25,7 +25,7 @@ from ol_infrastructure.components.aws.auto_scale_group import (
 from ol_infrastructure.lib.aws.ec2_helper import InstanceTypes, default_egress_args
 from ol_infrastructure.lib.consul import get_consul_provider
 from ol_infrastructure.lib.ol_types import AWSBase
-from ol_infrastructure.lib.pulumi_helper import parse_stack
+from ol_infrastructure.lib.pulumi_helper import parse_stack, stack_reference
 from ol_infrastructure.lib.vault import setup_vault_provider
 
 ##################################
@@ -36,10 +36,10 @@ if Config("vault_server").get("env_namespace"):
     setup_vault_provider()
 stack_info = parse_stack()
 tika_config = Config("tika")
-network_stack = StackReference(f"infrastructure.aws.network.{stack_info.name}")
-policy_stack = StackReference("infrastructure.aws.policies")
-dns_stack = StackReference("infrastructure.aws.dns")
-consul_stack = StackReference(f"infrastructure.consul.apps.{stack_info.name}")
+network_stack = stack_reference(f"infrastructure.aws.network.{stack_info.name}")
+policy_stack = stack_reference("infrastructure.aws.policies")
+dns_stack = stack_reference("infrastructure.aws.dns")
+consul_stack = stack_reference(f"infrastructure.consul.apps.{stack_info.name}")
 mitodl_zone_id = dns_stack.require_output("odl_zone_id")
 
 env_name = f"{stack_info.env_prefix}-{stack_info.env_suffix}"
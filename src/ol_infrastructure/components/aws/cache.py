@@ -12,10 +12,7 @@ from pulumi_aws import elasticache
 from pydantic import PositiveInt, conint, validator
 
 from bridge.lib.magic_numbers import DEFAULT_MEMCACHED_PORT, DEFAULT_REDIS_PORT
-from ol_infrastructure.lib.aws.elasticache_helper import (
-    cache_engines,
-    parameter_group_family,
-)
+from ol_infrastructure.lib.aws.elasticache_helper import cache_engine_registry
 from ol_infrastructure.lib.ol_types import AWSBase
 
 PulumiString = Union[str, pulumi.Output[str]]
@@ -49,8 +46,7 @@ class OLAmazonCacheConfig(AWSBase):
 
     @validator("engine")
     def is_valid_engine(cls: "OLAmazonCacheConfig", engine: str) -> str:
-        valid_engines = cache_engines()
-        if engine not in valid_engines:
+        if not cache_engine_registry.is_valid_engine(engine):
             raise ValueError("The specified cache engine is not a valid option in AWS.")
         return engine
 
@@ -60,9 +56,8 @@ class OLAmazonCacheConfig(AWSBase):
         engine_version: str,
         values: dict,
     ) -> str:
-        engine: str = str(values.get("engine"))
-        engines_map = cache_engines()
-        if engine_version not in engines_map.get(engine, []):
+        engine: str = values.get("engine")  # type: ignore
+        if not cache_engine_registry.is_valid_version(engine, engine_version):
             raise ValueError(
                 f"The specified version of the {engine} engine is not supported in AWS."
             )
@@ -174,7 +169,7 @@ class OLAmazonCache(pulumi.ComponentResource):
             name=(
                 f"{cache_config.cluster_name}-{cache_config.engine_version.replace('.', '')}-parameter-group"
             ),
-            family=parameter_group_family(
+            family=cache_engine_registry.parameter_group_family(
                 cache_config.engine, cache_config.engine_version
             ),
             parameters=cache_parameters,
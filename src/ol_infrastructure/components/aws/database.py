@@ -16,11 +16,7 @@ from pulumi_aws import rds
 from pulumi_aws.ec2 import SecurityGroup
 from pydantic import BaseModel, PositiveInt, SecretStr, conint, validator
 
-from ol_infrastructure.lib.aws.rds_helper import (
-    DBInstanceTypes,
-    db_engines,
-    parameter_group_family,
-)
+from ol_infrastructure.lib.aws.rds_helper import DBInstanceTypes, rds_engine_registry
 from ol_infrastructure.lib.ol_types import AWSBase
 
 MAX_BACKUP_DAYS = 35
@@ -75,16 +71,14 @@ class OLDBConfig(AWSBase):
 
     @validator("engine")
     def is_valid_engine(cls: "OLDBConfig", engine: str) -> str:
-        valid_engines = db_engines()
-        if engine not in valid_engines:
+        if not rds_engine_registry.is_valid_engine(engine):
             raise ValueError("The specified DB engine is not a valid option in AWS.")
         return engine
 
     @validator("engine_version")
     def is_valid_version(cls: "OLDBConfig", engine_version: str, values: dict) -> str:
         engine: str = values.get("engine")  # type: ignore
-        engines_map = db_engines()
-        if engine_version not in engines_map.get(engine, []):
+        if not rds_engine_registry.is_valid_version(engine, engine_version):
             raise ValueError(
                 f"The specified version of the {engine} engine is not supported in AWS."
             )
@@ -148,7 +142,9 @@ class OLAmazonDB(pulumi.ComponentResource):
 
         self.parameter_group = rds.ParameterGroup(
             f"{db_config.instance_name}-{db_config.engine}-parameter-group",
-            family=parameter_group_family(db_config.engine, db_config.engine_version),
+            family=rds_engine_registry.parameter_group_family(
+                db_config.engine, db_config.engine_version
+            ),
             opts=resource_options.merge(
                 pulumi.ResourceOptions(ignore_changes=["family"])
             ),
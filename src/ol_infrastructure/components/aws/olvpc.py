@@ -24,6 +24,7 @@ from ol_infrastructure.lib.aws.ec2_helper import (
     availability_zones,
     internet_gateway_opts,
     route_table_opts,
+    subnet_availability_zone,
     subnet_opts,
     vpc_opts,
     vpc_peer_opts,
@@ -220,8 +221,7 @@ class OLVPC(ComponentResource):
                 subnet_v4, imported_vpc_id
             )
             if imported_subnet_id:
-                subnet = ec2.get_subnet(id=imported_subnet_id)
-                zone = subnet.availability_zone
+                zone = subnet_availability_zone(imported_subnet_id)
             ol_subnet = ec2.Subnet(
                 net_name,
                 cidr_block=str(subnet_v4),
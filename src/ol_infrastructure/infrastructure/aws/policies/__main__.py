@@ -1,7 +1,10 @@
+import json
+
 from pulumi import StackReference, export
 from pulumi_aws import iam
 
 from ol_infrastructure.lib.aws.iam_helper import (
+    lint_iam_policies,
     lint_iam_policy,
     route53_policy_template,
 )
@@ -15,11 +18,33 @@ describe_instance_policy_document = {
         {"Effect": "Allow", "Action": "ec2:DescribeInstances", "Resource": "*"}
     ],
 }
+cloudwatch_logs_policy = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Action": [
+                "logs:CreateLogGroup",
+                "logs:CreateLogStream",
+                "logs:PutLogEvents",
+                "logs:DescribeLogStreams",
+            ],
+            "Resource": ["arn:aws:logs:*:*:*"],
+        }
+    ],
+}
+lint_iam_policies(
+    {
+        "describe_instances": describe_instance_policy_document,
+        "cloudwatch_logging": cloudwatch_logs_policy,
+    }
+).raise_for_findings()
+
 describe_instance_policy = iam.Policy(
     "describe-ec2-instances-policy",
     name="describe-ec2-instances-policy",
     path="/ol-operations/describe-ec2-instances-policy/",
-    policy=lint_iam_policy(describe_instance_policy_document, stringify=True),
+    policy=json.dumps(describe_instance_policy_document),
     description="Policy permitting EC2 describe instances capabilities for use with "
     "cloud auto-join systems.",
 )
@@ -36,26 +61,11 @@ odl_zone_route53_policy = iam.Policy(
     description="Grant permissions to create Route53 records in the odl zone",
 )
 
-cloudwatch_logs_policy = {
-    "Version": "2012-10-17",
-    "Statement": [
-        {
-            "Effect": "Allow",
-            "Action": [
-                "logs:CreateLogGroup",
-                "logs:CreateLogStream",
-                "logs:PutLogEvents",
-                "logs:DescribeLogStreams",
-            ],
-            "Resource": ["arn:aws:logs:*:*:*"],
-        }
-    ],
-}
 create_cloudwatch_logs_policy = iam.Policy(
     "create-cloudwatch-log-group-policy",
     name="allow-cloudwatch-log-access",
     path="/ol-operations/global-policies/",
-    policy=lint_iam_policy(cloudwatch_logs_policy, stringify=True),
+    policy=json.dumps(cloudwatch_logs_policy),
 )
 
 export(
@@ -8,8 +8,9 @@ import pulumi_consul as consul
 import pulumi_mongodbatlas as atlas
 
 from bridge.lib.magic_numbers import DEFAULT_MONGODB_PORT
-from bridge.secrets.sops import read_yaml_secrets
+from bridge.secrets.sops import prefetch_secrets, read_yaml_secrets
 from ol_infrastructure.lib.aws.ec2_helper import default_egress_args
+from ol_infrastructure.lib.mongodb_atlas import get_mongodb_atlas_provider
 from ol_infrastructure.lib.ol_types import AWSBase
 from ol_infrastructure.lib.pulumi_helper import parse_stack
 
@@ -31,6 +32,12 @@ def privatize_mongo_uri(mongo_uri):
 atlas_config = pulumi.Config("mongodb_atlas")
 env_config = pulumi.Config("environment")
 stack_info = parse_stack()
+prefetch_secrets(
+    [
+        Path("pulumi/mongodb_atlas.yaml"),
+        Path(f"pulumi/consul.{stack_info.env_suffix}.yaml"),
+    ]
+)
 dagster_env_name = stack_info.name
 if stack_info.name == "CI":
     dagster_env_name = "QA"
@@ -61,14 +68,7 @@ if (
     is None
 ):
     enable_point_in_time_recovery = True
-atlas_creds = read_yaml_secrets(Path("pulumi/mongodb_atlas.yaml"))
-atlas_provider = pulumi.ResourceOptions(
-    provider=atlas.Provider(
-        "mongodb-atlas-provider",
-        private_key=atlas_creds["private_key"],
-        public_key=atlas_creds["public_key"],
-    ),
-)
+atlas_provider = get_mongodb_atlas_provider()
 
 #################
 # ATLAS PROJECT #
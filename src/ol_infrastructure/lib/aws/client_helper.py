@@ -0,0 +1,67 @@
+"""Lazily constructed AWS API clients and Pulumi data source lookups.
+
+Modules in `ol_infrastructure.lib` are imported by nearly every stack and test, so
+they must not create boto3 clients or invoke Pulumi data sources at import time.
+Clients are instead built the first time they are requested and shared for the rest of
+the process, and data source lookups are wrapped in `DeferredDataSource` so that they
+only execute when one of their attributes is accessed.
+"""
+import threading
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+import boto3
+from botocore.client import BaseClient
+
+DataSourceResult = TypeVar("DataSourceResult")
+
+_clients: dict[tuple[str, Optional[str]], BaseClient] = {}
+_clients_lock = threading.Lock()
+
+
+def aws_client(service_name: str, region_name: Optional[str] = None) -> BaseClient:
+    """Return a shared boto3 client for the given service, creating it on first use.
+
+    :param service_name: The name of the AWS service.  e.g. ec2
+    :type service_name: str
+
+    :param region_name: The region to connect to.  Defaults to the region configured in
+        the environment.
+    :type region_name: Optional[str]
+
+    :returns: A boto3 client for the requested service.
+
+    :rtype: BaseClient
+    """
+    client_key = (service_name, region_name)
+    with _clients_lock:
+        if client_key not in _clients:
+            _clients[client_key] = boto3.client(service_name, region_name=region_name)
+        return _clients[client_key]
+
+
+class DeferredDataSource(Generic[DataSourceResult]):
+    """Proxy for a data source lookup that is performed on first attribute access.
+
+    e.g. `debian_ami = DeferredDataSource(lambda: ec2.get_ami(...))` can be defined at
+    module level and used as `debian_ami.id` without invoking the lookup until then.
+    """
+
+    def __init__(self, lookup: Callable[[], DataSourceResult]):
+        self._lookup = lookup
+        self._result: Optional[DataSourceResult] = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> DataSourceResult:
+        """Perform the lookup if it hasn't already run and return its result.
+
+        :returns: The result of the wrapped lookup function.
+
+        :rtype: DataSourceResult
+        """
+        with self._lock:
+            if self._result is None:
+                self._result = self._lookup()
+            return self._result
+
+    def __getattr__(self, attribute_name: str) -> Any:
+        return getattr(self.resolve(), attribute_name)
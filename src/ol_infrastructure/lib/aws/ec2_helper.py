@@ -1,29 +1,35 @@
 """Helper functions for working with EC2 resources."""
+from collections import defaultdict
 from enum import Enum, unique
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from ipaddress import IPv4Network
-from types import FunctionType
 from typing import Any, Optional, Union
 
-import boto3
 import pulumi
 import yaml
 from pulumi_aws import ec2
 
+from ol_infrastructure.lib.aws.client_helper import DeferredDataSource, aws_client
+from ol_infrastructure.lib.aws.metadata_cache import (
+    LONG_LIVED_METADATA_TTL,
+    cached_metadata,
+)
+from ol_infrastructure.lib.aws.tagging_helper import pulumi_managed_tag_queue
 from ol_infrastructure.providers.salt.minion import OLSaltStackMinion
 
-ec2_client = boto3.client("ec2")
 AWSFilterType = list[dict[str, Union[str, list[str]]]]
 
-debian_10_ami = ec2.get_ami(
-    filters=[
-        {"name": "image-id", "values": ["ami-0e0161137b4b30900"]},
-        {"name": "virtualization-type", "values": ["hvm"]},
-        {"name": "root-device-type", "values": ["ebs"]},
-        {"name": "name", "values": ["debian-10-amd64*"]},
-    ],
-    most_recent=True,
-    owners=["136693071363"],
+debian_10_ami: DeferredDataSource[ec2.GetAmiResult] = DeferredDataSource(
+    lambda: ec2.get_ami(
+        filters=[
+            {"name": "image-id", "values": ["ami-0e0161137b4b30900"]},
+            {"name": "virtualization-type", "values": ["hvm"]},
+            {"name": "root-device-type", "values": ["ebs"]},
+            {"name": "name", "values": ["debian-10-amd64*"]},
+        ],
+        most_recent=True,
+        owners=["136693071363"],
+    )
 )
 
 default_egress_args = [
@@ -62,7 +68,7 @@ class DiskTypes(str, Enum):
     provisioned_iops = "io2"
 
 
-@lru_cache
+@cached_metadata(ttl=LONG_LIVED_METADATA_TTL)
 def aws_regions() -> list[str]:
     """Generate the list of regions available in AWS.
 
@@ -70,10 +76,13 @@ def aws_regions() -> list[str]:
 
     :rtype: List[str]
     """
-    return [region["RegionName"] for region in ec2_client.describe_regions()["Regions"]]
+    return [
+        region["RegionName"]
+        for region in aws_client("ec2").describe_regions()["Regions"]
+    ]
 
 
-@lru_cache
+@cached_metadata(ttl=LONG_LIVED_METADATA_TTL)
 def availability_zones(region: str = "us-east-1") -> list[str]:
     """Generate a list of availability zones for a given AWS region.
 
@@ -84,34 +93,173 @@ def availability_zones(region: str = "us-east-1") -> list[str]:
 
     :rtype: List[str]
     """
-    zones = ec2_client.describe_availability_zones(
+    zones = aws_client("ec2").describe_availability_zones(
         Filters=[{"Name": "region-name", "Values": [region]}]
     )["AvailabilityZones"]
     # Avoid using us-east-1e because it doesn't support newer instance types
     return [zone["ZoneName"] for zone in zones if zone["ZoneName"] != "us-east-1e"]
 
 
+EC2Resource = dict[str, Any]
+
+
+class EC2DiscoverySnapshot:
+    """Point in time inventory of the networking resources in a region.
+
+    Each resource type is listed once, with pagination, the first time it is needed
+    and then indexed so that the conditional import helpers can answer their filters
+    locally instead of issuing a `describe_*` call per resource.
+    """
+
+    def __init__(self, region: Optional[str] = None):
+        self.region = region
+
+    def _describe(self, operation: str, result_key: str) -> list[EC2Resource]:
+        paginator = aws_client("ec2", self.region).get_paginator(operation)
+        return [
+            resource
+            for result_page in paginator.paginate()
+            for resource in result_page[result_key]
+        ]
+
+    @cached_property
+    def vpcs_by_cidr_and_name(self) -> dict[tuple[str, str], list[EC2Resource]]:
+        vpc_index = defaultdict(list)
+        for vpc in self._describe("describe_vpcs", "Vpcs"):
+            vpc_index[(vpc["CidrBlock"], _tag_value(vpc, "Name"))].append(vpc)
+        return vpc_index
+
+    @cached_property
+    def internet_gateways_by_vpc(self) -> dict[str, list[EC2Resource]]:
+        gateway_index = defaultdict(list)
+        for gateway in self._describe("describe_internet_gateways", "InternetGateways"):
+            for attachment in gateway.get("Attachments", []):
+                gateway_index[attachment["VpcId"]].append(gateway)
+        return gateway_index
+
+    @cached_property
+    def subnets_by_id(self) -> dict[str, EC2Resource]:
+        return {
+            subnet["SubnetId"]: subnet
+            for subnet in self._describe("describe_subnets", "Subnets")
+        }
+
+    @cached_property
+    def subnets_by_vpc_and_cidr(self) -> dict[tuple[str, str], list[EC2Resource]]:
+        subnet_index = defaultdict(list)
+        for subnet in self.subnets_by_id.values():
+            subnet_index[(subnet["VpcId"], subnet["CidrBlock"])].append(subnet)
+        return subnet_index
+
+    @cached_property
+    def route_tables_by_gateway(self) -> dict[str, list[EC2Resource]]:
+        route_table_index = defaultdict(list)
+        for route_table in self._describe("describe_route_tables", "RouteTables"):
+            gateway_ids = {
+                route["GatewayId"]
+                for route in route_table.get("Routes", [])
+                if "GatewayId" in route
+            }
+            for gateway_id in gateway_ids:
+                route_table_index[gateway_id].append(route_table)
+        return route_table_index
+
+    @cached_property
+    def vpc_peering_connections(self) -> list[EC2Resource]:
+        return self._describe(
+            "describe_vpc_peering_connections", "VpcPeeringConnections"
+        )
+
+    def vpcs(self, vpc_cidr: str, vpc_name: str) -> list[EC2Resource]:
+        return self.vpcs_by_cidr_and_name.get((vpc_cidr, vpc_name), [])
+
+    def internet_gateways(self, attached_vpc_id: str) -> list[EC2Resource]:
+        return self.internet_gateways_by_vpc.get(attached_vpc_id, [])
+
+    def subnets(self, cidr_block: str, vpc_id: str) -> list[EC2Resource]:
+        return self.subnets_by_vpc_and_cidr.get((vpc_id, cidr_block), [])
+
+    def route_tables(self, internet_gateway_id: str) -> list[EC2Resource]:
+        return self.route_tables_by_gateway.get(internet_gateway_id, [])
+
+    def peering_connections(
+        self, accepter_cidrs: set[str], requester_cidrs: set[str]
+    ) -> list[EC2Resource]:
+        return [
+            peering_connection
+            for peering_connection in self.vpc_peering_connections
+            if _vpc_info_cidrs(peering_connection["AccepterVpcInfo"]) & accepter_cidrs
+            and _vpc_info_cidrs(peering_connection["RequesterVpcInfo"])
+            & requester_cidrs
+        ]
+
+
+def _tag_value(resource: EC2Resource, tag_key: str) -> Optional[str]:
+    for tag in resource.get("Tags", []):
+        if tag["Key"] == tag_key:
+            return tag["Value"]
+    return None
+
+
+def _vpc_info_cidrs(vpc_info: EC2Resource) -> set[str]:
+    cidrs = {cidr["CidrBlock"] for cidr in vpc_info.get("CidrBlockSet", [])}
+    if "CidrBlock" in vpc_info:
+        cidrs.add(vpc_info["CidrBlock"])
+    return cidrs
+
+
+@lru_cache
+def discovery_snapshot(region: Optional[str] = None) -> EC2DiscoverySnapshot:
+    """Return the shared discovery snapshot for a region.
+
+    :param region: The AWS region to inventory.  Defaults to the configured region.
+    :type region: Optional[str]
+
+    :returns: The snapshot of networking resources used for conditional imports.
+
+    :rtype: EC2DiscoverySnapshot
+    """
+    return EC2DiscoverySnapshot(region)
+
+
+def subnet_availability_zone(subnet_id: str) -> str:
+    """Look up the availability zone of an existing subnet from the discovery snapshot.
+
+    :param subnet_id: The ID of the subnet.
+    :type subnet_id: str
+
+    :raises KeyError: If the subnet is not in the snapshot.
+
+    :returns: The name of the availability zone that the subnet is located in.
+
+    :rtype: str
+    """
+    snapshot = discovery_snapshot()
+    try:
+        return snapshot.subnets_by_id[subnet_id]["AvailabilityZone"]
+    except KeyError as lookup_error:
+        raise KeyError(
+            f"Subnet {subnet_id} was not found in the discovery snapshot of "
+            f"{snapshot.region or 'the default region'}"
+        ) from lookup_error
+
+
 def _conditional_import(
-    discover_func: FunctionType,
+    resources: list[EC2Resource],
     filters: AWSFilterType,
-    attributes_key: str,
     attribute_id_key: str,
     change_attributes_ignored: Optional[list[str]] = None,
 ) -> tuple[pulumi.ResourceOptions, str]:
     """Determine whether to import an existing AWS resource into Pulumi.
 
-    :param discover_func: A function object to be used for looking up AWS resources.
-        e.g. ec2_client.describe_vpcs
-    :type discover_func: FunctionType
+    :param resources: The resources from the discovery snapshot that match the
+        filters for the resource being defined.
+    :type resources: List[Dict[str, Any]]
 
-    :param filters: A set of filters to be applied to the discovery function to narrow
-        down the candidate resources to be imported.
+    :param filters: The set of filters equivalent to the lookup that produced the
+        candidate resources, used for reporting when there is more than one match.
     :type filters: AWSFilterType
 
-    :param attributes_key: The dictionary attribute used to access the resource
-        information returned by the discovery function.  e.g. Vpcs
-    :type attributes_key: str
-
     :param attribute_id_key: The dictionary attribute where the resource ID is located
         in the data structure returned by the discovery function.  e.g. VpcId
     :type attribute_id_key: str
@@ -130,7 +278,6 @@ def _conditional_import(
 
     :rtype: Tuple[pulumi.ResourceOptions, str]
     """
-    resources = discover_func(Filters=filters)[attributes_key]
     tags = []
     resource_id = ""
     if change_attributes_ignored is None:
@@ -145,7 +292,7 @@ def _conditional_import(
                 "Too many resources returned. A more precise filter is needed."
             )
         resource = resources[0]
-        tags = resource["Tags"]
+        tags = resource.get("Tags", [])
         resource_id = resource[attribute_id_key]
     if not tags or "pulumi_managed" in {tag["Key"] for tag in tags}:
         opts = pulumi.ResourceOptions()
@@ -154,10 +301,7 @@ def _conditional_import(
             import_=resource_id, ignore_changes=change_attributes_ignored
         )
         if not pulumi.runtime.is_dry_run():
-            ec2_client.create_tags(
-                Resources=[resource_id],
-                Tags=[{"Key": "pulumi_managed", "Value": "true"}],
-            )
+            pulumi_managed_tag_queue.enqueue("ec2", resource_id)
     return opts, resource_id
 
 
@@ -181,12 +325,11 @@ def vpc_opts(
     :rtype: Tuple[pulumi.ResourceOptions, str]
     """
     return _conditional_import(
-        ec2_client.describe_vpcs,
+        discovery_snapshot().vpcs(str(vpc_cidr), vpc_tags["Name"]),
         [
             {"Name": "cidr", "Values": [str(vpc_cidr)]},
             {"Name": "tag:Name", "Values": [vpc_tags["Name"]]},
         ],
-        "Vpcs",
         "VpcId",
     )
 
@@ -204,9 +347,8 @@ def internet_gateway_opts(attached_vpc_id: str) -> tuple[pulumi.ResourceOptions,
     :rtype: Tuple[pulumi.ResourceOptions, str]
     """
     return _conditional_import(
-        ec2_client.describe_internet_gateways,
+        discovery_snapshot().internet_gateways(attached_vpc_id),
         [{"Name": "attachment.vpc-id", "Values": [attached_vpc_id]}],
-        "InternetGateways",
         "InternetGatewayId",
     )
 
@@ -228,12 +370,11 @@ def subnet_opts(
     :rtype: Tuple[pulumi.ResourceOptions, str]
     """
     return _conditional_import(
-        ec2_client.describe_subnets,
+        discovery_snapshot().subnets(str(cidr_block), vpc_id),
         [
             {"Name": "cidr", "Values": [str(cidr_block)]},
             {"Name": "vpc-id", "Values": [vpc_id]},
         ],
-        "Subnets",
         "SubnetId",
         [
             "tags",
@@ -257,9 +398,8 @@ def route_table_opts(internet_gateway_id: str) -> tuple[pulumi.ResourceOptions,
     :rtype: Tuple[pulumi.ResourceOptions, str]
     """
     return _conditional_import(
-        ec2_client.describe_route_tables,
+        discovery_snapshot().route_tables(internet_gateway_id),
         [{"Name": "route.gateway-id", "Values": [internet_gateway_id]}],
-        "RouteTables",
         "RouteTableId",
         ["tags", "routes"],
     )
@@ -284,7 +424,10 @@ def vpc_peer_opts(
     :rtype: Tuple[pulumi.ResourceOptions, str]
     """
     return _conditional_import(
-        ec2_client.describe_vpc_peering_connections,
+        discovery_snapshot().peering_connections(
+            accepter_cidrs={destination_vpc_cidr, source_vpc_cidr},
+            requester_cidrs={source_vpc_cidr, destination_vpc_cidr},
+        ),
         [
             {
                 "Name": "accepter-vpc-info.cidr-block",
@@ -295,7 +438,6 @@ def vpc_peer_opts(
                 "Values": [source_vpc_cidr, destination_vpc_cidr],
             },
         ],
-        "VpcPeeringConnections",
         "VpcPeeringConnectionId",
         ["tags", "vpc_id", "peer_vpc_id", "id", "auto_accept"],
     )
@@ -1,12 +1,13 @@
 from collections import defaultdict
-from functools import lru_cache
 
-import boto3
+from botocore.exceptions import ClientError
 
-cache_client = boto3.client("elasticache")
+from ol_infrastructure.lib.aws.client_helper import aws_client
+from ol_infrastructure.lib.aws.engine_registry import EngineVersionRegistry
+from ol_infrastructure.lib.aws.metadata_cache import cached_metadata
 
 
-@lru_cache
+@cached_metadata()
 def cache_engines() -> dict[str, list[str]]:
     """Generate a list of cache engines and their currently available versions on Elasticache.
 
@@ -14,7 +15,9 @@ def cache_engines() -> dict[str, list[str]]:
 
     :rtype: Dict[str, List[str]]
     """
-    all_engines_paginator = cache_client.get_paginator("describe_cache_engine_versions")
+    all_engines_paginator = aws_client("elasticache").get_paginator(
+        "describe_cache_engine_versions"
+    )
     engines_versions = defaultdict(list)
     for engines_page in all_engines_paginator.paginate():
         for engine in engines_page["CacheEngineVersions"]:
@@ -22,7 +25,37 @@ def cache_engines() -> dict[str, list[str]]:
     return dict(engines_versions)
 
 
-@lru_cache
+@cached_metadata()
+def engine_version_families(engine: str) -> dict[str, str]:
+    """Map the available versions of a single cache engine to their parameter families.
+
+    :param engine: Name of the cache engine (e.g. redis or memcached)
+    :type engine: str
+
+    :returns: Dictionary of engine versions and their parameter group family.  Empty if
+              the engine is not offered by Elasticache.
+
+    :rtype: Dict[str, str]
+    """
+    engine_paginator = aws_client("elasticache").get_paginator(
+        "describe_cache_engine_versions"
+    )
+    try:
+        return {
+            engine_version["EngineVersion"]: engine_version["CacheParameterGroupFamily"]
+            for engines_page in engine_paginator.paginate(Engine=engine)
+            for engine_version in engines_page["CacheEngineVersions"]
+        }
+    except ClientError as client_error:
+        # An engine that isn't offered is rejected rather than listed with no versions.
+        if client_error.response["Error"]["Code"] == "InvalidParameterValue":
+            return {}
+        raise
+
+
+cache_engine_registry = EngineVersionRegistry("Elasticache", engine_version_families)
+
+
 def parameter_group_family(engine: str, engine_version: str) -> str:
     """Return the valid parameter group family for the specified cache engine and version.
 
@@ -36,7 +69,4 @@ def parameter_group_family(engine: str, engine_version: str) -> str:
 
     :rtype: str
     """
-    engine_details = cache_client.describe_cache_engine_versions(
-        Engine=engine, EngineVersion=engine_version
-    )
-    return engine_details["CacheEngineVersions"][0]["CacheParameterGroupFamily"]
+    return cache_engine_registry.parameter_group_family(engine, engine_version)
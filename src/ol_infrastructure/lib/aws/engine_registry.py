@@ -0,0 +1,69 @@
+"""Common interface for validating managed database and cache engine versions.
+
+RDS and ElastiCache both describe their engines as a set of versions, each of which
+maps to a parameter group family.  `EngineVersionRegistry` indexes that mapping per
+engine so that validating a version and resolving its parameter group family is served
+from a single, targeted lookup of only the engine in use.
+"""
+from typing import Callable, Optional
+
+
+class EngineVersionRegistry:
+    """Index of engine versions to parameter group families for one AWS service."""
+
+    def __init__(self, service_name: str, lookup: Callable[[str], dict[str, str]]):
+        """Create a registry backed by a per-engine lookup function.
+
+        :param service_name: Human readable name of the service, used in messages.
+        :type service_name: str
+
+        :param lookup: A function which accepts an engine name and returns a mapping of
+            every available version of that engine to its parameter group family.  It
+            should be wrapped in `cached_metadata` so that results are persisted.
+        :type lookup: Callable[[str], Dict[str, str]]
+        """
+        self.service_name = service_name
+        self._lookup = lookup
+
+    def versions(self, engine: str) -> dict[str, str]:
+        """Return the available versions of an engine and their parameter families.
+
+        :param engine: The name of the engine.  e.g. postgres
+        :type engine: str
+
+        :returns: Mapping of engine version to parameter group family.  Empty if the
+                  engine is not offered by the service.
+
+        :rtype: Dict[str, str]
+        """
+        return self._lookup(engine)
+
+    def is_valid_engine(self, engine: str) -> bool:
+        return bool(self.versions(engine))
+
+    def is_valid_version(self, engine: Optional[str], engine_version: str) -> bool:
+        # The engine is None when it has already failed validation.
+        return bool(engine) and engine_version in self.versions(engine)  # type: ignore
+
+    def parameter_group_family(self, engine: str, engine_version: str) -> str:
+        """Return the parameter group family for the given engine version.
+
+        :param engine: The name of the engine.  e.g. redis
+        :type engine: str
+
+        :param engine_version: The version of the engine.  e.g. 6.x
+        :type engine_version: str
+
+        :raises ValueError: If the engine version is not offered by the service.
+
+        :returns: The name of the parameter group family.
+
+        :rtype: str
+        """
+        try:
+            return self.versions(engine)[engine_version]
+        except KeyError:
+            raise ValueError(
+                f"Version {engine_version} of the {engine} engine is not available "
+                f"in {self.service_name}."
+            )
@@ -1,11 +1,28 @@
+import hashlib
 import json
+import multiprocessing
+import os
 import re
-from typing import Any, Union
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
 
+import parliament
 from parliament import analyze_policy_string
 from parliament.finding import Finding
 
+from ol_infrastructure.lib.aws.metadata_cache import (
+    LONG_LIVED_METADATA_TTL,
+    MetadataCache,
+)
+
 IAM_POLICY_VERSION = "2012-10-17"
+# Path to the file used to persist the digests of policies that passed linting.  Set
+# to an empty string to only memoize results in process.
+IAM_LINT_CACHE_ENV = "OL_IAM_LINT_CACHE"
 
 
 def _is_parliament_finding_filtered(
@@ -29,6 +46,104 @@ def _is_parliament_finding_filtered(
     return any(action_matches)
 
 
+def _policy_findings(
+    policy_string: str, parliament_config: Optional[dict]
+) -> list[Finding]:
+    findings = analyze_policy_string(
+        policy_string,
+        include_community_auditors=True,
+        config=parliament_config,
+    ).findings
+    return [
+        finding
+        for finding in findings
+        if not _is_parliament_finding_filtered(finding, parliament_config or {})
+    ]
+
+
+def _policy_digest(
+    policy_document: Union[str, dict[str, Any]], parliament_config: Optional[dict]
+) -> str:
+    if isinstance(policy_document, str):
+        try:
+            policy_document = json.loads(policy_document)
+        except json.JSONDecodeError:
+            pass  # noqa: WPS420
+    cache_material = json.dumps(
+        [parliament.__version__, policy_document, parliament_config or {}],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(cache_material.encode("utf8")).hexdigest()
+
+
+class LintResultCache:
+    """Record of policy digests that parliament found no issues with.
+
+    Only clean results are stored since a policy with findings aborts the program.  The
+    digest covers the canonicalized policy, the parliament config and the parliament
+    version so that any change to them causes the policy to be analyzed again.
+    """
+
+    def __init__(self) -> None:
+        self._clean_digests: set[str] = set()
+        self._disk_cache: Optional[MetadataCache] = None
+        self._disk_cache_path: Optional[Path] = None
+        self._lock = threading.Lock()
+
+    def _persistent_cache(self) -> Optional[MetadataCache]:
+        cache_setting = os.environ.get(IAM_LINT_CACHE_ENV)
+        if cache_setting is None:
+            cache_home = os.environ.get(
+                "XDG_CACHE_HOME", Path.home().joinpath(".cache")
+            )
+            cache_path = Path(cache_home).joinpath("ol-infrastructure", "iam_lint.json")
+        elif cache_setting:
+            cache_path = Path(cache_setting)
+        else:
+            return None
+        if cache_path != self._disk_cache_path:
+            self._disk_cache = MetadataCache(cache_path)
+            self._disk_cache_path = cache_path
+        return self._disk_cache
+
+    def is_clean(self, policy_digest: str) -> bool:
+        with self._lock:
+            if policy_digest in self._clean_digests:
+                return True
+            disk_cache = self._persistent_cache()
+        if disk_cache is None:
+            return False
+        try:
+            disk_cache.get(policy_digest)
+        except KeyError:
+            return False
+        with self._lock:
+            self._clean_digests.add(policy_digest)
+        return True
+
+    def mark_clean(self, policy_digest: str) -> None:
+        with self._lock:
+            self._clean_digests.add(policy_digest)
+            disk_cache = self._persistent_cache()
+        if disk_cache is not None:
+            try:
+                disk_cache.set(policy_digest, True, LONG_LIVED_METADATA_TTL)
+            except OSError:
+                pass  # noqa: WPS420
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clean_digests.clear()
+            disk_cache = self._persistent_cache()
+        if disk_cache is not None:
+            disk_cache.clear()
+
+
+lint_result_cache = LintResultCache()
+
+
 def lint_iam_policy(
     policy_document: Union[str, dict[str, Any]],
     stringify: bool = False,
@@ -36,6 +151,9 @@ def lint_iam_policy(
 ) -> Union[str, dict[str, Any]]:
     """Lint the contents of an IAM policy and abort execution if issues are found.
 
+    Policies which pass are remembered in memory and on disk (see `IAM_LINT_CACHE_ENV`)
+    so that unchanged policies skip the parliament analysis on subsequent runs.
+
     :param policy_document: An IAM policy document represented as a JSON encoded string
         or a dictionary
     :type policy_document: Union[Text, Dict[Text, Any]]
@@ -58,23 +176,126 @@ def lint_iam_policy(
     stringified_document = None
     if not isinstance(policy_document, str):
         stringified_document = json.dumps(policy_document)
-    findings = analyze_policy_string(
-        stringified_document or policy_document,
-        include_community_auditors=True,
-        config=parliament_config,
-    ).findings
-    findings = [
-        finding
-        for finding in findings
-        if not _is_parliament_finding_filtered(finding, parliament_config or {})
-    ]
-    if findings:
-        raise Exception("Potential issues found with IAM policy document", findings)
+    policy_digest = _policy_digest(policy_document, parliament_config)
+    if not lint_result_cache.is_clean(policy_digest):
+        findings = _policy_findings(
+            stringified_document or policy_document, parliament_config  # type: ignore
+        )
+        if findings:
+            raise Exception("Potential issues found with IAM policy document", findings)
+        lint_result_cache.mark_clean(policy_digest)
     return (
         stringified_document if stringify and stringified_document else policy_document
     )
 
 
+@dataclass
+class IAMLintReport:
+    """Aggregated parliament findings for a batch of policy documents."""
+
+    findings: dict[str, list[Finding]] = field(default_factory=dict)
+
+    @property
+    def is_clean(self) -> bool:
+        return not any(self.findings.values())
+
+    def format_findings(self) -> str:
+        return "\n".join(
+            f"{policy_name}: {finding}"
+            for policy_name, policy_findings in sorted(self.findings.items())
+            for finding in policy_findings
+        )
+
+    def raise_for_findings(self) -> None:
+        """Abort execution if any of the policies in the batch have findings.
+
+        :raises Exception: With the findings of every failing policy, keyed by name.
+        """
+        if not self.is_clean:
+            raise Exception(
+                "Potential issues found with IAM policy documents",
+                {name: found for name, found in self.findings.items() if found},
+            )
+
+
+def _analyze_in_pool(
+    policy_strings: dict[str, str],
+    parliament_config: Optional[dict],
+    max_workers: Optional[int],
+) -> dict[str, list[Finding]]:
+    worker_count = min(len(policy_strings), max_workers or os.cpu_count() or 1)
+    if worker_count <= 1:
+        return {
+            name: _policy_findings(policy_string, parliament_config)
+            for name, policy_string in policy_strings.items()
+        }
+    # Spawned workers avoid forking a process that holds the Pulumi gRPC connection.
+    try:
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            pending_findings = {
+                name: executor.submit(
+                    _policy_findings, policy_string, parliament_config
+                )
+                for name, policy_string in policy_strings.items()
+            }
+            return {
+                name: findings_future.result()
+                for name, findings_future in pending_findings.items()
+            }
+    except (BrokenProcessPool, OSError):
+        return _analyze_in_pool(policy_strings, parliament_config, max_workers=1)
+
+
+def lint_iam_policies(
+    policy_documents: dict[str, Union[str, dict[str, Any]]],
+    parliament_config: Optional[dict] = None,
+    max_workers: Optional[int] = None,
+) -> IAMLintReport:
+    """Lint a batch of IAM policies in parallel and report the findings for all of them.
+
+    Policies that previously passed are served from the lint result cache and the rest
+    are analyzed across a pool of processes.  Unlike `lint_iam_policy` this does not
+    raise, call `raise_for_findings` on the report to abort execution.
+
+    :param policy_documents: Mapping of a descriptive name to an IAM policy document
+        represented as a JSON encoded string or a dictionary.
+    :type policy_documents: Dict[Text, Union[Text, Dict[Text, Any]]]
+
+    :param parliament_config: A configuration object to customize the strictness and
+        error checking of the Parliament library, applied to every policy.
+    :type parliament_config: Dict
+
+    :param max_workers: The maximum number of processes to analyze policies with.
+        Defaults to the number of CPUs.
+    :type max_workers: Optional[int]
+
+    :returns: A report with the findings for each policy, keyed by the given name.
+
+    :rtype: IAMLintReport
+    """
+    report = IAMLintReport(findings={name: [] for name in policy_documents})
+    policy_digests = {}
+    policy_strings = {}
+    for name, policy_document in policy_documents.items():
+        policy_digest = _policy_digest(policy_document, parliament_config)
+        if not lint_result_cache.is_clean(policy_digest):
+            policy_digests[name] = policy_digest
+            policy_strings[name] = (
+                policy_document
+                if isinstance(policy_document, str)
+                else json.dumps(policy_document)
+            )
+    analyzed_findings = _analyze_in_pool(policy_strings, parliament_config, max_workers)
+    for name, policy_findings in analyzed_findings.items():
+        report.findings[name] = policy_findings
+        if not policy_findings:
+            lint_result_cache.mark_clean(policy_digests[name])
+    return report
+
+
 def route53_policy_template(zone_id: str) -> dict[str, Any]:
     """Policy definition to allow Caddy to use Route 53 to resolve DNS challenges.
 
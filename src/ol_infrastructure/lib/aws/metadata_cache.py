@@ -0,0 +1,324 @@
+"""Persistent cache for slowly changing AWS metadata such as regions and engines.
+
+Lookups decorated with `cached_metadata` are stored in a JSON file shared by every
+Pulumi program and test run on the machine, with a time to live per entry.  Concurrent
+processes coordinate through an exclusive lock on a sidecar lock file, and writes
+replace the cache file atomically so readers never observe a partial document.
+
+Environment variables:
+
+- `OL_AWS_METADATA_CACHE`: Path to the cache file.  Defaults to
+  `$XDG_CACHE_HOME/ol-infrastructure/aws_metadata.json`.
+- `OL_AWS_METADATA_OFFLINE`: When set to a truthy value lookups are only served from
+  the cache, ignoring expiry, and a `MetadataCacheMissError` is raised for anything
+  that isn't present.
+
+Usage: python -m ol_infrastructure.lib.aws.metadata_cache {refresh,show,clear}
+"""
+import argparse
+import fcntl
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+from bridge.lib.magic_numbers import SECONDS_IN_ONE_DAY
+
+METADATA_CACHE_ENV = "OL_AWS_METADATA_CACHE"
+METADATA_OFFLINE_ENV = "OL_AWS_METADATA_OFFLINE"
+DEFAULT_METADATA_TTL = SECONDS_IN_ONE_DAY
+# Regions, zones and the parameter group family of a given engine version rarely or
+# never change once published.
+LONG_LIVED_METADATA_TTL = SECONDS_IN_ONE_DAY * 30
+
+CachedFunction = TypeVar("CachedFunction", bound=Callable[..., Any])
+
+
+class MetadataCacheMissError(Exception):
+    """Raised in offline mode when a lookup is not present in the cache."""
+
+
+class UnknownMetadataLookupError(Exception):
+    """Raised when the cache holds entries for a lookup that is not registered."""
+
+
+def metadata_cache_path() -> Path:
+    """Location of the shared metadata cache file.
+
+    :returns: The path configured by `OL_AWS_METADATA_CACHE` or the default location.
+
+    :rtype: Path
+    """
+    if os.environ.get(METADATA_CACHE_ENV):
+        return Path(os.environ[METADATA_CACHE_ENV])
+    cache_home = os.environ.get("XDG_CACHE_HOME", Path.home().joinpath(".cache"))
+    return Path(cache_home).joinpath("ol-infrastructure", "aws_metadata.json")
+
+
+def is_offline() -> bool:
+    """Whether metadata lookups are restricted to the cache.
+
+    :returns: True if `OL_AWS_METADATA_OFFLINE` is set to a truthy value.
+
+    :rtype: bool
+    """
+    return os.environ.get(METADATA_OFFLINE_ENV, "").lower() in {"1", "true", "yes"}
+
+
+class MetadataCache:
+    """JSON backed key/value store with per-entry expiry."""
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._loaded_mtime: int = -1
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.cache_path.with_suffix(f"{self.cache_path.suffix}.lock")
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            cache_mtime = self.cache_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return self._entries
+        if cache_mtime != self._loaded_mtime:
+            try:
+                self._entries = json.loads(self.cache_path.read_text())
+            except json.JSONDecodeError:
+                self._entries = {}
+            self._loaded_mtime = cache_mtime
+        return self._entries
+
+    def get(self, cache_key: str, allow_expired: bool = False) -> Any:
+        """Retrieve an entry from the cache.
+
+        :param cache_key: The key the value was stored under.
+        :type cache_key: str
+
+        :param allow_expired: Return the value even if its TTL has elapsed.
+        :type allow_expired: bool
+
+        :raises KeyError: If there is no usable entry for the key.
+
+        :returns: The cached value.
+
+        :rtype: Any
+        """
+        with self._lock:
+            cache_entry = self._load()[cache_key]
+        if not allow_expired and cache_entry["expires_at"] < time.time():
+            raise KeyError(cache_key)
+        return cache_entry["value"]
+
+    def set(self, cache_key: str, cache_value: Any, ttl: int) -> None:  # noqa: WPS125
+        """Store a value, merging with any entries written by other processes.
+
+        :param cache_key: The key to store the value under.
+        :type cache_key: str
+
+        :param cache_value: A JSON serializable value.
+        :type cache_value: Any
+
+        :param ttl: Number of seconds before the entry is considered stale.
+        :type ttl: int
+        """
+        self.update({cache_key: (cache_value, ttl)})
+
+    def update(self, cache_values: dict[str, tuple[Any, int]]) -> None:
+        """Store several values with a single locked write.
+
+        :param cache_values: Mapping of cache keys to a tuple of value and TTL.
+        :type cache_values: Dict[str, Tuple[Any, int]]
+        """
+        with self._lock, self._file_lock():
+            self._loaded_mtime = -1
+            entries = dict(self._load())
+            for cache_key, (cache_value, ttl) in cache_values.items():
+                entries[cache_key] = {
+                    "value": cache_value,
+                    "expires_at": time.time() + ttl,
+                }
+            self._write(entries)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock, self._file_lock():
+            self._write({})
+
+    def entries(self) -> dict[str, dict[str, Any]]:
+        """Snapshot of all cache entries, including expired ones.
+
+        :returns: Mapping of cache key to a dict with `value` and `expires_at` keys.
+
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        with self._lock:
+            return dict(self._load())
+
+    def _write(self, entries: dict[str, dict[str, Any]]) -> None:
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.cache_path.parent, delete=False, suffix=".tmp"
+        ) as temp_file:
+            json.dump(entries, temp_file, indent=2, sort_keys=True)
+        os.replace(temp_file.name, self.cache_path)
+        self._entries = entries
+        self._loaded_mtime = self.cache_path.stat().st_mtime_ns
+
+
+_caches: dict[Path, MetadataCache] = {}
+_cached_functions: dict[str, Callable[..., Any]] = {}
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Return the process-wide cache for the currently configured cache path.
+
+    :returns: The metadata cache instance.
+
+    :rtype: MetadataCache
+    """
+    cache_path = metadata_cache_path()
+    if cache_path not in _caches:
+        _caches[cache_path] = MetadataCache(cache_path)
+    return _caches[cache_path]
+
+
+def _cache_key(function_name: str, args: tuple[Any, ...]) -> str:
+    return f"{function_name}:{json.dumps(list(args))}"
+
+
+def cached_metadata(
+    ttl: int = DEFAULT_METADATA_TTL,
+) -> Callable[[CachedFunction], CachedFunction]:
+    """Cache the JSON serializable result of a lookup in the shared metadata cache.
+
+    The decorated function must only accept positional arguments that can be
+    represented in JSON.  A `refresh` attribute is added to the function which performs
+    the lookup unconditionally and stores the result.
+
+    :param ttl: Number of seconds that the result of the lookup remains valid.
+    :type ttl: int
+
+    :returns: A decorator for the lookup function.
+
+    :rtype: Callable
+    """
+
+    def decorator(func: CachedFunction) -> CachedFunction:
+        function_name = f"{func.__module__}.{func.__qualname__}"
+
+        def refresh(*args: Any) -> Any:  # noqa: WPS430
+            if is_offline():
+                raise MetadataCacheMissError(
+                    f"Unable to refresh {function_name} while in offline mode"
+                )
+            lookup_result = func(*args)
+            get_metadata_cache().set(
+                _cache_key(function_name, args), lookup_result, ttl
+            )
+            return lookup_result
+
+        @wraps(func)
+        def wrapper(*args: Any) -> Any:  # noqa: WPS430
+            cache_key = _cache_key(function_name, args)
+            try:
+                return get_metadata_cache().get(cache_key, allow_expired=is_offline())
+            except KeyError:
+                if is_offline():
+                    raise MetadataCacheMissError(
+                        f"No cached value for {cache_key} and offline mode is enabled"
+                    )
+            return refresh(*args)
+
+        wrapper.refresh = refresh  # type: ignore[attr-defined]
+        _cached_functions[function_name] = wrapper
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def refresh_metadata_cache() -> list[str]:
+    """Re-run every lookup that has an entry in the cache and the default lookups.
+
+    :raises UnknownMetadataLookupError: If the cache has entries for lookups that are
+        not registered, before any lookup is refreshed.
+
+    :returns: The cache keys that were refreshed.
+
+    :rtype: List[str]
+    """
+    # Imported here to register the cached lookups without creating an import cycle.
+    # The registry is read through the imported module because when this is run with
+    # `python -m` the lookups register themselves with that copy, not with __main__.
+    from ol_infrastructure.lib.aws import (  # noqa: WPS433
+        ec2_helper,
+        elasticache_helper,
+        metadata_cache,
+        rds_helper,
+    )
+
+    default_lookups: list[tuple[Callable[..., Any], tuple[Any, ...]]] = [
+        (ec2_helper.aws_regions, ()),
+        (ec2_helper.availability_zones, ("us-east-1",)),
+        (elasticache_helper.cache_engines, ()),
+        (rds_helper.db_engines, ()),
+    ]
+    lookups = {
+        _cache_key(f"{lookup.__module__}.{lookup.__qualname__}", args): (lookup, args)
+        for lookup, args in default_lookups
+    }
+    cached_functions = metadata_cache._cached_functions  # noqa: WPS437
+    unknown_keys = []
+    for cache_key in metadata_cache.get_metadata_cache().entries():
+        function_name, _, raw_args = cache_key.partition(":")
+        if function_name not in cached_functions:
+            unknown_keys.append(cache_key)
+            continue
+        lookups[cache_key] = (
+            cached_functions[function_name],
+            tuple(json.loads(raw_args)),
+        )
+    if unknown_keys:
+        raise UnknownMetadataLookupError(
+            f"No registered lookup for the cached entries {sorted(unknown_keys)}. "
+            "Clear the cache if the lookups were removed."
+        )
+    for lookup, args in lookups.values():
+        lookup.refresh(*args)
+    return sorted(lookups)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage the AWS metadata cache.")
+    parser.add_argument("action", choices=["refresh", "show", "clear"])
+    args = parser.parse_args()
+    metadata_cache = get_metadata_cache()
+    if args.action == "refresh":
+        for cache_key in refresh_metadata_cache():
+            print(f"Refreshed {cache_key}")
+    elif args.action == "clear":
+        metadata_cache.clear()
+        print(f"Cleared {metadata_cache.cache_path}")
+    else:
+        now = time.time()
+        for cache_key, cache_entry in sorted(metadata_cache.entries().items()):
+            remaining = int(cache_entry["expires_at"] - now)
+            status = f"expires in {remaining}s" if remaining > 0 else "expired"
+            print(f"{cache_key} ({status})")
+
+
+if __name__ == "__main__":
+    main()
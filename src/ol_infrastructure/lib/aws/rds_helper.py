@@ -1,10 +1,11 @@
 from collections import defaultdict
 from enum import Enum, unique
-from functools import lru_cache
 
-import boto3
+from botocore.exceptions import ClientError
 
-rds_client = boto3.client("rds")
+from ol_infrastructure.lib.aws.client_helper import aws_client
+from ol_infrastructure.lib.aws.engine_registry import EngineVersionRegistry
+from ol_infrastructure.lib.aws.metadata_cache import cached_metadata
 
 
 @unique
@@ -18,14 +19,16 @@ class DBInstanceTypes(str, Enum):
     high_mem_xlarge = "db.r6g.xlarge"
 
 
-@lru_cache
+@cached_metadata()
 def db_engines() -> dict[str, list[str]]:
     """Generate a list of database engines and their currently available versions on RDS.
 
     :returns: Dictionary of engine names and the list of available versions
     :rtype: Dict[str, List[str]]
     """
-    all_engines_paginator = rds_client.get_paginator("describe_db_engine_versions")
+    all_engines_paginator = aws_client("rds").get_paginator(
+        "describe_db_engine_versions"
+    )
     engines_versions = defaultdict(list)
     for engines_page in all_engines_paginator.paginate():
         for engine in engines_page["DBEngineVersions"]:
@@ -33,7 +36,35 @@ def db_engines() -> dict[str, list[str]]:
     return dict(engines_versions)
 
 
-@lru_cache
+@cached_metadata()
+def engine_version_families(engine: str) -> dict[str, str]:
+    """Map the available versions of a single RDS engine to their parameter families.
+
+    :param engine: Name of the RDS database engine (e.g. postgres, mysql, etc.)
+    :type engine: str
+
+    :returns: Dictionary of engine versions and their parameter group family.  Empty if
+              the engine is not offered by RDS.
+
+    :rtype: Dict[str, str]
+    """
+    engine_paginator = aws_client("rds").get_paginator("describe_db_engine_versions")
+    try:
+        return {
+            engine_version["EngineVersion"]: engine_version["DBParameterGroupFamily"]
+            for engines_page in engine_paginator.paginate(Engine=engine)
+            for engine_version in engines_page["DBEngineVersions"]
+        }
+    except ClientError as client_error:
+        # An engine that isn't offered is rejected rather than listed with no versions.
+        if client_error.response["Error"]["Code"] == "InvalidParameterValue":
+            return {}
+        raise
+
+
+rds_engine_registry = EngineVersionRegistry("RDS", engine_version_families)
+
+
 def parameter_group_family(engine: str, engine_version: str) -> str:
     """Return the valid parameter group family for the specified DB engine and version.
 
@@ -47,7 +78,4 @@ def parameter_group_family(engine: str, engine_version: str) -> str:
 
     :rtype: str
     """
-    engine_details = rds_client.describe_db_engine_versions(
-        Engine=engine, EngineVersion=engine_version
-    )
-    return engine_details["DBEngineVersions"][0]["DBParameterGroupFamily"]
+    return rds_engine_registry.parameter_group_family(engine, engine_version)
@@ -1,10 +1,127 @@
-import boto3
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache, partial
+from typing import Optional
+
 import pulumi
-from pulumi_aws import route53
+from pulumi_aws import acm, route53
 from pulumi_aws.acm.outputs import CertificateDomainValidationOption
 
+from ol_infrastructure.lib.aws.client_helper import aws_client
+from ol_infrastructure.lib.aws.tagging_helper import pulumi_managed_tag_queue
+
 FIVE_MINUTES = 60 * 5
-route53_client = boto3.client("route53")
+# ListTagsForResources accepts at most 10 resource IDs per request.
+ROUTE53_TAGS_BATCH_SIZE = 10
+
+
+def _normalize_domain(domain: str) -> str:
+    return domain.lower().rstrip(".")
+
+
+@dataclass(frozen=True)
+class HostedZone:
+    zone_id: str
+    name: str
+    private: bool
+    tags: dict[str, str] = field(default_factory=dict, compare=False)
+
+
+class HostedZoneIndex:
+    """Inventory of every hosted zone in the account along with their tags.
+
+    The zones are listed once, with pagination, and their tags fetched in batches the
+    first time a lookup is made.  Subsequent lookups are answered from memory.
+    """
+
+    @cached_property
+    def zones_by_name(self) -> dict[str, list[HostedZone]]:
+        route53_client = aws_client("route53")
+        hosted_zones = [
+            hosted_zone
+            for result_page in route53_client.get_paginator(
+                "list_hosted_zones"
+            ).paginate()
+            for hosted_zone in result_page["HostedZones"]
+        ]
+        # 'Id' attribute is of the form /hostedzone/<ZONE_ID>
+        zone_ids = [hosted_zone["Id"].split("/")[-1] for hosted_zone in hosted_zones]
+        zone_tags: dict[str, dict[str, str]] = {}
+        for batch_start in range(0, len(zone_ids), ROUTE53_TAGS_BATCH_SIZE):
+            tag_sets = route53_client.list_tags_for_resources(
+                ResourceType="hostedzone",
+                ResourceIds=zone_ids[
+                    batch_start : batch_start + ROUTE53_TAGS_BATCH_SIZE  # noqa: E203
+                ],
+            )["ResourceTagSets"]
+            for tag_set in tag_sets:
+                zone_tags[tag_set["ResourceId"]] = {
+                    tag["Key"]: tag.get("Value", "") for tag in tag_set.get("Tags", [])
+                }
+        zone_index: dict[str, list[HostedZone]] = {}
+        for hosted_zone, zone_id in zip(hosted_zones, zone_ids):
+            zone_name = _normalize_domain(hosted_zone["Name"])
+            zone_index.setdefault(zone_name, []).append(
+                HostedZone(
+                    zone_id=zone_id,
+                    name=zone_name,
+                    private=hosted_zone.get("Config", {}).get("PrivateZone", False),
+                    tags=zone_tags.get(zone_id, {}),
+                )
+            )
+        return zone_index
+
+    def exact_match(
+        self, domain: str, private_zone: bool = False
+    ) -> Optional[HostedZone]:
+        """Find the hosted zone whose name is the given domain.
+
+        :param domain: The name of the zone.  e.g. odl.mit.edu
+        :type domain: str
+
+        :param private_zone: Whether to look for a private rather than a public zone.
+        :type private_zone: bool
+
+        :returns: The matching zone, if there is one.
+
+        :rtype: Optional[HostedZone]
+        """
+        for hosted_zone in self.zones_by_name.get(_normalize_domain(domain), []):
+            if hosted_zone.private == private_zone:
+                return hosted_zone
+        return None
+
+    def parent_zone(
+        self, record_name: str, private_zone: bool = False
+    ) -> Optional[HostedZone]:
+        """Find the most specific hosted zone that a DNS record would belong to.
+
+        :param record_name: The fully qualified record name.  e.g. app.odl.mit.edu
+        :type record_name: str
+
+        :param private_zone: Whether to look for a private rather than a public zone.
+        :type private_zone: bool
+
+        :returns: The zone with the longest name that is a suffix of the record name.
+
+        :rtype: Optional[HostedZone]
+        """
+        labels = _normalize_domain(record_name).split(".")
+        for label_index in range(len(labels)):
+            hosted_zone = self.exact_match(".".join(labels[label_index:]), private_zone)
+            if hosted_zone:
+                return hosted_zone
+        return None
+
+
+@lru_cache
+def hosted_zone_index() -> HostedZoneIndex:
+    """Return the shared index of hosted zones.
+
+    :returns: The hosted zone index used for zone lookups.
+
+    :rtype: HostedZoneIndex
+    """
+    return HostedZoneIndex()
 
 
 def zone_opts(domain: str) -> pulumi.ResourceOptions:
@@ -14,46 +131,199 @@ def zone_opts(domain: str) -> pulumi.ResourceOptions:
         odl.mit.edu
     :type domain: str
 
-    :returns: A Pulumi ResourceOptions object that allows for importing unmanaged zones
+    :returns: A Pulumi ResourceOptions object that allows for importing unmanaged zones.
+              If no public zone exists for the domain the default options are returned
+              so that it is created.
 
     :rtype: pulumi.ResourceOptions
     """
-    zone = route53_client.list_hosted_zones_by_name(DNSName=domain)["HostedZones"][0]
-    zone_id = zone["Id"].split("/")[
-        -1
-    ]  # 'Id' attribute is of the form /hostedzone/<ZONE_ID>
-    tags = route53_client.list_tags_for_resource(
-        ResourceType="hostedzone", ResourceId=zone_id
-    )
-    if "pulumi_managed" in {tag["Key"] for tag in tags["ResourceTagSet"]["Tags"]}:
+    zone = hosted_zone_index().exact_match(domain)
+    if zone is None or "pulumi_managed" in zone.tags:
         opts = pulumi.ResourceOptions()
     else:
         opts = pulumi.ResourceOptions(
-            import_=zone_id, ignore_changes=["tags", "comment"]
+            import_=zone.zone_id, ignore_changes=["tags", "comment"]
         )
         if not pulumi.runtime.is_dry_run():
-            route53_client.change_tags_for_resource(
-                ResourceType="hostedzone",
-                ResourceId=zone_id,
-                AddTags=[{"Key": "pulumi_managed", "Value": "true"}],
-            )
+            pulumi_managed_tag_queue.enqueue("route53", zone.zone_id)
     return opts
 
 
+def _validation_record_resource_name(name_prefix: str, record_name: str) -> str:
+    # e.g. _3f1c...9ab.lms.mitx.mit.edu. -> <prefix>-3f1c...9ab.lms.mitx.mit.edu
+    return f"{name_prefix}-{record_name.rstrip('.').lstrip('_')}"
+
+
+def _validation_record_key(validation: CertificateDomainValidationOption) -> str:
+    # Output types are dicts, and combining outputs with `Output.all` lifts them into
+    # plain dicts with the same keys, so use item access to support both.  The key is a
+    # string since `Output.all` also lifts the dict of records keyed by it.
+    return f"{validation['resource_record_name']} {validation['resource_record_value']}"
+
+
 def acm_certificate_validation_records(
-    validation_options: list[CertificateDomainValidationOption], zone_id: str
+    validation_options: list[CertificateDomainValidationOption],
+    zone_id: pulumi.Input[str],
+    name_prefix: str = "acm-cert-validation",
+    legacy_name_prefix: Optional[str] = None,
 ) -> list[route53.Record]:
-    records_array = []
+    """Create the DNS records that ACM uses to validate the domains of certificates.
+
+    ACM returns the same CNAME for a wildcard and its apex domain, and for the same
+    domain across certificates, so records are deduplicated by name and value.  The
+    resource names are derived from the record name so that reordering the subject
+    alternative names of a certificate does not replace any records.
+
+    :param validation_options: The domain validation options of one or more
+        certificates.
+    :type validation_options: List[CertificateDomainValidationOption]
+
+    :param zone_id: The ID of the hosted zone to create the records in.
+    :type zone_id: pulumi.Input[str]
+
+    :param name_prefix: Prefix for the names of the record resources.
+    :type name_prefix: str
+
+    :param legacy_name_prefix: The prefix of records that were previously named
+        `<legacy_name_prefix>-<index>`, which are aliased to avoid replacing them.
+        Legacy records for duplicate CNAMEs keep their names, since deleting them
+        would remove the shared DNS record.
+    :type legacy_name_prefix: Optional[str]
+
+    :returns: A record per distinct validation CNAME.
+
+    :rtype: List[route53.Record]
+    """
+    return list(
+        _validation_records_by_key(
+            validation_options, zone_id, name_prefix, legacy_name_prefix
+        ).values()
+    )
+
+
+def _validation_records_by_key(
+    validation_options: list[CertificateDomainValidationOption],
+    zone_id: pulumi.Input[str],
+    name_prefix: str,
+    legacy_name_prefix: Optional[str],
+) -> dict[str, route53.Record]:
+    records: dict[str, route53.Record] = {}
     for index, validation in enumerate(validation_options):
-        records_array.append(
-            route53.Record(
-                f"edxapp-acm-cert-validation-route53-record-{index}",
-                name=validation.resource_record_name,
-                zone_id=zone_id,
-                type=validation.resource_record_type,
-                records=[validation.resource_record_value],
-                ttl=FIVE_MINUTES,
-                allow_overwrite=True,
-            )
+        record_key = _validation_record_key(validation)
+        legacy_name = f"{legacy_name_prefix}-{index}" if legacy_name_prefix else None
+        if record_key in records:
+            if legacy_name:
+                # Deleting the legacy resource of a duplicate would delete the DNS
+                # record that the deduplicated resource manages, so it is kept as is.
+                _validation_record(legacy_name, validation, zone_id)
+            continue
+        records[record_key] = _validation_record(
+            _validation_record_resource_name(
+                name_prefix, validation["resource_record_name"]
+            ),
+            validation,
+            zone_id,
+            aliases=[pulumi.Alias(name=legacy_name)] if legacy_name else None,
         )
-    return records_array
+    return records
+
+
+def _validation_record(
+    resource_name: str,
+    validation: CertificateDomainValidationOption,
+    zone_id: pulumi.Input[str],
+    aliases: Optional[list[pulumi.Alias]] = None,
+) -> route53.Record:
+    return route53.Record(
+        resource_name,
+        name=validation["resource_record_name"],
+        zone_id=zone_id,
+        type=validation["resource_record_type"],
+        records=[validation["resource_record_value"]],
+        ttl=FIVE_MINUTES,
+        allow_overwrite=True,
+        opts=pulumi.ResourceOptions(aliases=aliases),
+    )
+
+
+@dataclass
+class ACMValidationResources:
+    records: pulumi.Output[list[route53.Record]]
+    validations: dict[str, acm.CertificateValidation]
+
+
+def acm_certificate_validation(
+    certificates: dict[str, acm.Certificate],
+    zone_id: pulumi.Input[str],
+    name_prefix: str = "acm-cert-validation",
+    wait_for_validation: bool = True,
+    legacy_name_prefix: Optional[str] = None,
+) -> ACMValidationResources:
+    """Create deduplicated validation records for a set of DNS validated certificates.
+
+    :param certificates: The certificates to validate, keyed by the resource name to use
+        for their `acm.CertificateValidation`.
+    :type certificates: Dict[str, acm.Certificate]
+
+    :param zone_id: The ID of the hosted zone to create the records in.
+    :type zone_id: pulumi.Input[str]
+
+    :param name_prefix: Prefix for the names of the record resources.
+    :type name_prefix: str
+
+    :param wait_for_validation: Create an `acm.CertificateValidation` for each
+        certificate which waits until ACM has issued it.
+    :type wait_for_validation: bool
+
+    :param legacy_name_prefix: See `acm_certificate_validation_records`.
+    :type legacy_name_prefix: Optional[str]
+
+    :returns: The validation records and, if requested, the validation waiters.
+
+    :rtype: ACMValidationResources
+    """
+    validation_options = pulumi.Output.all(
+        *(
+            certificate.domain_validation_options
+            for certificate in certificates.values()
+        )
+    )
+    records_by_key = validation_options.apply(
+        lambda option_sets: _validation_records_by_key(
+            [option for option_set in option_sets for option in option_set],
+            zone_id,
+            name_prefix,
+            legacy_name_prefix,
+        )
+    )
+    validations = {}
+    if wait_for_validation:
+        for certificate_index, (certificate_name, certificate) in enumerate(
+            certificates.items()
+        ):
+            validations[certificate_name] = acm.CertificateValidation(
+                certificate_name,
+                certificate_arn=certificate.arn,
+                validation_record_fqdns=pulumi.Output.all(
+                    validation_options, records_by_key
+                ).apply(partial(_certificate_record_fqdns, certificate_index)),
+            )
+    return ACMValidationResources(
+        records=records_by_key.apply(lambda records: list(records.values())),
+        validations=validations,
+    )
+
+
+def _certificate_record_fqdns(
+    certificate_index: int,
+    options_and_records: tuple[
+        list[list[CertificateDomainValidationOption]],
+        dict[str, route53.Record],
+    ],
+) -> list[pulumi.Output[str]]:
+    option_sets, records_by_key = options_and_records
+    record_keys = {
+        _validation_record_key(option): None
+        for option in option_sets[certificate_index]
+    }
+    return [records_by_key[record_key].fqdn for record_key in record_keys]
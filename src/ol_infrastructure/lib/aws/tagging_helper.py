@@ -0,0 +1,188 @@
+"""Deferred application of the `pulumi_managed` tag to imported resources.
+
+When an unmanaged resource is imported into a stack we tag it so that subsequent runs
+know that it is already under Pulumi's control.  Rather than issuing a mutating API
+call per resource in the middle of program evaluation, the resource IDs are queued and
+tagged in as few calls as possible when the program exits.  If a batch is rejected
+it is split in half and retried, so that a single bad ID only fails its own request.
+"""
+import atexit
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from ol_infrastructure.lib.aws.client_helper import aws_client
+
+PULUMI_MANAGED_TAG = {"Key": "pulumi_managed", "Value": "true"}
+# EC2 accepts up to 1000 resource IDs per CreateTags call, whereas Route53 only
+# supports changing the tags of a single resource per request.
+EC2_CREATE_TAGS_BATCH_SIZE = 1000
+ROUTE53_CHANGE_TAGS_BATCH_SIZE = 1
+MAX_TAGGING_ATTEMPTS = 6
+BASE_BACKOFF_SECONDS = 0.5
+THROTTLING_ERROR_CODES = frozenset(
+    (
+        "PriorRequestNotComplete",
+        "RequestLimitExceeded",
+        "Throttling",
+        "ThrottlingException",
+    )
+)
+
+# Tagging runs at exit, after the Pulumi engine connection may have been closed, so
+# failures are reported through logging rather than pulumi.log.
+log = logging.getLogger(__name__)
+
+
+def _batches(resource_ids: list[str], batch_size: int) -> Iterator[list[str]]:
+    for batch_start in range(0, len(resource_ids), batch_size):
+        yield resource_ids[batch_start : batch_start + batch_size]  # noqa: E203
+
+
+def _with_backoff(api_call: Callable[[], Any]) -> Any:
+    for attempt in range(MAX_TAGGING_ATTEMPTS):
+        try:
+            return api_call()
+        except ClientError as client_error:
+            error_code = client_error.response.get("Error", {}).get("Code")
+            if (
+                error_code not in THROTTLING_ERROR_CODES
+                or attempt == MAX_TAGGING_ATTEMPTS - 1
+            ):
+                raise
+            time.sleep(BASE_BACKOFF_SECONDS * 2**attempt * random.uniform(1, 2))
+
+
+def _tag_ec2_resources(resource_ids: list[str]) -> None:
+    ec2_client = aws_client("ec2")
+    _with_backoff(
+        lambda: ec2_client.create_tags(
+            Resources=resource_ids, Tags=[PULUMI_MANAGED_TAG]
+        )
+    )
+
+
+def _tag_route53_zones(zone_ids: list[str]) -> None:
+    route53_client = aws_client("route53")
+    for zone_id in zone_ids:
+        _with_backoff(
+            lambda: route53_client.change_tags_for_resource(  # noqa: WPS430
+                ResourceType="hostedzone",
+                ResourceId=zone_id,
+                AddTags=[PULUMI_MANAGED_TAG],
+            )
+        )
+
+
+TAGGING_BACKENDS: dict[str, tuple[Callable[[list[str]], None], int]] = {
+    "ec2": (_tag_ec2_resources, EC2_CREATE_TAGS_BATCH_SIZE),
+    "route53": (_tag_route53_zones, ROUTE53_CHANGE_TAGS_BATCH_SIZE),
+}
+
+
+def _tag_batch(
+    tag_resources: Callable[[list[str]], None], batch: list[str]
+) -> list[str]:
+    """Tag a batch of resources, bisecting it to isolate the IDs that are rejected.
+
+    :param tag_resources: The tagging function of the service that owns the resources.
+    :type tag_resources: Callable[[List[str]], None]
+
+    :param batch: The IDs of the resources to tag.
+    :type batch: List[str]
+
+    :returns: The IDs that could not be tagged.
+
+    :rtype: List[str]
+    """
+    try:
+        tag_resources(batch)
+    except ClientError as client_error:
+        if len(batch) == 1:
+            log.warning(
+                "Unable to apply the pulumi_managed tag to %s: %s", batch, client_error
+            )
+            return batch
+        midpoint = len(batch) // 2
+        return [
+            *_tag_batch(tag_resources, batch[:midpoint]),
+            *_tag_batch(tag_resources, batch[midpoint:]),
+        ]
+    except BotoCoreError as botocore_error:
+        # Missing credentials or an unreachable endpoint affect every ID alike, so
+        # there is nothing to gain from splitting the batch.
+        log.warning(
+            "Unable to apply the pulumi_managed tag to %s: %s", batch, botocore_error
+        )
+        return batch
+    return []
+
+
+class PulumiManagedTagQueue:
+    """Collect resource IDs during evaluation and tag them in batches on flush."""
+
+    def __init__(self) -> None:
+        self._pending: dict[str, dict[str, None]] = {
+            service: {} for service in TAGGING_BACKENDS
+        }
+        self._lock = threading.Lock()
+        self._flush_registered = False
+
+    def enqueue(self, service: str, resource_id: str) -> None:
+        """Queue a resource to be tagged as managed by Pulumi.
+
+        The queue is flushed automatically when the program exits.
+
+        :param service: The API that owns the resource, either `ec2` or `route53`.
+        :type service: str
+
+        :param resource_id: The ID of the resource to tag.
+        :type resource_id: str
+        """
+        with self._lock:
+            self._pending[service][resource_id] = None
+            if not self._flush_registered:
+                atexit.register(self.flush)
+                self._flush_registered = True
+
+    def pending(self) -> dict[str, list[str]]:
+        """The resource IDs waiting to be tagged, grouped by service.
+
+        :returns: Mapping of service name to queued resource IDs.
+
+        :rtype: Dict[str, List[str]]
+        """
+        with self._lock:
+            return {
+                service: list(resource_ids)
+                for service, resource_ids in self._pending.items()
+            }
+
+    def flush(self) -> dict[str, list[str]]:
+        """Tag every queued resource using the largest batch each API supports.
+
+        Failures are logged rather than raised since this runs when the program exits.
+
+        :returns: The IDs that could not be tagged, grouped by service.
+
+        :rtype: Dict[str, List[str]]
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = {service: {} for service in TAGGING_BACKENDS}
+        failed: dict[str, list[str]] = {}
+        for service, resource_ids in pending.items():
+            tag_resources, batch_size = TAGGING_BACKENDS[service]
+            for batch in _batches(list(resource_ids), batch_size):
+                failed_ids = _tag_batch(tag_resources, batch)
+                if failed_ids:
+                    failed.setdefault(service, []).extend(failed_ids)
+        return failed
+
+
+pulumi_managed_tag_queue = PulumiManagedTagQueue()
@@ -0,0 +1,358 @@
+"""Determine which Pulumi projects are affected by a set of changed files.
+
+A project is affected when a file in its directory changes, when it imports a changed
+module from `ol_infrastructure` or `bridge` (directly or indirectly), or when it reads a
+changed secrets file.  Projects which consume the outputs of an affected project's
+stacks through a `StackReference` are included as well, so CI can preview exactly the
+stacks that a commit could change.
+
+Usage: python -m ol_infrastructure.lib.change_impact [--base REF] [--head REF]
+    [--consumer-depth N] [--environment ENV] [--format {projects,stacks,json}]
+    [FILE ...]
+"""
+import argparse
+import ast
+import json
+import subprocess  # noqa: S404
+import sys
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from functools import cached_property
+from pathlib import Path
+from typing import Optional
+
+from ol_infrastructure.lib.stack_graph import StackGraph, build_stack_graph
+
+SOURCE_ROOT = Path(__file__).parent.parent.parent
+REPO_ROOT = SOURCE_ROOT.parent
+TOP_LEVEL_PACKAGES = ("ol_infrastructure", "bridge")
+SECRETS_DIR = SOURCE_ROOT.joinpath("bridge", "secrets")
+SECRET_FILE_SUFFIXES = (".yaml", ".json", ".env")
+# Changes to these files can affect every program.
+GLOBAL_FILES = frozenset(("pyproject.toml", "poetry.lock"))
+DEFAULT_CONSUMER_DEPTH = 1
+
+
+def _module_name(module_path: Path) -> str:
+    module_parts = module_path.relative_to(SOURCE_ROOT).with_suffix("").parts
+    if module_parts[-1] == "__init__":
+        module_parts = module_parts[:-1]
+    return ".".join(module_parts)
+
+
+def _string_patterns(module: ast.Module) -> set[str]:
+    # String literals, with the formatted values of f-strings replaced by wildcards,
+    # e.g. f"edxapp/{stack_info.env_suffix}.yaml" becomes "edxapp/*.yaml".
+    patterns = set()
+    formatted_parts = set()
+    for node in ast.walk(module):
+        if isinstance(node, ast.JoinedStr):
+            patterns.add(
+                "".join(
+                    part.value if isinstance(part, ast.Constant) else "*"
+                    for part in node.values
+                )
+            )
+            formatted_parts.update(id(part) for part in node.values)
+        elif (
+            isinstance(node, ast.Constant)
+            and isinstance(node.value, str)
+            and id(node) not in formatted_parts
+        ):
+            patterns.add(node.value)
+    return patterns
+
+
+def _reads_secret(pattern: str, secret_path: str) -> bool:
+    """Whether a string from a module could be the path of a changed secrets file.
+
+    The pattern has to match the whole path one directory at a time, so sibling files
+    in the same directory don't match.  Patterns without a directory are compared to
+    the file name, since paths are also built with e.g.
+    `Path().joinpath("pulumi", f"vault.{stack_info.env_suffix}.yaml")`, but only when
+    they end in the extension of a secrets file, so that names such as f"mitx-{env}"
+    don't match.  Patterns that start with a wildcard, such as f"{name}.yaml", have no
+    static part to compare.
+    """
+    if not pattern or pattern.startswith("*"):
+        return False
+    pattern_parts = pattern.split("/")
+    secret_parts = secret_path.split("/")
+    if len(pattern_parts) == 1:
+        if not pattern.endswith(SECRET_FILE_SUFFIXES):
+            return False
+        secret_parts = secret_parts[-1:]
+    return len(pattern_parts) == len(secret_parts) and all(
+        fnmatchcase(secret_part, pattern_part)
+        for secret_part, pattern_part in zip(secret_parts, pattern_parts)
+    )
+
+
+@dataclass
+class ImportGraph:
+    """Imports between the modules of the first party packages."""
+
+    modules: dict[str, Path] = field(default_factory=dict)
+    imports: dict[str, set[str]] = field(default_factory=dict)
+    strings: dict[str, set[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, source_root: Path = SOURCE_ROOT) -> "ImportGraph":
+        graph = cls()
+        parsed_modules = {}
+        for package in TOP_LEVEL_PACKAGES:
+            for module_path in sorted(source_root.joinpath(package).rglob("*.py")):
+                module_name = _module_name(module_path)
+                graph.modules[module_name] = module_path
+                try:
+                    parsed_modules[module_name] = ast.parse(module_path.read_text())
+                except SyntaxError:
+                    parsed_modules[module_name] = ast.Module(body=[], type_ignores=[])
+        for module_name, module in parsed_modules.items():
+            graph.imports[module_name] = graph.resolve_imports(module_name, module)
+            graph.strings[module_name] = _string_patterns(module)
+        return graph
+
+    def _resolve(self, imported_name: str) -> set[str]:
+        # Importing a.b.c also executes the a and a.b packages.
+        name_parts = imported_name.split(".")
+        return {
+            ".".join(name_parts[:end])
+            for end in range(1, len(name_parts) + 1)
+            if ".".join(name_parts[:end]) in self.modules
+        }
+
+    def resolve_imports(self, module_name: str, module: ast.Module) -> set[str]:
+        is_package = self.modules[module_name].name == "__init__.py"
+        package = module_name if is_package else module_name.rpartition(".")[0]
+        imported = set()
+        for node in ast.walk(module):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imported |= self._resolve(alias.name)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    package_parts = package.split(".")
+                    base = ".".join(
+                        package_parts[: len(package_parts) - node.level + 1]
+                    )
+                    source = f"{base}.{node.module}" if node.module else base
+                else:
+                    source = node.module or ""
+                imported |= self._resolve(source)
+                for alias in node.names:
+                    imported |= self._resolve(f"{source}.{alias.name}") - {source}
+        imported.discard(module_name)
+        return imported
+
+    @cached_property
+    def importers(self) -> dict[str, set[str]]:
+        reverse_imports: dict[str, set[str]] = defaultdict(set)
+        for module_name, imported_modules in self.imports.items():
+            for imported_module in imported_modules:
+                reverse_imports[imported_module].add(module_name)
+        return reverse_imports
+
+    def affected_modules(self, changed_modules: Iterable[str]) -> set[str]:
+        """Find the modules that import any of the changed modules, transitively.
+
+        :param changed_modules: The names of the modules which changed.
+        :type changed_modules: Iterable[str]
+
+        :returns: The changed modules and every module that depends on them.
+
+        :rtype: Set[str]
+        """
+        affected = set()
+        pending = list(changed_modules)
+        while pending:
+            module_name = pending.pop()
+            if module_name in affected:
+                continue
+            affected.add(module_name)
+            pending.extend(self.importers.get(module_name, set()))
+        return affected
+
+
+@dataclass
+class ChangeImpact:
+    projects: set[Path]
+    stacks: set[str]
+    changed_files: list[Path]
+    # Changed files outside of the repository, which can't affect any project.
+    ignored_files: list[Path] = field(default_factory=list)
+
+
+def changed_files_from_git(base: str, head: Optional[str] = None) -> list[Path]:
+    """List the files changed between two git revisions.
+
+    :param base: The revision to compare against.  e.g. origin/main
+    :type base: str
+
+    :param head: The revision with the changes.  Defaults to the working tree.
+    :type head: Optional[str]
+
+    :returns: The absolute paths of the changed files.
+
+    :rtype: List[Path]
+    """
+    diff_range = [f"{base}...{head}"] if head else [base]
+    diff_output = subprocess.run(  # noqa: S603, S607
+        ["git", "diff", "--name-only", *diff_range],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return [REPO_ROOT.joinpath(file_name) for file_name in diff_output.splitlines()]
+
+
+def _project_for(file_path: Path, project_dirs: list[Path]) -> Optional[Path]:
+    # The most deeply nested project wins, e.g. substructure/vault/setup.
+    for project_dir in project_dirs:
+        if file_path.is_relative_to(project_dir):
+            return project_dir
+    return None
+
+
+def analyze_changes(  # noqa: WPS210, WPS231
+    changed_files: list[Path],
+    stack_graph: Optional[StackGraph] = None,
+    import_graph: Optional[ImportGraph] = None,
+    consumer_depth: int = DEFAULT_CONSUMER_DEPTH,
+) -> ChangeImpact:
+    """Compute the projects and stacks affected by the given file changes.
+
+    :param changed_files: The absolute paths of the changed files.  Files outside of
+        the repository are reported in `ignored_files`.
+    :type changed_files: List[Path]
+
+    :param stack_graph: The stack dependency graph.  Built if not provided.
+    :type stack_graph: Optional[StackGraph]
+
+    :param import_graph: The first party import graph.  Built if not provided.
+    :type import_graph: Optional[ImportGraph]
+
+    :param consumer_depth: How many levels of stacks consuming the outputs of affected
+        stacks to include.  0 only includes the stacks whose code changed.
+    :type consumer_depth: int
+
+    :returns: The affected projects and stacks.
+
+    :rtype: ChangeImpact
+    """
+    stack_graph = stack_graph or build_stack_graph()
+    import_graph = import_graph or ImportGraph.build()
+    stacks_by_project: dict[Path, set[str]] = defaultdict(set)
+    for stack, project_dir in stack_graph.projects.items():
+        stacks_by_project[project_dir].add(stack)
+    project_dirs = sorted(
+        stacks_by_project, key=lambda project_dir: len(project_dir.parts), reverse=True
+    )
+    module_paths = {
+        module_path.resolve(): module_name
+        for module_name, module_path in import_graph.modules.items()
+    }
+
+    affected_projects: set[Path] = set()
+    changed_modules = set()
+    changed_secrets = []
+    ignored_files = []
+    for changed_file in changed_files:
+        changed_file = changed_file.resolve()
+        if not changed_file.is_relative_to(REPO_ROOT):
+            ignored_files.append(changed_file)
+            continue
+        if changed_file.relative_to(REPO_ROOT).as_posix() in GLOBAL_FILES:
+            affected_projects.update(stacks_by_project)
+        project_dir = _project_for(changed_file, project_dirs)
+        if project_dir:
+            affected_projects.add(project_dir)
+        if changed_file in module_paths:
+            changed_modules.add(module_paths[changed_file])
+        elif changed_file.is_relative_to(SECRETS_DIR):
+            changed_secrets.append(changed_file.relative_to(SECRETS_DIR).as_posix())
+
+    affected_modules = import_graph.affected_modules(changed_modules)
+    # Secrets are read by path relative to the secrets directory, usually through an
+    # f-string, e.g. f"edxapp/{env}.yaml"
+    for secret_path in changed_secrets:
+        affected_modules |= import_graph.affected_modules(
+            module_name
+            for module_name, patterns in import_graph.strings.items()
+            if any(_reads_secret(pattern, secret_path) for pattern in patterns)
+        )
+    for module_name in affected_modules:
+        project_dir = _project_for(
+            import_graph.modules[module_name].resolve(), project_dirs
+        )
+        if project_dir:
+            affected_projects.add(project_dir)
+
+    affected_stacks = {
+        stack
+        for project_dir in affected_projects
+        for stack in stacks_by_project[project_dir]
+    }
+    dependents = stack_graph.dependents()
+    consumers = set(affected_stacks)
+    for _ in range(consumer_depth):
+        consumers = {
+            consumer
+            for stack in consumers
+            for consumer in dependents.get(stack, set())
+            if consumer not in affected_stacks
+        }
+        affected_stacks |= consumers
+    affected_projects |= {stack_graph.projects[stack] for stack in affected_stacks}
+    return ChangeImpact(
+        projects=affected_projects,
+        stacks=affected_stacks,
+        changed_files=changed_files,
+        ignored_files=ignored_files,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="List the Pulumi projects affected by a change."
+    )
+    parser.add_argument("files", nargs="*", type=Path, help="Changed files")
+    parser.add_argument("--base", default="origin/main", help="Git revision to diff")
+    parser.add_argument("--head", help="Git revision with the changes")
+    parser.add_argument("--consumer-depth", type=int, default=DEFAULT_CONSUMER_DEPTH)
+    parser.add_argument("-e", "--environment", help="Only list stacks for e.g. QA")
+    parser.add_argument(
+        "--format", choices=["projects", "stacks", "json"], default="projects"
+    )
+    args = parser.parse_args()
+    changed_files = [
+        changed_file.resolve() for changed_file in args.files
+    ] or changed_files_from_git(args.base, args.head)
+    stack_graph = build_stack_graph()
+    impact = analyze_changes(
+        changed_files, stack_graph=stack_graph, consumer_depth=args.consumer_depth
+    )
+    stacks = sorted(
+        impact.stacks & stack_graph.select(args.environment)
+        if args.environment
+        else impact.stacks
+    )
+    for ignored_file in impact.ignored_files:
+        print(f"Ignoring {ignored_file}, outside of {REPO_ROOT}", file=sys.stderr)
+    projects = sorted(
+        project_dir.relative_to(REPO_ROOT).as_posix()
+        if project_dir.is_relative_to(REPO_ROOT)
+        else str(project_dir)
+        for project_dir in impact.projects
+    )
+    if args.format == "json":
+        print(json.dumps({"projects": projects, "stacks": stacks}, indent=2))
+    else:
+        print("\n".join(stacks if args.format == "stacks" else projects))
+
+
+if __name__ == "__main__":
+    main()
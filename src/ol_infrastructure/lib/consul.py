@@ -1,3 +1,4 @@
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Union
 
@@ -5,23 +6,33 @@ import pulumi
 import pulumi_consul as consul
 
 from bridge.secrets.sops import read_yaml_secrets
+from ol_infrastructure.lib.provider_binding import bind_provider
 from ol_infrastructure.lib.pulumi_helper import StackInfo
 
 
-def get_consul_provider(
-    stack_info: StackInfo, wrap_in_pulumi_options: bool = True
-) -> Union[consul.Provider, pulumi.ResourceOptions]:
+@lru_cache
+def _consul_provider(env_suffix: str) -> consul.Provider:
     consul_config = pulumi.Config("consul")
-    consul_provider = consul.Provider(
+    return consul.Provider(
         "consul-provider",
         address=consul_config.require("address"),
         scheme="https",
         http_auth="pulumi:{}".format(
-            read_yaml_secrets(Path(f"pulumi/consul.{stack_info.env_suffix}.yaml"))[
+            read_yaml_secrets(Path(f"pulumi/consul.{env_suffix}.yaml"))[
                 "basic_auth_password"
             ]
         ),
     )
+
+
+def get_consul_provider(
+    stack_info: StackInfo, wrap_in_pulumi_options: bool = True
+) -> Union[consul.Provider, pulumi.ResourceOptions]:
+    consul_provider = _consul_provider(stack_info.env_suffix)
     if wrap_in_pulumi_options:
         consul_provider = pulumi.ResourceOptions(provider=consul_provider)
     return consul_provider
+
+
+def setup_consul_provider(stack_info: StackInfo) -> None:
+    bind_provider("consul", partial(_consul_provider, stack_info.env_suffix))
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -5,16 +6,26 @@ import pulumi
 import pulumi_fastly as fastly
 
 from bridge.secrets.sops import read_yaml_secrets
+from ol_infrastructure.lib.provider_binding import bind_provider
 
 
-def get_fastly_provider(
-    wrap_in_pulumi_options: bool = True,
-) -> Union[fastly.Provider, pulumi.ResourceOptions]:
+@lru_cache
+def _fastly_provider() -> fastly.Provider:
     pulumi.Config("fastly")
-    fastly_provider = fastly.Provider(
+    return fastly.Provider(
         "fastly-provider",
         api_key=read_yaml_secrets(Path("fastly.yaml"))["admin_api_key"],
     )
+
+
+def get_fastly_provider(
+    wrap_in_pulumi_options: bool = True,
+) -> Union[fastly.Provider, pulumi.ResourceOptions]:
+    fastly_provider = _fastly_provider()
     if wrap_in_pulumi_options:
         fastly_provider = pulumi.ResourceOptions(provider=fastly_provider)
     return fastly_provider
+
+
+def setup_fastly_provider() -> None:
+    bind_provider("fastly", _fastly_provider)
@@ -0,0 +1,32 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
+import pulumi
+import pulumi_mongodbatlas as atlas
+
+from bridge.secrets.sops import read_yaml_secrets
+from ol_infrastructure.lib.provider_binding import bind_provider
+
+
+@lru_cache
+def _mongodb_atlas_provider() -> atlas.Provider:
+    atlas_creds = read_yaml_secrets(Path("pulumi/mongodb_atlas.yaml"))
+    return atlas.Provider(
+        "mongodb-atlas-provider",
+        private_key=atlas_creds["private_key"],
+        public_key=atlas_creds["public_key"],
+    )
+
+
+def get_mongodb_atlas_provider(
+    wrap_in_pulumi_options: bool = True,
+) -> Union[atlas.Provider, pulumi.ResourceOptions]:
+    atlas_provider = _mongodb_atlas_provider()
+    if wrap_in_pulumi_options:
+        atlas_provider = pulumi.ResourceOptions(provider=atlas_provider)
+    return atlas_provider
+
+
+def setup_mongodb_atlas_provider() -> None:
+    bind_provider("mongodbatlas", _mongodb_atlas_provider)
@@ -0,0 +1,121 @@
+"""Attach explicit providers to resources through a single stack transformation.
+
+Rather than every resource having to be passed `opts=ResourceOptions(provider=...)`,
+a program binds a provider factory to a Pulumi package once, e.g. with
+`setup_vault_provider` or `setup_consul_provider`, and every resource of that package
+which is created afterwards without an explicit provider is assigned it.  All bindings
+share one transformation which dispatches on a table of package names.  The package of
+each resource type token is only derived the first time that type is seen, so the
+per-resource cost is a dictionary lookup.  Providers are only created once a resource
+that needs them is registered.
+"""
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import pulumi
+
+ProviderFactory = Callable[[], pulumi.ProviderResource]
+
+
+@dataclass
+class ProviderBindingStats:
+    resources_seen: int = 0
+    resources_bound: int = 0
+    bound_by_package: Counter[str] = field(default_factory=Counter)
+    seconds: float = 0
+
+
+class ProviderBinding:
+    """Stack transformation which assigns providers to resources by package."""
+
+    def __init__(self):
+        self.stats = ProviderBindingStats()
+        self._factories: dict[str, ProviderFactory] = {}
+        self._providers: dict[str, pulumi.ProviderResource] = {}
+        # Maps a resource type token, e.g. vault:index/mount:Mount, to the package it
+        # is bound to, or None if its package has no provider bound.
+        self._type_packages: dict[str, Optional[str]] = {}
+
+    def bind(self, package: str, provider_factory: ProviderFactory) -> None:
+        """Assign the provider returned by a factory to every resource of a package.
+
+        :param package: The name of the Pulumi package.  e.g. vault
+        :type package: str
+
+        :param provider_factory: Called to create the provider the first time a
+            resource of the package is registered.
+        :type provider_factory: Callable[[], pulumi.ProviderResource]
+        """
+        self._factories[package] = provider_factory
+        self._providers.pop(package, None)
+        self._type_packages.clear()
+
+    def provider(self, package: str) -> pulumi.ProviderResource:
+        if package not in self._providers:
+            self._providers[package] = self._factories[package]()
+        return self._providers[package]
+
+    def _package_for(self, type_token: str) -> Optional[str]:
+        package = type_token.partition(":")[0]
+        self._type_packages[type_token] = (
+            package if package in self._factories else None
+        )
+        return self._type_packages[type_token]
+
+    def __call__(
+        self, resource_args: pulumi.ResourceTransformationArgs
+    ) -> Optional[pulumi.ResourceTransformationResult]:
+        start = time.perf_counter()
+        self.stats.resources_seen += 1
+        try:
+            package = self._type_packages[resource_args.type_]
+        except KeyError:
+            package = self._package_for(resource_args.type_)
+        if package is None or resource_args.opts.provider is not None:
+            self.stats.seconds += time.perf_counter() - start
+            return None
+        resource_args.opts.provider = self.provider(package)
+        self.stats.resources_bound += 1
+        self.stats.bound_by_package[package] += 1
+        self.stats.seconds += time.perf_counter() - start
+        return pulumi.ResourceTransformationResult(
+            props=resource_args.props,
+            opts=resource_args.opts,
+        )
+
+
+_provider_binding: Optional[ProviderBinding] = None
+
+
+def provider_binding() -> ProviderBinding:
+    """The provider binding transformation of the current program.
+
+    The transformation is registered with the stack the first time this is called, so
+    it only applies to resources created afterwards.
+
+    :returns: The program's provider binding.
+
+    :rtype: ProviderBinding
+    """
+    global _provider_binding  # noqa: WPS420
+    if _provider_binding is None:
+        _provider_binding = ProviderBinding()
+        pulumi.runtime.register_stack_transformation(_provider_binding)
+    return _provider_binding
+
+
+def bind_provider(package: str, provider_factory: ProviderFactory) -> None:
+    """Assign a provider to every subsequently created resource of a package.
+
+    Resources which are passed an explicit provider keep it.
+
+    :param package: The name of the Pulumi package.  e.g. consul
+    :type package: str
+
+    :param provider_factory: Called to create the provider the first time a resource
+        of the package is registered.
+    :type provider_factory: Callable[[], pulumi.ProviderResource]
+    """
+    provider_binding().bind(package, provider_factory)
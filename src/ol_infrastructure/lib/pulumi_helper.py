@@ -1,6 +1,19 @@
+import threading
 from dataclasses import dataclass
+from typing import Any, Union
 
-from pulumi import get_stack
+from pulumi import Output, StackReference, get_stack
+
+from ol_infrastructure.lib.stack_snapshot import SnapshotStackReference, snapshot_path
+
+# Well known stacks that are shared by the majority of programs.
+DNS_STACK = "infrastructure.aws.dns"
+POLICY_STACK = "infrastructure.aws.policies"
+
+AnyStackReference = Union[StackReference, SnapshotStackReference]
+
+_stack_references: dict[str, AnyStackReference] = {}
+_stack_references_lock = threading.Lock()
 
 
 @dataclass
@@ -20,7 +33,19 @@ def parse_stack() -> StackInfo:
 
     :rtype: StackInfo
     """
-    stack = get_stack()
+    return stack_info_for(get_stack())
+
+
+def stack_info_for(stack: str) -> StackInfo:
+    """Derive the standard stack information from a fully qualified stack name.
+
+    :param stack: The fully qualified name of the stack.  e.g. applications.dagster.QA
+    :type stack: str
+
+    :returns: Parsed stack information for use in business logic.
+
+    :rtype: StackInfo
+    """
     stack_name = stack.split(".")[-1]
     namespace = stack.rsplit(".", 1)[0]
     return StackInfo(
@@ -29,3 +54,105 @@ def parse_stack() -> StackInfo:
         env_suffix=stack_name.lower(),
         env_prefix=namespace.rsplit(".", 1)[-1],
     )
+
+
+def stack_reference(stack_name: str) -> AnyStackReference:
+    """Return the shared reference to a stack, creating it on first use.
+
+    Every module in a program that needs the outputs of a given stack receives the same
+    `StackReference`, so the stack is only read from the backend once.  If
+    `OL_STACK_SNAPSHOT` is set the outputs are instead read from that snapshot (see
+    `ol_infrastructure.lib.stack_snapshot`).
+
+    :param stack_name: The fully qualified name of the stack.  e.g.
+        infrastructure.aws.network.QA
+    :type stack_name: str
+
+    :returns: The reference to the requested stack.
+
+    :rtype: Union[StackReference, SnapshotStackReference]
+    """
+    with _stack_references_lock:
+        if stack_name not in _stack_references:
+            snapshot = snapshot_path()
+            _stack_references[stack_name] = (
+                SnapshotStackReference(stack_name, snapshot)
+                if snapshot
+                else StackReference(stack_name)
+            )
+        return _stack_references[stack_name]
+
+
+def prefetch_stack_references(*stack_names: str) -> dict[str, AnyStackReference]:
+    """Declare all of the stacks that a program depends on at the start of the program.
+
+    Creating a `StackReference` issues the read of that stack's outputs, so declaring
+    them together lets the engine resolve them concurrently rather than as each one is
+    first encountered during program evaluation.
+
+    :param stack_names: The fully qualified names of the stacks to reference.
+    :type stack_names: str
+
+    :returns: The references to the requested stacks, keyed by name.
+
+    :rtype: Dict[str, Union[StackReference, SnapshotStackReference]]
+    """
+    return {stack_name: stack_reference(stack_name) for stack_name in stack_names}
+
+
+def network_stack_name(stack_info: StackInfo) -> str:
+    return f"infrastructure.aws.network.{stack_info.name}"
+
+
+def vpc_output(stack_info: StackInfo, vpc_name: str) -> Output[dict[str, Any]]:
+    """Return the details of a VPC exported by the network stack.
+
+    :param stack_info: The stack information of the current program, used to select
+        the network stack for the same environment.
+    :type stack_info: StackInfo
+
+    :param vpc_name: The name of the exported VPC.  e.g. data_vpc
+    :type vpc_name: str
+
+    :returns: The VPC details, e.g. `id`, `cidr`, `subnet_ids` and `security_groups`.
+
+    :rtype: Output[Dict[str, Any]]
+    """
+    return stack_reference(network_stack_name(stack_info)).require_output(vpc_name)
+
+
+def dns_zone_id(zone_output: str = "odl_zone_id") -> Output[str]:
+    """Return the ID of a hosted zone managed by the DNS stack.
+
+    :param zone_output: The name of the stack output for the zone.
+    :type zone_output: str
+
+    :returns: The hosted zone ID.
+
+    :rtype: Output[str]
+    """
+    return stack_reference(DNS_STACK).require_output(zone_output)
+
+
+def iam_policy_arns() -> Output[dict[str, str]]:
+    """Return the ARNs of the shared IAM policies, keyed by their purpose.
+
+    :returns: The mapping exported as `iam_policies` by the policies stack.
+
+    :rtype: Output[Dict[str, str]]
+    """
+    return stack_reference(POLICY_STACK).require_output("iam_policies")
+
+
+def security_groups(stack_name: str) -> Output[dict[str, str]]:
+    """Return the security group IDs exported by a stack, keyed by their purpose.
+
+    :param stack_name: The fully qualified name of the stack.  e.g.
+        infrastructure.consul.data.QA
+    :type stack_name: str
+
+    :returns: The mapping exported as `security_groups` by the stack.
+
+    :rtype: Output[Dict[str, str]]
+    """
+    return stack_reference(stack_name).require_output("security_groups")
@@ -0,0 +1,264 @@
+"""Run `pulumi preview` or `pulumi up` across stacks in dependency order, in parallel.
+
+Each stack is started as soon as every stack it references has finished, up to a
+limit on the number of concurrent runs, so rebuilding an environment takes as long as
+the critical path through the stack graph rather than the sum of every stack.  The
+output of each run is written to a log file, and a timing report is printed at the end.
+
+Usage:
+    python -m ol_infrastructure.lib.stack_deploy {preview,up} -e QA [-s PATTERN]
+        [-j MAX_PARALLEL] [--no-fail-fast] [--log-dir DIR] [--dry-run]
+"""
+import argparse
+import subprocess  # noqa: S404
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from ol_infrastructure.lib.stack_graph import StackGraph, build_stack_graph
+
+DEFAULT_MAX_PARALLEL = 4
+DEFAULT_LOG_DIR = Path(".stack-deploy-logs")
+PULUMI_ACTIONS = {
+    "preview": ["preview", "--non-interactive", "--diff"],
+    "up": ["up", "--non-interactive", "--yes", "--skip-preview"],
+}
+
+
+@dataclass
+class StackRun:
+    stack: str
+    status: str = "pending"
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    log_file: Optional[Path] = None
+
+    @property
+    def duration(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0
+        return self.finished_at - self.started_at
+
+
+def run_stack(
+    graph: StackGraph, stack_run: StackRun, action: str, log_dir: Path
+) -> StackRun:
+    """Run a Pulumi action against a single stack, logging its output to a file.
+
+    :param graph: The stack graph, used to locate the stack's project.
+    :type graph: StackGraph
+
+    :param stack_run: The record of the run to update.
+    :type stack_run: StackRun
+
+    :param action: Either `preview` or `up`.
+    :type action: str
+
+    :param log_dir: The directory to write the output of the run to.
+    :type log_dir: Path
+
+    :returns: The updated record of the run.
+
+    :rtype: StackRun
+    """
+    log_dir.mkdir(parents=True, exist_ok=True)
+    stack_run.log_file = log_dir.joinpath(f"{stack_run.stack}.log")
+    stack_run.started_at = time.monotonic()
+    with open(stack_run.log_file, "w") as log_output:
+        pulumi_process = subprocess.run(  # noqa: S603, S607
+            ["pulumi", *PULUMI_ACTIONS[action], "--stack", stack_run.stack],
+            cwd=graph.projects[stack_run.stack],
+            stdout=log_output,
+            stderr=subprocess.STDOUT,
+            check=False,
+        )
+    stack_run.finished_at = time.monotonic()
+    stack_run.status = "succeeded" if pulumi_process.returncode == 0 else "failed"
+    return stack_run
+
+
+def deploy_stacks(  # noqa: WPS210, WPS231
+    graph: StackGraph,
+    stacks: set[str],
+    action: str,
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    fail_fast: bool = True,
+    log_dir: Path = DEFAULT_LOG_DIR,
+) -> dict[str, StackRun]:
+    """Run a Pulumi action against the given stacks, respecting their dependencies.
+
+    :param graph: The stack dependency graph.
+    :type graph: StackGraph
+
+    :param stacks: The stacks to run.  References to other stacks are assumed to be
+        up to date.
+    :type stacks: Set[str]
+
+    :param action: Either `preview` or `up`.
+    :type action: str
+
+    :param max_parallel: The maximum number of stacks to run at the same time.
+    :type max_parallel: int
+
+    :param fail_fast: Stop starting new stacks after the first failure.  Otherwise
+        only the stacks that depend on a failed stack are skipped.
+    :type fail_fast: bool
+
+    :param log_dir: The directory to write the output of each run to.
+    :type log_dir: Path
+
+    :returns: The record of each run, keyed by stack name.
+
+    :rtype: Dict[str, StackRun]
+    """
+    waiting_on = graph.ordering_dependencies(stacks)
+    dependents = graph.dependents()
+    runs = {stack: StackRun(stack) for stack in stacks}
+    in_progress: dict[Future[StackRun], str] = {}
+    halted = False
+
+    def skip_dependents(failed_stack: str) -> None:  # noqa: WPS430
+        for dependent in dependents.get(failed_stack, set()):
+            if dependent in waiting_on:
+                waiting_on.pop(dependent)
+                runs[dependent].status = "skipped"
+                skip_dependents(dependent)
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        while waiting_on or in_progress:
+            ready = sorted(
+                stack for stack, deps in waiting_on.items() if not deps and not halted
+            )
+            for stack in ready[: max_parallel - len(in_progress)]:
+                waiting_on.pop(stack)
+                runs[stack].status = "running"
+                print(f"Starting {action} of {stack}", flush=True)
+                in_progress[
+                    executor.submit(run_stack, graph, runs[stack], action, log_dir)
+                ] = stack
+            if not in_progress:
+                break
+            completed, _ = wait(in_progress, return_when=FIRST_COMPLETED)
+            for finished in completed:
+                stack = in_progress.pop(finished)
+                stack_run = finished.result()
+                print(
+                    f"Finished {action} of {stack}: {stack_run.status} "
+                    f"({stack_run.duration:.0f}s)",
+                    flush=True,
+                )
+                if stack_run.status == "succeeded":
+                    for deps in waiting_on.values():
+                        deps.discard(stack)
+                elif fail_fast:
+                    halted = True
+                else:
+                    skip_dependents(stack)
+    for stack in waiting_on:
+        runs[stack].status = "skipped"
+    return runs
+
+
+def critical_path(graph: StackGraph, runs: dict[str, StackRun]) -> list[str]:
+    """The chain of dependent stacks with the longest total run time.
+
+    :param graph: The stack dependency graph.
+    :type graph: StackGraph
+
+    :param runs: The record of each run, keyed by stack name.
+    :type runs: Dict[str, StackRun]
+
+    :returns: The stacks on the critical path, in the order they ran.
+
+    :rtype: List[str]
+    """
+    ordering = graph.ordering_dependencies(runs)
+    longest: dict[str, tuple[float, list[str]]] = {}
+    for wave in graph.waves(runs):
+        for stack in wave:
+            duration, path = max(
+                (longest[dep] for dep in ordering[stack]),
+                default=(0, []),
+                key=lambda path_length: path_length[0],
+            )
+            longest[stack] = (duration + runs[stack].duration, [*path, stack])
+    return max(longest.values(), default=(0, []), key=lambda path: path[0])[1]
+
+
+def print_report(graph: StackGraph, runs: dict[str, StackRun], elapsed: float) -> None:
+    wave_numbers = {
+        stack: wave_number
+        for wave_number, wave in enumerate(graph.waves(runs), start=1)
+        for stack in wave
+    }
+    print(f"\n{'stack':<55} {'wave':>4} {'status':>10} {'seconds':>8}")
+    for stack in sorted(
+        runs, key=lambda stack_name: (wave_numbers[stack_name], stack_name)
+    ):
+        stack_run = runs[stack]
+        print(
+            f"{stack:<55} {wave_numbers[stack]:>4} {stack_run.status:>10} "
+            f"{stack_run.duration:>8.0f}"
+        )
+    path = critical_path(graph, runs)
+    print(
+        f"\nWall clock: {elapsed:.0f}s, sum of stack run times: "
+        f"{sum(stack_run.duration for stack_run in runs.values()):.0f}s, "
+        f"critical path: {sum(runs[stack].duration for stack in path):.0f}s"
+    )
+    print(f"Critical path: {' -> '.join(path)}")
+    for stack_run in runs.values():
+        if stack_run.status == "failed":
+            print(f"{stack_run.stack} failed, see {stack_run.log_file}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run Pulumi across stacks in dependency order."
+    )
+    parser.add_argument("action", choices=sorted(PULUMI_ACTIONS))
+    parser.add_argument("-e", "--environment", help="e.g. QA, CI or Production")
+    parser.add_argument(
+        "-s", "--stack", action="append", default=[], help="Stack name pattern"
+    )
+    parser.add_argument("-j", "--max-parallel", type=int, default=DEFAULT_MAX_PARALLEL)
+    parser.add_argument(
+        "--no-fail-fast",
+        dest="fail_fast",
+        action="store_false",
+        help="Keep running stacks that don't depend on a failed stack.",
+    )
+    parser.add_argument("--log-dir", type=Path, default=DEFAULT_LOG_DIR)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Only print the deployment waves."
+    )
+    args = parser.parse_args()
+    if not (args.environment or args.stack):
+        parser.error("Select stacks with --environment and/or --stack")
+    graph = build_stack_graph()
+    stacks = graph.select(args.environment, args.stack)
+    for wave_number, wave in enumerate(graph.waves(stacks), start=1):
+        print(f"Wave {wave_number}: {', '.join(wave)}")
+    for cycle in graph.cycles(stacks):
+        print(f"Mutually dependent stacks, run without ordering: {', '.join(cycle)}")
+    if args.dry_run:
+        return
+    start = time.monotonic()
+    runs = deploy_stacks(
+        graph,
+        stacks,
+        args.action,
+        max_parallel=args.max_parallel,
+        fail_fast=args.fail_fast,
+        log_dir=args.log_dir,
+    )
+    print_report(graph, runs, time.monotonic() - start)
+    if any(stack_run.status != "succeeded" for stack_run in runs.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""Static dependency graph of the Pulumi stacks defined in this repository.
+
+Stacks depend on each other through the names passed to `StackReference` (or
+`stack_reference` and the other helpers in `ol_infrastructure.lib.pulumi_helper`).  The
+graph is extracted without running any programs: each `__main__.py` is parsed once and
+the stack name expressions are evaluated against the `StackInfo` of every stack that
+has a `Pulumi.<stack>.yaml` in the project directory.
+
+Usage: python -m ol_infrastructure.lib.stack_graph [-e ENV] [-s PATTERN] [--format ...]
+"""
+import argparse
+import ast
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+from ol_infrastructure.lib.pulumi_helper import (
+    DNS_STACK,
+    POLICY_STACK,
+    network_stack_name,
+    stack_info_for,
+)
+
+PROJECTS_ROOT = Path(__file__).parent.parent
+
+# Calls whose positional arguments are the names of referenced stacks.
+STACK_NAME_CALLS = frozenset(
+    (
+        "StackReference",
+        "stack_reference",
+        "prefetch_stack_references",
+        "security_groups",
+    )
+)
+# Accessors which reference a fixed stack for the environment of the program.
+IMPLICIT_REFERENCE_CALLS: dict[str, Callable[[Any], str]] = {
+    "dns_zone_id": lambda _: DNS_STACK,
+    "iam_policy_arns": lambda _: POLICY_STACK,
+    "vpc_output": network_stack_name,
+}
+
+
+@dataclass
+class StackGraph:
+    """Stacks, the projects that define them and the stacks that they reference."""
+
+    projects: dict[str, Path] = field(default_factory=dict)
+    dependencies: dict[str, set[str]] = field(default_factory=dict)
+    unresolved: dict[str, list[str]] = field(default_factory=dict)
+
+    def dependents(self) -> dict[str, set[str]]:
+        """Invert the graph to find the stacks that consume the outputs of each stack.
+
+        :returns: Mapping of stack name to the stacks that reference it.
+
+        :rtype: Dict[str, Set[str]]
+        """
+        reverse_edges: dict[str, set[str]] = {stack: set() for stack in self.projects}
+        for stack, dependencies in self.dependencies.items():
+            for dependency in dependencies:
+                reverse_edges.setdefault(dependency, set()).add(stack)
+        return reverse_edges
+
+    def select(self, environment: str = None, patterns: Iterable[str] = ()) -> set[str]:
+        """Choose the stacks matching an environment and/or shell style name patterns.
+
+        :param environment: Only select stacks whose name ends with this environment,
+            e.g. QA, along with the stacks that are not specific to an environment.
+        :type environment: str
+
+        :param patterns: Only select stacks matching one of these patterns.  e.g.
+            applications.*
+        :type patterns: Iterable[str]
+
+        :returns: The names of the selected stacks.
+
+        :rtype: Set[str]
+        """
+        patterns = list(patterns)
+        selected = set()
+        for stack in self.projects:
+            if environment and not _in_environment(stack, environment):
+                continue
+            if patterns and not any(fnmatch(stack, pattern) for pattern in patterns):
+                continue
+            selected.add(stack)
+        return selected
+
+    def cycles(self, stacks: Iterable[str]) -> list[list[str]]:
+        """Find groups of stacks which reference each other, directly or indirectly.
+
+        :param stacks: The stacks to consider.
+        :type stacks: Iterable[str]
+
+        :returns: Each group of mutually dependent stacks, sorted by name.
+
+        :rtype: List[List[str]]
+        """
+        components = set(
+            _strongly_connected_components(self._subgraph(stacks)).values()
+        )
+        return sorted(
+            sorted(component) for component in components if len(component) > 1
+        )
+
+    def ordering_dependencies(self, stacks: Iterable[str]) -> dict[str, set[str]]:
+        """The dependencies of each stack that must be deployed before it.
+
+        References to stacks outside of the given set are assumed to be satisfied.
+        References between stacks in a cycle are ignored since no order satisfies them,
+        and each stack in a cycle waits for the dependencies of every other stack in
+        it, so that mutually dependent stacks are ready, and deployed, together.
+
+        :param stacks: The stacks to order.
+        :type stacks: Iterable[str]
+
+        :returns: Mapping of stack name to the stacks it must wait for.
+
+        :rtype: Dict[str, Set[str]]
+        """
+        subgraph = self._subgraph(stacks)
+        components = _strongly_connected_components(subgraph)
+        component_dependencies: dict[frozenset[str], set[str]] = {}
+        for stack, deps in subgraph.items():
+            component_dependencies.setdefault(components[stack], set()).update(
+                deps - components[stack]
+            )
+        return {
+            stack: set(component_dependencies[components[stack]]) for stack in subgraph
+        }
+
+    def waves(self, stacks: Iterable[str]) -> list[list[str]]:
+        """Group stacks into waves where each wave only depends on earlier waves.
+
+        :param stacks: The stacks to order.
+        :type stacks: Iterable[str]
+
+        :returns: The waves of stack names, each sorted by name.
+
+        :rtype: List[List[str]]
+        """
+        remaining = self.ordering_dependencies(stacks)
+        ordered_waves = []
+        while remaining:
+            wave = sorted(stack for stack, deps in remaining.items() if not deps)
+            ordered_waves.append(wave)
+            for stack in wave:
+                remaining.pop(stack)
+            for deps in remaining.values():
+                deps.difference_update(wave)
+        return ordered_waves
+
+    def _subgraph(self, stacks: Iterable[str]) -> dict[str, set[str]]:
+        stack_set = set(stacks)
+        return {
+            stack: self.dependencies.get(stack, set()) & stack_set
+            for stack in stack_set
+        }
+
+
+def _strongly_connected_components(
+    graph: dict[str, set[str]]
+) -> dict[str, frozenset[str]]:
+    """Map each node to its strongly connected component using Tarjan's algorithm."""
+    index_counter = 0
+    indices: dict[str, int] = {}
+    low_links: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    components: dict[str, frozenset[str]] = {}
+
+    def visit(node: str) -> None:  # noqa: WPS430
+        nonlocal index_counter
+        indices[node] = low_links[node] = index_counter
+        index_counter += 1
+        stack.append(node)
+        on_stack.add(node)
+        for successor in sorted(graph[node]):
+            if successor not in indices:
+                visit(successor)
+                low_links[node] = min(low_links[node], low_links[successor])
+            elif successor in on_stack:
+                low_links[node] = min(low_links[node], indices[successor])
+        if low_links[node] == indices[node]:
+            component = set()
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.add(member)
+                if member == node:
+                    break
+            frozen_component = frozenset(component)
+            for member in component:
+                components[member] = frozen_component
+
+    for node in sorted(graph):
+        if node not in indices:
+            visit(node)
+    return components
+
+
+def _in_environment(stack: str, environment: str) -> bool:
+    # Environment specific stacks end in a capitalized name such as QA or Production,
+    # whereas shared stacks such as infrastructure.aws.dns do not.
+    stack_environment = stack.rsplit(".", 1)[-1]
+    return stack_environment == environment or stack_environment[:1].islower()
+
+
+def _call_name(call: ast.Call) -> str:
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    return ""
+
+
+@lru_cache
+def _parse_program(program: Path) -> ast.Module:
+    return ast.parse(program.read_text(), filename=str(program))
+
+
+def _evaluate(expression: ast.expr, namespace: dict[str, Any]) -> Any:
+    # Only names bound in the namespace are available, with no builtins, so this can
+    # only evaluate string formatting of the stack info and module level constants.
+    return eval(  # noqa: S307, WPS421
+        compile(ast.Expression(expression), "<stack-name>", "eval"),
+        {"__builtins__": {}},
+        namespace,
+    )
+
+
+def program_references(program: Path, stack: str) -> tuple[set[str], list[str]]:
+    """Determine the stacks referenced by a program when it is run as the given stack.
+
+    :param program: The path to the program's `__main__.py`.
+    :type program: Path
+
+    :param stack: The fully qualified name of the stack being evaluated.
+    :type stack: str
+
+    :returns: The referenced stack names and the source of any stack name expressions
+              that could not be resolved statically.
+
+    :rtype: Tuple[Set[str], List[str]]
+    """
+    module = _parse_program(program)
+    stack_info = stack_info_for(stack)
+    namespace: dict[str, Any] = {
+        "stack_info": stack_info,
+        "DNS_STACK": DNS_STACK,
+        "POLICY_STACK": POLICY_STACK,
+        "network_stack_name": network_stack_name,
+    }
+    for statement in module.body:
+        if (
+            isinstance(statement, ast.Assign)
+            and len(statement.targets) == 1
+            and isinstance(statement.targets[0], ast.Name)
+        ):
+            try:
+                assigned_value = _evaluate(statement.value, namespace)
+            except Exception:  # noqa: S112, B902
+                continue
+            if isinstance(assigned_value, str):
+                namespace[statement.targets[0].id] = assigned_value
+    references: set[str] = set()
+    unresolved: list[str] = []
+    for node in ast.walk(module):
+        if not isinstance(node, ast.Call):
+            continue
+        call_name = _call_name(node)
+        if call_name in IMPLICIT_REFERENCE_CALLS:
+            references.add(IMPLICIT_REFERENCE_CALLS[call_name](stack_info))
+        elif call_name in STACK_NAME_CALLS:
+            for argument in node.args:
+                try:
+                    references.add(_evaluate(argument, namespace))
+                except Exception:  # noqa: B902
+                    unresolved.append(ast.unparse(argument))
+    references.discard(stack)
+    return references, unresolved
+
+
+def build_stack_graph(projects_root: Path = PROJECTS_ROOT) -> StackGraph:
+    """Extract the dependency graph of every stack under the given directory.
+
+    :param projects_root: The directory containing the Pulumi projects.
+    :type projects_root: Path
+
+    :returns: The stack dependency graph.
+
+    :rtype: StackGraph
+    """
+    graph = StackGraph()
+    for stack_config in sorted(projects_root.rglob("Pulumi.*.yaml")):
+        program = stack_config.parent.joinpath("__main__.py")
+        if not program.exists():
+            continue
+        stack = stack_config.name.removeprefix("Pulumi.").removesuffix(".yaml")
+        graph.projects[stack] = stack_config.parent
+        references, unresolved = program_references(program, stack)
+        graph.dependencies[stack] = references
+        if unresolved:
+            graph.unresolved[stack] = unresolved
+    return graph
+
+
+def _to_dot(graph: StackGraph, stacks: set[str]) -> str:
+    edges = [
+        f'  "{stack}" -> "{dependency}";'
+        for stack in sorted(stacks)
+        for dependency in sorted(graph.dependencies.get(stack, set()) & stacks)
+    ]
+    return "\n".join(["digraph stacks {", *edges, "}"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Show the stack dependency graph.")
+    parser.add_argument("-e", "--environment", help="e.g. QA, CI or Production")
+    parser.add_argument(
+        "-s", "--stack", action="append", default=[], help="Stack name pattern"
+    )
+    parser.add_argument("--format", choices=["waves", "dot", "json"], default="waves")
+    args = parser.parse_args()
+    graph = build_stack_graph()
+    stacks = graph.select(args.environment, args.stack)
+    if args.format == "dot":
+        print(_to_dot(graph, stacks))
+    elif args.format == "json":
+        print(
+            json.dumps(
+                {stack: sorted(graph.dependencies[stack]) for stack in sorted(stacks)},
+                indent=2,
+            )
+        )
+    else:
+        for wave_number, wave in enumerate(graph.waves(stacks), start=1):
+            print(f"Wave {wave_number}:")
+            for stack in wave:
+                print(f"  {stack}")
+    for cycle in graph.cycles(stacks):
+        print(f"Mutually dependent stacks: {', '.join(cycle)}")
+    for stack, expressions in sorted(graph.unresolved.items()):
+        if stack in stacks:
+            print(f"Unresolved references in {stack}: {', '.join(expressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Local snapshots of stack outputs for evaluating programs without the Pulumi backend.
+
+A snapshot is a versioned JSON document containing the outputs of a set of stacks, as
+reported by `pulumi stack output --json`.  Secret outputs are not revealed and are
+stored as `[secret]`.  When `OL_STACK_SNAPSHOT` points at a snapshot,
+`ol_infrastructure.lib.pulumi_helper.stack_reference` serves outputs from it instead of
+reading the referenced stacks from the backend.
+
+Usage:
+    python -m ol_infrastructure.lib.stack_snapshot export [-o PATH] STACK [STACK ...]
+    python -m ol_infrastructure.lib.stack_snapshot show [-o PATH]
+"""
+import argparse
+import json
+import os
+import subprocess  # noqa: S404
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from pulumi import Output
+
+STACK_SNAPSHOT_ENV = "OL_STACK_SNAPSHOT"
+SNAPSHOT_FORMAT_VERSION = 1
+MASKED_SECRET = "[secret]"
+DEFAULT_SNAPSHOT_PATH = Path("stack_outputs.json")
+PROJECTS_ROOT = Path(__file__).parent.parent
+EXPORT_WORKERS = 8
+
+
+class StackSnapshotError(Exception):
+    """Raised when a snapshot can not be read or does not contain a stack."""
+
+
+def snapshot_path() -> Optional[Path]:
+    """The snapshot that stack references are served from, if snapshot mode is enabled.
+
+    :returns: The path configured by `OL_STACK_SNAPSHOT`.
+
+    :rtype: Optional[Path]
+    """
+    configured_path = os.environ.get(STACK_SNAPSHOT_ENV)
+    return Path(configured_path) if configured_path else None
+
+
+def project_dir(stack_name: str) -> Path:
+    """Locate the Pulumi project that a stack belongs to.
+
+    :param stack_name: The fully qualified name of the stack.  e.g.
+        infrastructure.aws.network.QA
+    :type stack_name: str
+
+    :raises StackSnapshotError: If no project contains a config file for the stack.
+
+    :returns: The directory containing the project's Pulumi.yaml.
+
+    :rtype: Path
+    """
+    for stack_config in PROJECTS_ROOT.rglob(f"Pulumi.{stack_name}.yaml"):
+        return stack_config.parent
+    raise StackSnapshotError(f"Unable to find the project for the {stack_name} stack")
+
+
+def export_stack_outputs(stack_name: str) -> dict[str, Any]:
+    """Read the outputs of a stack from the backend, leaving secrets masked.
+
+    :param stack_name: The fully qualified name of the stack.
+    :type stack_name: str
+
+    :returns: The stack outputs.
+
+    :rtype: Dict[str, Any]
+    """
+    stack_outputs = subprocess.run(  # noqa: S603, S607
+        ["pulumi", "stack", "output", "--json", "--stack", stack_name],
+        cwd=project_dir(stack_name),
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(stack_outputs)
+
+
+@lru_cache
+def load_snapshot(path: Path) -> dict[str, dict[str, Any]]:
+    """Read the stack outputs recorded in a snapshot.
+
+    :param path: The location of the snapshot.
+    :type path: Path
+
+    :raises StackSnapshotError: If the snapshot is missing or of a different version.
+
+    :returns: The outputs of each stack in the snapshot, keyed by stack name.
+
+    :rtype: Dict[str, Dict[str, Any]]
+    """
+    try:
+        snapshot = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError) as read_error:
+        raise StackSnapshotError(f"Unable to read stack snapshot {path}: {read_error}")
+    if snapshot.get("version") != SNAPSHOT_FORMAT_VERSION:
+        raise StackSnapshotError(
+            f"Stack snapshot {path} has version {snapshot.get('version')}, expected "
+            f"{SNAPSHOT_FORMAT_VERSION}.  Export it again to update it."
+        )
+    return snapshot["stacks"]
+
+
+def write_snapshot(stack_names: list[str], path: Path) -> dict[str, dict[str, Any]]:
+    """Export the outputs of the given stacks into a snapshot.
+
+    Stacks already present in an existing snapshot of the current version are kept, so
+    a snapshot can be built up incrementally.
+
+    :param stack_names: The fully qualified names of the stacks to export.
+    :type stack_names: List[str]
+
+    :param path: The location of the snapshot.
+    :type path: Path
+
+    :returns: The outputs of every stack now in the snapshot.
+
+    :rtype: Dict[str, Dict[str, Any]]
+    """
+    try:
+        stacks = dict(load_snapshot(path))
+    except StackSnapshotError:
+        stacks = {}
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+        stacks.update(zip(stack_names, executor.map(export_stack_outputs, stack_names)))
+    path.write_text(
+        json.dumps(
+            {
+                "version": SNAPSHOT_FORMAT_VERSION,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "stacks": dict(sorted(stacks.items())),
+            },
+            indent=2,
+            sort_keys=True,
+        )
+    )
+    load_snapshot.cache_clear()
+    return stacks
+
+
+def _snapshot_output(output_value: Any) -> Output[Any]:
+    if output_value == MASKED_SECRET:
+        return Output.secret(output_value)
+    return Output.from_input(output_value)
+
+
+class SnapshotStackReference:
+    """Stand-in for a `StackReference` that resolves outputs from a snapshot."""
+
+    def __init__(self, name: str, path: Path):
+        self.name = name
+        try:
+            self._outputs = load_snapshot(path)[name]
+        except KeyError:
+            raise StackSnapshotError(
+                f"The {name} stack is not in the stack snapshot {path}.  Add it with "
+                f"`python -m ol_infrastructure.lib.stack_snapshot export -o {path} "
+                f"{name}`"
+            )
+        self.outputs = Output.from_input(self._outputs)
+
+    def get_output(self, output_name: str) -> Output[Any]:
+        return _snapshot_output(self._outputs.get(output_name))
+
+    def require_output(self, output_name: str) -> Output[Any]:
+        if output_name not in self._outputs:
+            raise KeyError(
+                f"Required output '{output_name}' does not exist in the snapshot of "
+                f"the {self.name} stack"
+            )
+        return _snapshot_output(self._outputs[output_name])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage local stack output snapshots.")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+    export_parser = subparsers.add_parser("export", help="Export stack outputs.")
+    export_parser.add_argument("stacks", nargs="+")
+    show_parser = subparsers.add_parser("show", help="List the stacks in a snapshot.")
+    for subparser in (export_parser, show_parser):
+        subparser.add_argument(
+            "-o",
+            "--output",
+            type=Path,
+            default=snapshot_path() or DEFAULT_SNAPSHOT_PATH,
+            help="Path of the snapshot file.",
+        )
+    args = parser.parse_args()
+    if args.action == "export":
+        stacks = write_snapshot(args.stacks, args.output)
+    else:
+        stacks = load_snapshot(args.output)
+    for stack_name, stack_outputs in sorted(stacks.items()):
+        print(f"{stack_name}: {', '.join(sorted(stack_outputs))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ import pulumi
 import pulumi_vault
 
 from bridge.secrets.sops import read_yaml_secrets
+from ol_infrastructure.lib.provider_binding import bind_provider
 
 postgres_role_statements = {
     "approle": {
@@ -153,7 +154,7 @@ class VaultPKIKeyTypeBits(int, Enum):
 @lru_cache
 def get_vault_provider(
     vault_address: str, vault_env_namespace: str, provider_name: str = None
-) -> pulumi.ResourceTransformationResult:
+) -> pulumi_vault.Provider:
     pulumi_vault_creds = read_yaml_secrets(
         Path().joinpath(
             # We are forcing the assumption that the Vault cluster is in the operations
@@ -181,24 +182,9 @@ def get_vault_provider(
     )
 
 
-def set_vault_provider(
-    vault_address: str,
-    vault_env_namespace: str,
-    resource_args: pulumi.ResourceTransformationArgs,
-) -> pulumi.ResourceTransformationResult:
-    if resource_args.type_.split(":")[0] == "vault":
-        resource_args.opts.provider = get_vault_provider(
-            vault_address, vault_env_namespace
-        )
-    return pulumi.ResourceTransformationResult(
-        props=resource_args.props,
-        opts=resource_args.opts,
-    )
-
-
 def setup_vault_provider():
     vault_address = pulumi.Config("vault").require("address")
     vault_env_namespace = pulumi.Config("vault_server").require("env_namespace")
-    pulumi.runtime.register_stack_transformation(
-        partial(set_vault_provider, vault_address, vault_env_namespace)
+    bind_provider(
+        "vault", partial(get_vault_provider, vault_address, vault_env_namespace)
     )
@@ -0,0 +1,288 @@
+"""Initialize a new Vault cluster and configure the access that Pulumi needs.
+
+Every request is made through one hvac client backed by a pooled `requests` session.
+Waiting for the cluster is split into probes: the health endpoint responding, the
+cluster being unsealed, and the `sys/auth` endpoint accepting requests.  Each probe is
+retried with exponential backoff, and all of them share one deadline, so a cluster that
+never comes up fails the bootstrap instead of blocking the Pulumi program forever.  The
+time taken by each phase is logged.
+"""
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Callable, Optional
+
+import hvac
+import pulumi
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_BOOTSTRAP_TIMEOUT = 600
+DEFAULT_REQUEST_TIMEOUT = 10
+INITIAL_RETRY_DELAY = 0.5
+MAX_RETRY_DELAY = 15
+# Status codes of sys/health for active, standby, DR secondary, performance standby,
+# uninitialized and sealed nodes.  Any of them means that Vault is serving requests.
+HEALTH_RESPONSE_CODES = frozenset((200, 429, 472, 473, 501, 503))
+RETRYABLE_ERRORS = (
+    hvac.exceptions.VaultDown,
+    hvac.exceptions.InternalServerError,
+    hvac.exceptions.VaultNotInitialized,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+class VaultBootstrapError(Exception):
+    """Raised when the Vault cluster does not become ready before the deadline."""
+
+
+@dataclass
+class VaultBootstrapResult:
+    recovery_keys: list[str] = field(default_factory=list)
+    phase_timings: dict[str, float] = field(default_factory=dict)
+
+
+def vault_client(
+    vault_address: str,
+    request_timeout: int = DEFAULT_REQUEST_TIMEOUT,
+    pool_size: int = 4,
+) -> hvac.Client:
+    """Create an hvac client whose requests share one pool of connections.
+
+    :param vault_address: The URL of the Vault cluster.  e.g. https://vault.example.com
+    :type vault_address: str
+
+    :param request_timeout: The number of seconds to wait for each request.
+    :type request_timeout: int
+
+    :param pool_size: The number of connections to keep open to the cluster.
+    :type pool_size: int
+
+    :returns: The Vault client.
+
+    :rtype: hvac.Client
+    """
+    session = requests.Session()
+    pooled_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", pooled_adapter)
+    session.mount("http://", pooled_adapter)
+    return hvac.Client(url=vault_address, session=session, timeout=request_timeout)
+
+
+def wait_for(
+    probe: Callable[[], bool],
+    description: str,
+    deadline: float,
+    initial_delay: float = INITIAL_RETRY_DELAY,
+    max_delay: float = MAX_RETRY_DELAY,
+) -> None:
+    """Call a probe until it succeeds, backing off exponentially between attempts.
+
+    :param probe: Returns True once the condition being waited for is met.  Errors
+        raised while Vault is starting up are treated as the condition not being met.
+    :type probe: Callable[[], bool]
+
+    :param description: What is being waited for, used in messages.
+    :type description: str
+
+    :param deadline: The `time.monotonic` value after which to stop waiting.
+    :type deadline: float
+
+    :param initial_delay: The number of seconds to wait after the first failure.
+    :type initial_delay: float
+
+    :param max_delay: The longest number of seconds to wait between attempts.
+    :type max_delay: float
+
+    :raises VaultBootstrapError: If the probe has not succeeded by the deadline.
+    """
+    delay = initial_delay
+    attempts = 0
+    while True:
+        attempts += 1
+        last_error: Optional[Exception] = None
+        try:
+            if probe():
+                return
+        except RETRYABLE_ERRORS as probe_error:
+            last_error = probe_error
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise VaultBootstrapError(
+                f"Timed out waiting for {description} after {attempts} attempts"
+                + (f": {last_error}" if last_error else "")
+            )
+        pulumi.log.info(f"Waiting {min(delay, remaining):.1f}s for {description}")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
+@contextmanager
+def _phase(name: str, phase_timings: dict[str, float]) -> Iterator[None]:
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        phase_timings[name] = time.monotonic() - start
+        pulumi.log.info(f"Vault bootstrap phase {name} took {phase_timings[name]:.1f}s")
+
+
+def _health_responding(client: hvac.Client) -> bool:
+    health_response = client.sys.read_health_status(method="HEAD")
+    return health_response.status_code in HEALTH_RESPONSE_CODES
+
+
+def _succeeds(action: Callable[[], object]) -> Callable[[], bool]:
+    def probe() -> bool:  # noqa: WPS430
+        action()
+        return True
+
+    return probe
+
+
+def configure_pulumi_access(  # noqa: WPS211
+    client: hvac.Client,
+    auth_mount: str,
+    username: str,
+    password: str,
+    policy_name: str,
+    policy: str,
+) -> None:
+    """Create the userpass login and policy that Pulumi uses to manage the cluster.
+
+    The enabled auth methods are read once so the auth method is only enabled if it is
+    missing.
+
+    :param client: A Vault client authenticated with the root token.
+    :type client: hvac.Client
+
+    :param auth_mount: The path to mount the userpass auth method at.
+    :type auth_mount: str
+
+    :param username: The username for Pulumi to log in with.
+    :type username: str
+
+    :param password: The password for Pulumi to log in with.
+    :type password: str
+
+    :param policy_name: The name of the policy granted to the Pulumi user.
+    :type policy_name: str
+
+    :param policy: The HCL body of the policy.
+    :type policy: str
+    """
+    enabled_auths = client.sys.list_auth_methods()
+    if f"{auth_mount}/" not in enabled_auths:
+        client.sys.enable_auth_method(
+            method_type="userpass",
+            description="Allow authentication for Pulumi using the user/pass method",
+            path=auth_mount,
+        )
+    client.sys.create_or_update_policy(name=policy_name, policy=policy)
+    hvac.api.auth_methods.userpass.Userpass(client.adapter).create_or_update_user(
+        username=username,
+        password=password,
+        mount_point=auth_mount,
+        policies=[policy_name, auth_mount],
+    )
+
+
+def bootstrap_vault_cluster(  # noqa: WPS211
+    vault_address: str,
+    init_params: dict,
+    pulumi_username: str,
+    pulumi_password: str,
+    policy_path: Path,
+    recovery_keys_path: Path = Path("vault_recovery_keys.txt"),
+    auth_mount: str = "pulumi",
+    policy_name: str = "cluster-admin",
+    timeout: float = DEFAULT_BOOTSTRAP_TIMEOUT,
+) -> VaultBootstrapResult:
+    """Initialize a Vault cluster if needed and configure the login used by Pulumi.
+
+    :param vault_address: The URL of the Vault cluster.  e.g. https://vault.example.com
+    :type vault_address: str
+
+    :param init_params: Keyword arguments for `sys.initialize`, e.g. the number of
+        recovery shares and the PGP keys to encrypt them with.
+    :type init_params: Dict
+
+    :param pulumi_username: The username for Pulumi to log in with.
+    :type pulumi_username: str
+
+    :param pulumi_password: The password for Pulumi to log in with.
+    :type pulumi_password: str
+
+    :param policy_path: The HCL file of the policy granted to the Pulumi user.
+    :type policy_path: Path
+
+    :param recovery_keys_path: Where to write the recovery keys of a new cluster.
+    :type recovery_keys_path: Path
+
+    :param auth_mount: The path to mount the userpass auth method at.
+    :type auth_mount: str
+
+    :param policy_name: The name of the policy granted to the Pulumi user.
+    :type policy_name: str
+
+    :param timeout: The number of seconds to wait for the cluster to become ready.
+    :type timeout: float
+
+    :raises VaultBootstrapError: If the cluster is not ready before the timeout.
+
+    :returns: The recovery keys of a newly initialized cluster, which are empty if it
+              was already initialized, and the number of seconds each phase took.
+
+    :rtype: VaultBootstrapResult
+    """
+    deadline = time.monotonic() + timeout
+    result = VaultBootstrapResult()
+    client = vault_client(vault_address)
+    try:
+        with _phase("health", result.phase_timings):
+            wait_for(lambda: _health_responding(client), "Vault to respond", deadline)
+        if client.sys.is_initialized():
+            return result
+        with _phase("initialize", result.phase_timings):
+            init_response = client.sys.initialize(**init_params)
+        client.token = init_response["root_token"]
+        result.recovery_keys = init_response["recovery_keys"]
+        recovery_keys_path.write_text("\n".join(result.recovery_keys))
+        pulumi.log.info(
+            f"IMPORTANT!: Retain the keys in {recovery_keys_path} for recovering the "
+            "cluster."
+        )
+        with _phase("unseal", result.phase_timings):
+            wait_for(
+                lambda: not client.sys.is_sealed(), "Vault to be unsealed", deadline
+            )
+        with _phase("auth_ready", result.phase_timings):
+            wait_for(
+                _succeeds(client.sys.list_auth_methods),
+                "sys/auth to be ready",
+                deadline,
+            )
+        with _phase("configure", result.phase_timings):
+            wait_for(
+                _succeeds(
+                    partial(
+                        configure_pulumi_access,
+                        client,
+                        auth_mount=auth_mount,
+                        username=pulumi_username,
+                        password=pulumi_password,
+                        policy_name=policy_name,
+                        policy=policy_path.read_text(),
+                    )
+                ),
+                "Pulumi access to be configured",
+                deadline,
+            )
+            client.revoke_self_token()
+    finally:
+        client.adapter.close()
+    return result
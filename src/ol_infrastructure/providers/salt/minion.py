@@ -21,15 +21,19 @@ API Password:
 API Authentication Method:
   As pulumi config: saltstack:api_auth_method
   As environment variable: SALTSTACK_API_AUTH_METHOD
+
+Every minion in a process shares one logged in session per API URL, user and
+authentication method.  See ol_infrastructure.providers.salt.session
 """
 import os
 from dataclasses import dataclass
 from typing import Optional
 
-from pepper import Pepper
 from pulumi import Config, Input, Output, ResourceOptions
 from pulumi.dynamic import CreateResult, ReadResult, Resource, ResourceProvider
 
+from ol_infrastructure.providers.salt.session import SaltAPISession, salt_api_session
+
 
 @dataclass
 class OLSaltStackMinionInputs:
@@ -133,10 +137,8 @@ class OLSaltStackMinionProvider(ResourceProvider):
 
     def _salt_client(
         self, api_url: str, api_user: str, api_password: str, api_auth: str = "pam"
-    ) -> Pepper:
-        salt_client = Pepper(api_url)
-        salt_client.login(username=api_user, password=api_password, eauth=api_auth)
-        return salt_client
+    ) -> SaltAPISession:
+        return salt_api_session(api_url, api_user, api_password, api_auth)
 
 
 class OLSaltStackMinion(Resource):
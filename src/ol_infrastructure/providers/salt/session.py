@@ -0,0 +1,119 @@
+"""Shared, thread-safe sessions for the SaltStack API.
+
+Logging in to the Salt API performs an eauth round trip, so rather than logging in for
+every provider operation, one session is kept per API URL, user and eauth backend for
+the life of the process.  The token it holds is reused until shortly before it expires,
+and the session logs in again if the API rejects the token.  Pulumi runs resource
+operations in parallel threads, so logins are serialized by a lock on each session.
+"""
+import threading
+import time
+from typing import Any
+
+from pepper import Pepper, PepperException
+
+# Log in again this many seconds before the token expires to avoid racing the expiry.
+TOKEN_EXPIRY_MARGIN = 60
+AUTHENTICATION_DENIED = "Authentication denied"
+
+
+class SaltAPISession:
+    """A logged in Salt API client which re-authenticates when its token expires."""
+
+    def __init__(self, api_url: str, api_user: str, api_password: str, api_auth: str):
+        self.api_url = api_url
+        self.api_user = api_user
+        self.api_auth = api_auth
+        self.logins = 0
+        self._api_password = api_password
+        self._client = Pepper(api_url)
+        self._login_lock = threading.Lock()
+
+    def _token_expired(self) -> bool:
+        token_expiry = self._client.auth.get("expire", 0)
+        return not self._client.auth.get("token") or (
+            token_expiry - TOKEN_EXPIRY_MARGIN <= time.time()
+        )
+
+    def login(self, rejected_token: str = None) -> None:
+        """Log in to the Salt API unless another thread already replaced the token.
+
+        :param rejected_token: The token which the API refused.  If the session holds a
+            different token then another thread has already logged in again.
+        :type rejected_token: str
+        """
+        with self._login_lock:
+            current_token = self._client.auth.get("token")
+            if rejected_token is not None and current_token != rejected_token:
+                return
+            if rejected_token is None and not self._token_expired():
+                return
+            self._client.login(
+                username=self.api_user,
+                password=self._api_password,
+                eauth=self.api_auth,
+            )
+            self.logins += 1
+
+    def update_password(self, api_password: str) -> None:
+        with self._login_lock:
+            if api_password != self._api_password:
+                self._api_password = api_password
+                self._client.auth = {}
+
+    def wheel(self, fun: str, **kwargs) -> dict[str, Any]:
+        """Run a command with the wheel client, logging in again if the token expired.
+
+        :param fun: The wheel function to run.  e.g. key.gen_accept
+        :type fun: str
+
+        :returns: The response from the Salt API.
+
+        :rtype: Dict[str, Any]
+        """
+        if self._token_expired():
+            self.login()
+        token = self._client.auth.get("token")
+        try:
+            return self._client.wheel(fun, **kwargs)
+        except PepperException as salt_error:
+            if str(salt_error) != AUTHENTICATION_DENIED:
+                raise
+        self.login(rejected_token=token)
+        return self._client.wheel(fun, **kwargs)
+
+
+_salt_sessions: dict[tuple[str, str, str], SaltAPISession] = {}
+_salt_sessions_lock = threading.Lock()
+
+
+def salt_api_session(
+    api_url: str, api_user: str, api_password: str, api_auth: str = "pam"
+) -> SaltAPISession:
+    """Retrieve the process wide session for a Salt API user.
+
+    :param api_url: The URL of the Salt API.
+    :type api_url: str
+
+    :param api_user: The user to log in as.
+    :type api_user: str
+
+    :param api_password: The password of the user.
+    :type api_password: str
+
+    :param api_auth: The eauth backend to log in with.
+    :type api_auth: str
+
+    :returns: The shared session for the URL, user and eauth backend.
+
+    :rtype: SaltAPISession
+    """
+    session_key = (api_url, api_user, api_auth)
+    with _salt_sessions_lock:
+        if session_key not in _salt_sessions:
+            _salt_sessions[session_key] = SaltAPISession(
+                api_url, api_user, api_password, api_auth
+            )
+        session = _salt_sessions[session_key]
+    session.update_password(api_password)
+    return session
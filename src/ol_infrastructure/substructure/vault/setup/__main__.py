@@ -1,13 +1,15 @@
-import time
 from pathlib import Path
 
-import hvac
 import pulumi
 import pulumi_vault as vault
 
 from bridge.secrets.sops import read_yaml_secrets
 from ol_infrastructure.lib.pulumi_helper import parse_stack
 from ol_infrastructure.lib.vault import get_vault_provider
+from ol_infrastructure.lib.vault_bootstrap import (
+    DEFAULT_BOOTSTRAP_TIMEOUT,
+    bootstrap_vault_cluster,
+)
 
 vault_config = pulumi.Config("vault_setup")
 vault_server_config = pulumi.Config("vault_server")
@@ -21,6 +23,9 @@ vault_dns = vault_cluster.outputs["vault_server"]["public_dns"]
 vault_address = vault_cluster.outputs["vault_server"]["cluster_address"]
 key_shares = vault_config.get_int("key_shares") or 3
 recovery_threshold = vault_config.get_int("recovery_threshold") or 2
+bootstrap_timeout = (
+    vault_config.get_int("bootstrap_timeout") or DEFAULT_BOOTSTRAP_TIMEOUT
+)
 pgp_public_keys: list[str] = vault_config.get_object("pgp_keys")
 
 if pgp_public_keys and len(pgp_public_keys) != key_shares:
@@ -35,69 +40,22 @@ pulumi_vault_creds = read_yaml_secrets(
 
 
 def init_vault_cluster(vault_addr):
-    vault_client = hvac.Client(url=f"https://{vault_addr}")
-    recovery_keys = []
-    if not vault_client.sys.is_initialized():
-        init_response = vault_client.sys.initialize(
-            secret_shares=key_shares,
-            stored_shares=key_shares,
-            recovery_shares=key_shares,
-            recovery_threshold=recovery_threshold,
-            recovery_pgp_keys=pgp_public_keys,
-        )
-
-        vault_root_token = init_response["root_token"]
-        recovery_keys = init_response["recovery_keys"]
-
-        vault_client.token = vault_root_token
-        pulumi.log.info(
-            "IMPORTANT!: Retain the keys in vault_recovery_keys.txt for "
-            "recovering the cluster."
-        )
-
-        with open("vault_recovery_keys.txt", "w") as vault_recovery_keys_file:
-            vault_recovery_keys_file.write("\n".join(recovery_keys))
-
-        vault_ready = False
-        while not vault_ready:
-            try:
-                pulumi.log.info(
-                    "Trying to enable the userpass backend",
-                    vault_client.sys.is_sealed(),
-                )
-                enabled_auths = vault_client.sys.list_auth_methods()
-                if f"{PULUMI}/" not in enabled_auths.keys():
-                    vault_client.sys.enable_auth_method(
-                        method_type="userpass",
-                        description="Allow authentication for Pulumi using the "
-                        "user/pass method",
-                        path=PULUMI,
-                    )
-
-                vault_client.sys.create_or_update_policy(
-                    name="cluster-admin",
-                    policy=Path(__file__)
-                    .resolve()
-                    .parent.joinpath("pulumi_policy.hcl")
-                    .read_text(),
-                )
-
-                user_pass = hvac.api.auth_methods.userpass.Userpass(
-                    vault_client.adapter
-                )
-                user_pass.create_or_update_user(
-                    username=pulumi_vault_creds["auth_username"],
-                    password=pulumi_vault_creds["auth_password"],
-                    mount_point=PULUMI,
-                    policies=["cluster-admin", PULUMI],
-                )
-
-                vault_client.revoke_self_token()
-                vault_ready = True
-            except (hvac.exceptions.VaultDown, hvac.exceptions.InternalServerError):
-                pulumi.log.info("Vault isn't ready yet. Waiting and trying again.")
-                time.sleep(1)
-    return recovery_keys
+    bootstrap_result = bootstrap_vault_cluster(
+        f"https://{vault_addr}",
+        init_params={
+            "secret_shares": key_shares,
+            "stored_shares": key_shares,
+            "recovery_shares": key_shares,
+            "recovery_threshold": recovery_threshold,
+            "recovery_pgp_keys": pgp_public_keys,
+        },
+        pulumi_username=pulumi_vault_creds["auth_username"],
+        pulumi_password=pulumi_vault_creds["auth_password"],
+        policy_path=Path(__file__).resolve().parent.joinpath("pulumi_policy.hcl"),
+        auth_mount=PULUMI,
+        timeout=bootstrap_timeout,
+    )
+    return bootstrap_result.recovery_keys
 
 
 vault_dns.apply(init_vault_cluster)
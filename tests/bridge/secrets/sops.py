@@ -0,0 +1,131 @@
+import stat
+import threading
+
+import pytest
+from cryptography.fernet import Fernet
+
+from bridge.secrets import sops
+from bridge.secrets.sops import DecryptedSecretCache, prefetch_secrets
+
+
+@pytest.fixture()
+def decryptions(monkeypatch):
+    decrypted_files = []
+
+    def fake_decrypt(sops_file, ciphertext=None, backend=None):
+        decrypted_files.append(sops_file)
+        if b"undecryptable" in ciphertext:
+            return None
+        return b"plain:" + ciphertext
+
+    monkeypatch.setattr(sops, "decrypt_sops_file", fake_decrypt)
+    return decrypted_files
+
+
+@pytest.fixture()
+def secret_file(tmp_path):
+    sops_file = tmp_path.joinpath("secrets.yaml")
+    sops_file.write_bytes(b"ciphertext-v1")
+    return sops_file
+
+
+def test_repeated_reads_are_served_from_memory(decryptions, secret_file):
+    cache = DecryptedSecretCache()
+
+    assert cache.decrypt(secret_file) == b"plain:ciphertext-v1"
+    assert cache.decrypt(secret_file) == b"plain:ciphertext-v1"
+
+    assert decryptions == [secret_file]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_changed_ciphertext_is_decrypted_again(decryptions, secret_file):
+    cache = DecryptedSecretCache()
+    cache.decrypt(secret_file)
+    secret_file.write_bytes(b"ciphertext-v2")
+
+    assert cache.decrypt(secret_file) == b"plain:ciphertext-v2"
+    assert len(decryptions) == 2
+
+
+def test_failures_are_not_cached(decryptions, secret_file):
+    secret_file.write_bytes(b"undecryptable")
+    cache = DecryptedSecretCache()
+
+    assert cache.decrypt(secret_file) == b""
+    assert cache.decrypt(secret_file) == b""
+
+    assert len(decryptions) == 2
+    assert cache.stats.hits == 0
+
+
+def test_disk_store_is_encrypted_and_read_back(decryptions, secret_file, tmp_path):
+    cache_dir = tmp_path.joinpath("cache")
+    encryption_key = Fernet.generate_key()
+    DecryptedSecretCache(cache_dir, encryption_key).decrypt(secret_file)
+    (entry,) = cache_dir.glob("*.bin")
+
+    assert b"plain:" not in entry.read_bytes()
+    assert stat.S_IMODE(entry.stat().st_mode) == 0o600
+
+    second_process = DecryptedSecretCache(cache_dir, encryption_key)
+    assert second_process.decrypt(secret_file) == b"plain:ciphertext-v1"
+    assert second_process.stats.disk_hits == 1
+    assert len(decryptions) == 1
+
+
+def test_disk_store_evicts_stale_entries(decryptions, secret_file, tmp_path):
+    cache_dir = tmp_path.joinpath("cache")
+    cache = DecryptedSecretCache(cache_dir, Fernet.generate_key())
+    cache.decrypt(secret_file)
+    (stale_entry,) = cache_dir.glob("*.bin")
+    secret_file.write_bytes(b"ciphertext-v2")
+    cache.decrypt(secret_file)
+
+    assert not stale_entry.exists()
+    assert len(list(cache_dir.glob("*.bin"))) == 1
+
+
+def test_disk_store_ignores_entries_under_another_key(
+    decryptions, secret_file, tmp_path
+):
+    cache_dir = tmp_path.joinpath("cache")
+    DecryptedSecretCache(cache_dir, Fernet.generate_key()).decrypt(secret_file)
+    other_key_cache = DecryptedSecretCache(cache_dir, Fernet.generate_key())
+
+    assert other_key_cache.decrypt(secret_file) == b"plain:ciphertext-v1"
+    assert other_key_cache.stats.disk_hits == 0
+    assert len(decryptions) == 2
+
+
+def test_prefetch_warms_the_cache(monkeypatch, decryptions, tmp_path):
+    monkeypatch.setattr(sops, "secret_cache", DecryptedSecretCache())
+    secret_files = []
+    for index in range(3):
+        secret_file = tmp_path.joinpath(f"secret-{index}.yaml")
+        secret_file.write_bytes(f"ciphertext-{index}".encode())
+        secret_files.append(secret_file)
+
+    prefetch_secrets([*secret_files, secret_files[0]])
+    for secret_file in secret_files:
+        sops._decrypt(secret_file)  # noqa: WPS437
+
+    assert sorted(decryptions) == sorted(secret_files)
+    assert sops.cache_stats().hits == 3
+
+
+def test_prefetch_raises_worker_exceptions(monkeypatch, tmp_path):
+    monkeypatch.setattr(sops, "secret_cache", DecryptedSecretCache())
+    worker_threads = set()
+
+    def failing_decrypt(sops_file, ciphertext=None, backend=None):
+        worker_threads.add(threading.current_thread().name)
+        raise RuntimeError(f"KMS unavailable for {sops_file.name}")
+
+    monkeypatch.setattr(sops, "decrypt_sops_file", failing_decrypt)
+    secret_file = tmp_path.joinpath("secret.yaml")
+    secret_file.write_bytes(b"ciphertext")
+
+    with pytest.raises(RuntimeError, match="KMS unavailable"):
+        prefetch_secrets([secret_file])
+    assert all(name.startswith("sops-prefetch") for name in worker_threads)
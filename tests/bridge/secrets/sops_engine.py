@@ -0,0 +1,163 @@
+import base64
+import hashlib
+import json
+import os
+import subprocess
+
+import pytest
+import yaml
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from bridge.secrets import sops, sops_engine
+from bridge.secrets.sops_engine import SopsEngineError, decrypt_document
+
+DATA_KEY = bytes(range(32))
+LAST_MODIFIED = "2022-08-01T00:00:00Z"
+TAG_LENGTH = 16
+
+
+def encrypt_value(plaintext, additional_data):
+    value_type = {str: "str", int: "int", float: "float", bool: "bool"}[type(plaintext)]
+    iv = os.urandom(32)
+    encrypted = AESGCM(DATA_KEY).encrypt(
+        iv, str(plaintext).encode("utf8"), additional_data.encode("utf8")
+    )
+    encoded_data, encoded_iv, encoded_tag = (
+        base64.b64encode(part).decode("utf8")
+        for part in (encrypted[:-TAG_LENGTH], iv, encrypted[-TAG_LENGTH:])
+    )
+    return (
+        f"ENC[AES256_GCM,data:{encoded_data},iv:{encoded_iv},"
+        f"tag:{encoded_tag},type:{value_type}]"
+    )
+
+
+def encrypt_tree(tree_node, path, metadata, digest):
+    if isinstance(tree_node, dict):
+        return {
+            node_key: encrypt_tree(node_value, [*path, node_key], metadata, digest)
+            for node_key, node_value in tree_node.items()
+        }
+    if isinstance(tree_node, list):
+        return [encrypt_tree(item, path, metadata, digest) for item in tree_node]
+    digest.update(sops_engine._mac_bytes(tree_node))  # noqa: WPS437
+    suffix = metadata.get("unencrypted_suffix")
+    if suffix and any(key.endswith(suffix) for key in path):
+        return tree_node
+    return encrypt_value(tree_node, ":".join(path) + ":")
+
+
+def encrypt_document(document, **metadata):
+    digest = hashlib.sha512()
+    encrypted = encrypt_tree(document, [], metadata, digest)
+    encrypted["sops"] = {
+        "kms": [
+            {"arn": "arn:aws:kms:us-east-1:123456789012:key/test", "enc": "wrapped"}
+        ],
+        "lastmodified": LAST_MODIFIED,
+        "mac": encrypt_value(digest.hexdigest().upper(), LAST_MODIFIED),
+        **metadata,
+    }
+    return encrypted
+
+
+SECRETS = {
+    "database": {"username": "app", "password": "s3cr3t", "port": 5432},
+    "replicas": ["db-1", "db-2", {"weight": 0.5, "enabled": True}],
+    "region_unencrypted": "us-east-1",
+}
+
+
+@pytest.fixture(autouse=True)
+def kms_data_key(monkeypatch):
+    unwrapped = []
+
+    def fake_kms(master_key):
+        unwrapped.append(master_key["enc"])
+        return DATA_KEY
+
+    monkeypatch.setitem(sops_engine.MASTER_KEY_UNWRAPPERS, "kms", fake_kms)
+    sops_engine.clear_data_key_cache()
+    yield unwrapped
+    sops_engine.clear_data_key_cache()
+
+
+def test_round_trips_nested_yaml(tmp_path, kms_data_key):
+    sops_file = tmp_path.joinpath("secrets.yaml")
+    sops_file.write_text(yaml.safe_dump(encrypt_document(SECRETS), sort_keys=False))
+
+    assert yaml.safe_load(decrypt_document(sops_file)) == SECRETS
+    assert yaml.safe_load(decrypt_document(sops_file)) == SECRETS
+    assert kms_data_key == ["wrapped"]
+
+
+def test_round_trips_json(tmp_path):
+    sops_file = tmp_path.joinpath("secrets.json")
+    sops_file.write_text(json.dumps(encrypt_document(SECRETS)))
+
+    assert json.loads(decrypt_document(sops_file)) == SECRETS
+
+
+def test_unencrypted_suffix_values_are_left_as_is(tmp_path):
+    encrypted = encrypt_document(SECRETS, unencrypted_suffix="_unencrypted")
+    sops_file = tmp_path.joinpath("secrets.yaml")
+    sops_file.write_text(yaml.safe_dump(encrypted, sort_keys=False))
+
+    assert encrypted["region_unencrypted"] == "us-east-1"
+    assert encrypted["database"]["password"].startswith("ENC[AES256_GCM,")
+    assert yaml.safe_load(decrypt_document(sops_file)) == SECRETS
+
+
+def test_mac_mismatch_is_rejected(tmp_path):
+    encrypted = encrypt_document(SECRETS)
+    # A value encrypted for the same path still authenticates, but changes the MAC.
+    encrypted["database"]["username"] = encrypt_value("admin", "database:username:")
+    sops_file = tmp_path.joinpath("secrets.yaml")
+    sops_file.write_text(yaml.safe_dump(encrypted, sort_keys=False))
+
+    with pytest.raises(SopsEngineError, match="MAC mismatch"):
+        decrypt_document(sops_file)
+
+
+def test_value_moved_to_another_path_fails_authentication(tmp_path):
+    encrypted = encrypt_document(SECRETS)
+    encrypted["database"]["username"] = encrypted["database"]["password"]
+    sops_file = tmp_path.joinpath("secrets.yaml")
+    sops_file.write_text(yaml.safe_dump(encrypted, sort_keys=False))
+
+    with pytest.raises(SopsEngineError, match="Authentication failed"):
+        decrypt_document(sops_file)
+
+
+def test_unsupported_formats_fall_back_to_the_sops_binary(monkeypatch, tmp_path):
+    invocations = []
+
+    def fake_run(command, capture_output):
+        invocations.append(command)
+        return subprocess.CompletedProcess(command, 0, stdout=b"KEY=value\n")
+
+    monkeypatch.setattr(sops.subprocess, "run", fake_run)
+    env_file = tmp_path.joinpath("secrets.env")
+    env_file.write_text("KEY=ENC[AES256_GCM,data:...]\n")
+
+    assert sops.decrypt_sops_file(env_file) == b"KEY=value\n"
+    assert invocations == [[sops.SOPS_BINARY, "--decrypt", env_file]]
+
+
+def test_native_failures_fall_back_to_the_sops_binary(monkeypatch, tmp_path):
+    invocations = []
+
+    def fake_run(command, capture_output):
+        invocations.append(command)
+        return subprocess.CompletedProcess(command, 1, stdout=b"", stderr=b"denied")
+
+    monkeypatch.setattr(sops.subprocess, "run", fake_run)
+    encrypted = encrypt_document(SECRETS)
+    encrypted["database"]["port"] = encrypt_value(5433, "database:port:")
+    sops_file = tmp_path.joinpath("secrets.yaml")
+    sops_file.write_text(yaml.safe_dump(encrypted, sort_keys=False))
+
+    assert sops.decrypt_sops_file(sops_file) is None
+    assert len(invocations) == 1
+    assert sops.decrypt_sops_file(sops_file, backend="subprocess") is None
+    assert len(invocations) == 2
@@ -0,0 +1,54 @@
+import inspect
+from enum import Enum
+
+import pytest
+from pydantic import BaseModel
+
+from concourse.lib.models import codegen, pipeline, pipeline_docs
+
+
+def module_classes(module):
+    return {
+        class_name: module_class
+        for class_name, module_class in inspect.getmembers(module, inspect.isclass)
+        if module_class.__module__ == module.__name__
+    }
+
+
+def test_runtime_models_are_generated_from_docs_models():
+    assert (
+        codegen.runtime_source(codegen.DOCS_MODULE.read_text())
+        == codegen.RUNTIME_MODULE.read_text()
+    ), (
+        "pipeline.py is out of date, regenerate it with "
+        "`python -m concourse.lib.models.codegen`"
+    )
+
+
+def test_runtime_models_have_no_documentation():
+    for field in pipeline.Pipeline.__fields__.values():
+        assert field.field_info.description is None
+
+
+@pytest.mark.parametrize("class_name", sorted(module_classes(pipeline_docs)))
+def test_schemas_match(class_name):
+    docs_class = module_classes(pipeline_docs)[class_name]
+    runtime_class = module_classes(pipeline)[class_name]
+    assert [base.__name__ for base in runtime_class.__bases__] == [
+        base.__name__ for base in docs_class.__bases__
+    ]
+    if issubclass(docs_class, Enum):
+        assert [member.value for member in runtime_class] == [
+            member.value for member in docs_class
+        ]
+    if issubclass(docs_class, BaseModel):
+        assert runtime_class.__config__.extra == docs_class.__config__.extra
+        assert list(runtime_class.__fields__) == list(docs_class.__fields__)
+        for field_name, docs_field in docs_class.__fields__.items():
+            runtime_field = runtime_class.__fields__[field_name]
+            assert runtime_field.alias == docs_field.alias
+            assert runtime_field.required == docs_field.required
+            assert runtime_field.default == docs_field.default
+            assert runtime_field._type_display() == docs_field._type_display().replace(
+                pipeline_docs.__name__, pipeline.__name__
+            )
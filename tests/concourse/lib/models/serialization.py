@@ -0,0 +1,109 @@
+"""Tests for the pipeline serializer.
+
+Run this module directly to benchmark it against `Pipeline.json()`:
+    PYTHONPATH=src python tests/concourse/lib/models/serialization.py [JOB_COUNT]
+"""
+import io
+import json
+import sys
+import timeit
+
+import yaml
+
+from concourse.lib.models.pipeline import (
+    AnonymousResource,
+    Command,
+    DoStep,
+    GetStep,
+    Identifier,
+    InParallelStep,
+    Input,
+    Job,
+    Output,
+    Pipeline,
+    Platform,
+    PutStep,
+    TaskConfig,
+    TaskStep,
+    TryStep,
+)
+from concourse.lib.models.serialization import dump_pipeline, to_primitives
+from concourse.lib.resources import git_repo
+
+
+def generated_pipeline(job_count: int) -> Pipeline:
+    repository = git_repo(
+        name=Identifier("code"), uri="https://github.com/mitodl/ol-infrastructure"
+    )
+    jobs = [
+        Job(
+            name=Identifier(f"build-{job_number}"),
+            plan=[
+                InParallelStep(
+                    in_parallel=[
+                        GetStep(get=repository.name, trigger=True),
+                        GetStep(get=Identifier("image"), params={"skip": True}),
+                    ]
+                ),
+                TaskStep(
+                    task=Identifier(f"compile-{job_number}"),
+                    config=TaskConfig(
+                        platform=Platform.linux,
+                        image_resource=AnonymousResource(
+                            type="registry-image",
+                            source={"repository": "node", "tag": "16"},
+                        ),
+                        inputs=[Input(name=repository.name)],
+                        outputs=[Output(name=Identifier("build"))],
+                        run=Command(path="sh", args=["-exc", "yarn && yarn build"]),
+                    ),
+                ),
+                TryStep(**{"try": DoStep(do=[PutStep(put=Identifier("bucket"))])}),
+            ],
+        )
+        for job_number in range(job_count)
+    ]
+    return Pipeline(resources=[repository], jobs=jobs)
+
+
+def test_matches_pydantic_output_without_nulls():
+    pipeline = generated_pipeline(3)
+    serialized = to_primitives(pipeline)
+    assert serialized == json.loads(pipeline.json(by_alias=True, exclude_none=True))
+    assert "try" in serialized["jobs"][0]["plan"][2]
+    assert "in_parallel" in serialized["jobs"][0]["plan"][0]
+
+
+def test_writes_json_and_yaml_to_every_handle():
+    pipeline = generated_pipeline(2)
+    for output_format, parse in (("json", json.loads), ("yaml", yaml.safe_load)):
+        definition, stdout = io.StringIO(), io.StringIO()
+        dump_pipeline(pipeline, definition, stdout, output_format=output_format)
+        assert definition.getvalue() == stdout.getvalue()
+        assert parse(definition.getvalue()) == to_primitives(pipeline)
+
+
+def benchmark(job_count: int = 500, repetitions: int = 5) -> None:
+    pipeline = generated_pipeline(job_count)
+    timings = {
+        "Pipeline.json(indent=2)": lambda: pipeline.json(indent=2),
+        "Pipeline.json(by_alias, exclude_none)": lambda: pipeline.json(
+            indent=2, by_alias=True, exclude_none=True
+        ),
+        "dump_pipeline json": lambda: dump_pipeline(pipeline, io.StringIO()),
+        "dump_pipeline compact json": lambda: dump_pipeline(
+            pipeline, io.StringIO(), indent=None
+        ),
+        "dump_pipeline yaml": lambda: dump_pipeline(
+            pipeline, io.StringIO(), output_format="yaml"
+        ),
+    }
+    baseline = None
+    for label, serialize in timings.items():
+        seconds = min(timeit.repeat(serialize, number=1, repeat=repetitions))
+        baseline = baseline or seconds
+        print(f"{label:<40} {seconds * 1000:>8.1f}ms {baseline / seconds:>6.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
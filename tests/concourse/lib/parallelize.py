@@ -0,0 +1,63 @@
+from concourse.lib.models.pipeline import (
+    DoStep,
+    GetStep,
+    Identifier,
+    InParallelConfig,
+    InParallelStep,
+    Job,
+    Pipeline,
+    TaskStep,
+)
+from concourse.lib.parallelize import parallelize_gets, parallelize_pipeline_gets
+
+
+def test_groups_consecutive_gets():
+    steps = [
+        GetStep(get="code", trigger=True),
+        GetStep(get="image"),
+        TaskStep(task=Identifier("build")),
+        GetStep(get="config"),
+        DoStep(do=[GetStep(get="a"), GetStep(get="b")]),
+    ]
+    parallelized = parallelize_gets(steps)
+    assert isinstance(parallelized[0], InParallelStep)
+    assert [step.get for step in parallelized[0].in_parallel] == ["code", "image"]
+    assert parallelized[1:3] == steps[2:4]
+    assert isinstance(parallelized[3].do[0], InParallelStep)
+    assert len(steps) == 5
+    assert isinstance(steps[4].do[0], GetStep)
+
+
+def test_keeps_dependent_gets_in_order():
+    steps = [
+        GetStep(get="version"),
+        GetStep(get="release", params={"version_file": "version/number"}),
+        GetStep(get="code"),
+    ]
+    parallelized = parallelize_gets(steps)
+    assert parallelized[0] == steps[0]
+    assert [step.get for step in parallelized[1].in_parallel] == ["release", "code"]
+
+
+def test_leading_only_and_parallel_config():
+    steps = [
+        GetStep(get="code"),
+        GetStep(get="image"),
+        TaskStep(task=Identifier("build")),
+        GetStep(get="a"),
+        GetStep(get="b"),
+    ]
+    parallelized = parallelize_gets(steps, limit=2, fail_fast=True, leading_only=True)
+    assert len(parallelized) == 4
+    assert isinstance(parallelized[0].in_parallel, InParallelConfig)
+    assert parallelized[0].in_parallel.limit.__root__ == 2
+    assert parallelized[0].in_parallel.fail_fast is True
+
+
+def test_parallelize_pipeline_gets():
+    pipeline = Pipeline(
+        jobs=[Job(name=Identifier("build"), plan=[GetStep(get="a"), GetStep(get="b")])]
+    )
+    parallelized = parallelize_pipeline_gets(pipeline)
+    assert isinstance(parallelized.jobs[0].plan[0], InParallelStep)
+    assert isinstance(pipeline.jobs[0].plan[0], GetStep)
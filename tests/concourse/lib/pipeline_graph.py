@@ -0,0 +1,79 @@
+from concourse.lib.models.pipeline import (
+    DoStep,
+    GetStep,
+    Identifier,
+    InParallelStep,
+    Job,
+    Pipeline,
+    PutStep,
+    TaskStep,
+)
+from concourse.lib.pipeline_graph import analyze_pipeline, serial_depth
+from concourse.lib.resources import git_repo
+
+
+def example_pipeline() -> Pipeline:
+    code = git_repo(name=Identifier("code"), uri="https://github.com/mitodl/example")
+    image = git_repo(name=Identifier("image"), uri="https://github.com/mitodl/image")
+    unused = git_repo(name=Identifier("unused"), uri="https://github.com/mitodl/unused")
+    return Pipeline(
+        resources=[code, image, unused],
+        jobs=[
+            Job(
+                name=Identifier("build"),
+                plan=[
+                    GetStep(get=code.name, trigger=True),
+                    GetStep(get=image.name),
+                    TaskStep(task=Identifier("compile")),
+                    PutStep(put=image.name),
+                ],
+            ),
+            Job(
+                name=Identifier("test"),
+                plan=[
+                    InParallelStep(
+                        in_parallel=[
+                            GetStep(get=code.name, passed=["build"], trigger=True),
+                            GetStep(get=image.name, passed=["build"]),
+                        ]
+                    ),
+                    TaskStep(task=Identifier("unit")),
+                ],
+            ),
+            Job(
+                name=Identifier("deploy"),
+                plan=[
+                    DoStep(
+                        do=[
+                            GetStep(get=code.name, passed=["build", "test"]),
+                            GetStep(get=image.name, passed=["test"]),
+                            TaskStep(task=Identifier("deploy")),
+                        ]
+                    )
+                ],
+            ),
+        ],
+    )
+
+
+def test_serial_depth_counts_parallel_steps_once():
+    assert serial_depth(example_pipeline().jobs[1].plan) == 2
+
+
+def test_analyze_pipeline():
+    report = analyze_pipeline(example_pipeline())
+    assert report.critical_path == ["build", "test", "deploy"]
+    assert report.critical_path_steps == 9
+    assert report.max_parallel_jobs == 1
+    assert report.fan_in == {"build": 0, "test": 1, "deploy": 2}
+    assert report.fan_out == {"build": 2, "test": 1, "deploy": 0}
+    assert [(chain.job, chain.resources) for chain in report.serial_get_chains] == [
+        ("build", ["code", "image"]),
+        ("deploy", ["code", "image"]),
+    ]
+    assert report.shared_resources == {
+        "code": ["build", "deploy", "test"],
+        "image": ["build", "deploy", "test"],
+    }
+    assert report.untriggered_jobs == ["deploy"]
+    assert report.unused_resources == ["unused"]
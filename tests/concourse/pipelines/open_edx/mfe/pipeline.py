@@ -0,0 +1,185 @@
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from concourse.pipelines.open_edx.mfe.pipeline import (
+    INJECT_CONFIG_SCRIPT,
+    MAPLE_NODE_MAJOR_VERSION,
+    MFEAppVars,
+    OpenEdxVars,
+    build_once_jobs,
+    build_once_params,
+    mfe_pipeline,
+    pipeline_vars,
+    placeholder,
+)
+from concourse.pipelines.open_edx.mfe.values import apps, deployments
+
+
+def test_pipeline_vars_override_release_and_node_version():
+    open_edx_envs, mfe = pipeline_vars(
+        "xpro", "authoring", deployments["xpro"], apps["authoring"]
+    )
+    assert {open_edx.release_name for open_edx in open_edx_envs} == {"master"}
+    assert mfe.node_major_version == apps["authoring"].node_major_version
+    # The shared values are left untouched.
+    assert "maple" in deployments["xpro"][0].release_name
+    _, maple_mfe = pipeline_vars("xpro", "learn", deployments["xpro"], apps["learn"])
+    assert maple_mfe.node_major_version == MAPLE_NODE_MAJOR_VERSION
+    assert apps["learn"].node_major_version != MAPLE_NODE_MAJOR_VERSION
+
+
+def test_pipeline_vars_build_mitxonline_learning_from_fork():
+    open_edx_envs, mfe = pipeline_vars(
+        "mitxonline", "learn", deployments["mitxonline"], apps["learn"]
+    )
+    assert mfe.repository == "https://github.com/mitodl/frontend-app-learning.git"
+    assert {open_edx.release_name for open_edx in open_edx_envs} == {"open-learning"}
+    assert apps["learn"].repository.startswith("https://github.com/openedx/")
+
+
+def open_edx_env(environment, lms_domain):
+    return OpenEdxVars(
+        contact_url=None,
+        environment=environment,
+        favicon_url="https://example.com/favicon.ico",
+        honor_code_url=None,
+        lms_domain=lms_domain,
+        logo_url="https://example.com/logo.png",
+        marketing_site_domain="example.com",
+        release_name="open-release/nutmeg.master",
+        site_name="MITx Online",
+        studio_domain=f"studio.{lms_domain}",
+        support_url="example.com/support",
+        terms_of_service_url="https://example.com/tos",
+        trademark_text=None,
+    )
+
+
+@pytest.fixture()
+def open_edx_envs():
+    return [
+        open_edx_env("mitxonline-qa", "courses-qa.example.com"),
+        open_edx_env("mitxonline-production", "courses.example.com"),
+    ]
+
+
+@pytest.fixture()
+def mfe():
+    return MFEAppVars(
+        node_major_version=16,
+        path="learn",
+        repository="https://github.com/openedx/frontend-app-learning.git",
+        build_once=True,
+    )
+
+
+def test_build_once_params_compile_in_shared_settings(open_edx_envs, mfe):
+    params = build_once_params(open_edx_envs, mfe)
+    assert params["SITE_NAME"] == "MITx Online"
+    assert params["PUBLIC_PATH"] == "/learn/"
+    assert params["CONTACT_URL"] is None
+    assert params["LMS_BASE_URL"] == placeholder("LMS_BASE_URL")
+    assert params["USER_INFO_COOKIE_NAME"] == placeholder("USER_INFO_COOKIE_NAME")
+    assert build_once_params(open_edx_envs[:1], mfe)["LMS_BASE_URL"] == (
+        "https://courses-qa.example.com"
+    )
+
+
+def test_build_once_jobs_promote_the_artifact(open_edx_envs, mfe):
+    compile_job, qa_job, production_job = build_once_jobs(open_edx_envs, mfe)
+    assert compile_job.name == "compile-mfe-learn"
+    assert compile_job.plan[0].trigger
+    for deploy_job, previous_job in (
+        (qa_job, compile_job),
+        (production_job, qa_job),
+    ):
+        get_artifact = deploy_job.plan[0]
+        assert get_artifact.get == "mfe-artifact"
+        assert get_artifact.passed == [previous_job.name]
+    assert qa_job.plan[0].trigger
+    assert not production_job.plan[0].trigger
+    production_params = production_job.plan[1].config.params
+    assert production_params["LMS_BASE_URL"] == "https://courses.example.com"
+    assert "SITE_NAME" not in production_params
+
+
+def test_build_once_artifact_regexp(open_edx_envs, mfe):
+    pipeline = mfe_pipeline(open_edx_envs, mfe)
+    artifact = next(
+        resource for resource in pipeline.resources if resource.name == "mfe-artifact"
+    )
+    assert artifact.source["regexp"] == r"mfe/mitxonline-qa/learn/mfe-learn-(\d+)\.tgz"
+
+
+@pytest.fixture()
+def inject_config(tmp_path):
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node is not installed")
+    source = tmp_path.joinpath("compiled-mfe")
+    source.joinpath("static").mkdir(parents=True)
+    destination = tmp_path.joinpath("configured-mfe")
+
+    def run_script(files, params):  # noqa: WPS430
+        for file_name, content in files.items():
+            source.joinpath(file_name).write_text(content)
+        return subprocess.run(  # noqa: S603
+            [node, "-e", INJECT_CONFIG_SCRIPT, str(source), str(destination), *params],
+            env={**os.environ, **params},
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    return run_script, destination
+
+
+def test_inject_config_escapes_values_for_each_file_type(inject_config):
+    run_script, destination = inject_config
+    site_name = """Bob's "<Online>" & `co` \\ more"""
+    result = run_script(
+        {
+            "index.html": "<title>__MFE_CONFIG_SITE_NAME__</title>",
+            "static/app.js": "a=\"__MFE_CONFIG_SITE_NAME__\";b='__MFE_CONFIG_SITE_NAME__';",
+            "static/app.js.map": '{"s": "__MFE_CONFIG_SITE_NAME__"}',
+            "static/logo.png": "__MFE_CONFIG_UNSET__",
+        },
+        {"SITE_NAME": site_name},
+    )
+    assert result.returncode == 0, result.stderr
+    assert destination.joinpath("index.html").read_text() == (
+        "<title>Bob&#39;s &quot;&lt;Online&gt;&quot; &amp; `co` \\ more</title>"
+    )
+    assert json.loads(destination.joinpath("static/app.js.map").read_text()) == {
+        "s": site_name
+    }
+    check_js = subprocess.run(  # noqa: S603
+        [
+            shutil.which("node"),
+            "-e",
+            destination.joinpath("static/app.js").read_text()
+            + "process.stdout.write(JSON.stringify([a, b]))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(check_js.stdout) == [site_name, site_name]
+    # Files which aren't text are copied as they are.
+    assert destination.joinpath("static/logo.png").read_text() == (
+        "__MFE_CONFIG_UNSET__"
+    )
+
+
+def test_inject_config_fails_on_leftover_placeholders(inject_config):
+    run_script, _ = inject_config
+    result = run_script(
+        {"index.html": "__MFE_CONFIG_SITE_NAME__ __MFE_CONFIG_LMS_BASE_URL__"},
+        {"SITE_NAME": "MITx Online"},
+    )
+    assert result.returncode != 0
+    assert "No value for __MFE_CONFIG_LMS_BASE_URL__" in result.stderr
@@ -0,0 +1,17 @@
+import os
+from pathlib import Path
+
+from ol_infrastructure.lib.aws.iam_helper import IAM_LINT_CACHE_ENV
+from ol_infrastructure.lib.aws.metadata_cache import (
+    METADATA_CACHE_ENV,
+    METADATA_OFFLINE_ENV,
+)
+
+# Serve AWS metadata lookups (regions, engine versions, etc.) from a checked in
+# snapshot so that the tests don't require AWS credentials or network access.
+os.environ.setdefault(
+    METADATA_CACHE_ENV, str(Path(__file__).parent.joinpath("aws_metadata.json"))
+)
+os.environ.setdefault(METADATA_OFFLINE_ENV, "true")
+# Only memoize IAM lint results in process rather than writing to the user's cache.
+os.environ.setdefault(IAM_LINT_CACHE_ENV, "")
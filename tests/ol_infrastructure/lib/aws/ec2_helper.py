@@ -0,0 +1,119 @@
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from ol_infrastructure.lib.aws import ec2_helper
+from ol_infrastructure.lib.aws.ec2_helper import (
+    EC2DiscoverySnapshot,
+    subnet_availability_zone,
+)
+
+
+def subnet(subnet_id, vpc_id, cidr_block, zone):
+    return {
+        "SubnetId": subnet_id,
+        "VpcId": vpc_id,
+        "CidrBlock": cidr_block,
+        "AvailabilityZone": zone,
+    }
+
+
+@pytest.fixture()
+def ec2_stub(monkeypatch):
+    ec2_client = boto3.client(
+        "ec2",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",  # noqa: S106
+    )
+    monkeypatch.setattr(
+        ec2_helper, "aws_client", lambda service_name, region_name=None: ec2_client
+    )
+    ec2_helper.discovery_snapshot.cache_clear()
+    with Stubber(ec2_client) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+    ec2_helper.discovery_snapshot.cache_clear()
+
+
+def add_subnet_pages(ec2_stub):
+    ec2_stub.add_response(
+        "describe_subnets",
+        {
+            "Subnets": [
+                subnet("subnet-1", "vpc-1", "10.0.0.0/24", "us-east-1a"),
+                subnet("subnet-2", "vpc-1", "10.0.1.0/24", "us-east-1b"),
+            ],
+            "NextToken": "page-2",
+        },
+        {},
+    )
+    ec2_stub.add_response(
+        "describe_subnets",
+        {"Subnets": [subnet("subnet-3", "vpc-2", "10.0.0.0/24", "us-east-1c")]},
+        {"NextToken": "page-2"},
+    )
+
+
+def test_subnets_are_listed_once_across_pages(ec2_stub):
+    add_subnet_pages(ec2_stub)
+    snapshot = EC2DiscoverySnapshot("us-east-1")
+
+    assert sorted(snapshot.subnets_by_id) == ["subnet-1", "subnet-2", "subnet-3"]
+    assert [
+        found["SubnetId"] for found in snapshot.subnets("10.0.0.0/24", "vpc-2")
+    ] == ["subnet-3"]
+    assert snapshot.subnets("10.0.2.0/24", "vpc-1") == []
+
+
+def test_vpcs_and_route_tables_are_indexed(ec2_stub):
+    ec2_stub.add_response(
+        "describe_vpcs",
+        {
+            "Vpcs": [
+                {
+                    "VpcId": "vpc-1",
+                    "CidrBlock": "10.0.0.0/16",
+                    "Tags": [{"Key": "Name", "Value": "applications"}],
+                },
+                {"VpcId": "vpc-2", "CidrBlock": "10.0.0.0/16"},
+            ]
+        },
+        {},
+    )
+    ec2_stub.add_response(
+        "describe_route_tables",
+        {
+            "RouteTables": [
+                {
+                    "RouteTableId": "rtb-1",
+                    "Routes": [{"GatewayId": "igw-1"}, {"GatewayId": "local"}],
+                }
+            ]
+        },
+        {},
+    )
+    snapshot = EC2DiscoverySnapshot("us-east-1")
+
+    assert [vpc["VpcId"] for vpc in snapshot.vpcs("10.0.0.0/16", "applications")] == [
+        "vpc-1"
+    ]
+    assert [table["RouteTableId"] for table in snapshot.route_tables("igw-1")] == [
+        "rtb-1"
+    ]
+    assert snapshot.route_tables("igw-2") == []
+
+
+def test_subnet_availability_zone(ec2_stub):
+    add_subnet_pages(ec2_stub)
+
+    assert subnet_availability_zone("subnet-3") == "us-east-1c"
+    # Served from the shared snapshot without listing the subnets again.
+    assert subnet_availability_zone("subnet-1") == "us-east-1a"
+
+
+def test_unknown_subnet_is_reported(ec2_stub):
+    add_subnet_pages(ec2_stub)
+
+    with pytest.raises(KeyError, match="subnet-404 was not found"):
+        subnet_availability_zone("subnet-404")
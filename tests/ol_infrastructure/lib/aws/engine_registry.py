@@ -0,0 +1,136 @@
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+
+from ol_infrastructure.lib.aws import elasticache_helper, rds_helper
+from ol_infrastructure.lib.aws.engine_registry import EngineVersionRegistry
+from ol_infrastructure.lib.aws.metadata_cache import (
+    METADATA_CACHE_ENV,
+    METADATA_OFFLINE_ENV,
+)
+
+POSTGRES_FAMILIES = {"13.7": "postgres13", "14.3": "postgres14"}
+
+
+@pytest.fixture()
+def lookups():
+    looked_up = []
+
+    def lookup(engine):
+        looked_up.append(engine)
+        return POSTGRES_FAMILIES if engine == "postgres" else {}
+
+    return looked_up, EngineVersionRegistry("RDS", lookup)
+
+
+@pytest.fixture()
+def metadata_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv(METADATA_CACHE_ENV, str(tmp_path.joinpath("metadata.json")))
+    monkeypatch.setenv(METADATA_OFFLINE_ENV, "false")
+
+
+def stubbed_client(monkeypatch, helper_module, service_name):
+    client = boto3.client(
+        service_name,
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",  # noqa: S106
+    )
+    monkeypatch.setattr(helper_module, "aws_client", lambda requested_service: client)
+    return Stubber(client)
+
+
+def test_registry_validates_engines_and_versions(lookups):
+    looked_up, registry = lookups
+
+    assert registry.is_valid_engine("postgres")
+    assert not registry.is_valid_engine("oracle")
+    assert registry.is_valid_version("postgres", "14.3")
+    assert not registry.is_valid_version("postgres", "9.6")
+    assert not registry.is_valid_version(None, "14.3")
+    assert looked_up == ["postgres", "oracle", "postgres", "postgres"]
+
+
+def test_registry_resolves_parameter_group_families(lookups):
+    _, registry = lookups
+
+    assert registry.parameter_group_family("postgres", "13.7") == "postgres13"
+    with pytest.raises(ValueError, match="Version 9.6 of the postgres engine"):
+        registry.parameter_group_family("postgres", "9.6")
+
+
+def test_rds_version_families_are_looked_up_per_engine(monkeypatch, metadata_cache):
+    with stubbed_client(monkeypatch, rds_helper, "rds") as stubber:
+        stubber.add_response(
+            "describe_db_engine_versions",
+            {
+                "DBEngineVersions": [
+                    {"EngineVersion": "13.7", "DBParameterGroupFamily": "postgres13"}
+                ],
+                "Marker": "page-2",
+            },
+            {"Engine": "postgres"},
+        )
+        stubber.add_response(
+            "describe_db_engine_versions",
+            {
+                "DBEngineVersions": [
+                    {"EngineVersion": "14.3", "DBParameterGroupFamily": "postgres14"}
+                ]
+            },
+            {"Engine": "postgres", "Marker": "page-2"},
+        )
+
+        assert rds_helper.engine_version_families("postgres") == POSTGRES_FAMILIES
+        # The second lookup is served from the metadata cache.
+        assert rds_helper.parameter_group_family("postgres", "14.3") == "postgres14"
+        stubber.assert_no_pending_responses()
+
+
+def test_cache_version_families_are_looked_up_per_engine(monkeypatch, metadata_cache):
+    with stubbed_client(monkeypatch, elasticache_helper, "elasticache") as stubber:
+        stubber.add_response(
+            "describe_cache_engine_versions",
+            {
+                "CacheEngineVersions": [
+                    {"EngineVersion": "6.2", "CacheParameterGroupFamily": "redis6.x"}
+                ]
+            },
+            {"Engine": "redis"},
+        )
+        stubber.add_response(
+            "describe_cache_engine_versions",
+            {"CacheEngineVersions": []},
+            {"Engine": "valkey"},
+        )
+
+        assert elasticache_helper.parameter_group_family("redis", "6.2") == "redis6.x"
+        assert not elasticache_helper.cache_engine_registry.is_valid_engine("valkey")
+        stubber.assert_no_pending_responses()
+
+
+def test_unknown_engines_are_not_valid(monkeypatch, metadata_cache):
+    with stubbed_client(monkeypatch, rds_helper, "rds") as stubber:
+        stubber.add_client_error(
+            "describe_db_engine_versions",
+            service_error_code="InvalidParameterValue",
+            service_message="Invalid DB engine: postgress",
+            expected_params={"Engine": "postgress"},
+        )
+
+        assert rds_helper.engine_version_families("postgress") == {}
+        assert not rds_helper.rds_engine_registry.is_valid_engine("postgress")
+        stubber.assert_no_pending_responses()
+
+
+def test_other_engine_lookup_errors_are_raised(monkeypatch, metadata_cache):
+    with stubbed_client(monkeypatch, elasticache_helper, "elasticache") as stubber:
+        stubber.add_client_error(
+            "describe_cache_engine_versions",
+            service_error_code="AccessDenied",
+            expected_params={"Engine": "redis"},
+        )
+
+        with pytest.raises(ClientError):
+            elasticache_helper.engine_version_families("redis")
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from ol_infrastructure.lib.aws import iam_helper
+from ol_infrastructure.lib.aws.iam_helper import (
+    IAM_LINT_CACHE_ENV,
+    lint_iam_policies,
+    lint_iam_policy,
+)
+
+VALID_POLICY = {
+    "Version": iam_helper.IAM_POLICY_VERSION,
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Action": ["s3:GetObject"],
+            "Resource": ["arn:aws:s3:::ol-test-bucket/*"],
+        }
+    ],
+}
+
+
+@pytest.fixture()
+def lint_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv(IAM_LINT_CACHE_ENV, str(tmp_path.joinpath("iam_lint.json")))
+    iam_helper.lint_result_cache.clear()
+    yield iam_helper.lint_result_cache
+    iam_helper.lint_result_cache.clear()
+
+
+def test_clean_policy_is_only_analyzed_once(lint_cache, monkeypatch):
+    analyzed = []
+    original_findings = iam_helper._policy_findings  # noqa: WPS437
+
+    def counting_findings(policy_string, parliament_config):
+        analyzed.append(policy_string)
+        return original_findings(policy_string, parliament_config)
+
+    monkeypatch.setattr(iam_helper, "_policy_findings", counting_findings)
+    assert lint_iam_policy(VALID_POLICY) == VALID_POLICY
+    assert lint_iam_policy(VALID_POLICY, stringify=True) == json.dumps(VALID_POLICY)
+    assert len(analyzed) == 1
+    # Persisted results are honored by a fresh process.
+    lint_cache._clean_digests.clear()  # noqa: WPS437
+    lint_iam_policy(VALID_POLICY)
+    assert len(analyzed) == 1
+
+
+def test_policy_with_findings_is_not_cached(lint_cache):
+    bad_policy = {
+        "Version": iam_helper.IAM_POLICY_VERSION,
+        "Statement": [{"Effect": "Allow", "Action": "s3:GetObjct", "Resource": "*"}],
+    }
+    for _ in range(2):
+        with pytest.raises(Exception, match="Potential issues"):
+            lint_iam_policy(bad_policy)
+
+
+def test_batch_lint_reports_every_policy(lint_cache):
+    bad_policy = {
+        "Version": iam_helper.IAM_POLICY_VERSION,
+        "Statement": [{"Effect": "Allow", "Action": "s3:GetObjct", "Resource": "*"}],
+    }
+    report = lint_iam_policies(
+        {
+            "valid": VALID_POLICY,
+            "invalid": bad_policy,
+            "string": json.dumps(bad_policy),
+        },
+        max_workers=2,
+    )
+    assert not report.is_clean
+    assert report.findings["valid"] == []
+    assert report.findings["invalid"]
+    assert report.findings["string"]
+    with pytest.raises(Exception, match="Potential issues"):
+        report.raise_for_findings()
+    assert lint_iam_policies({"valid": VALID_POLICY}).is_clean
@@ -0,0 +1,150 @@
+import json
+import runpy
+import sys
+import threading
+
+import pytest
+
+from ol_infrastructure.lib.aws import (
+    ec2_helper,
+    elasticache_helper,
+    metadata_cache,
+    rds_helper,
+)
+from ol_infrastructure.lib.aws.metadata_cache import (
+    METADATA_CACHE_ENV,
+    METADATA_OFFLINE_ENV,
+    MetadataCache,
+    MetadataCacheMissError,
+    UnknownMetadataLookupError,
+    cached_metadata,
+    refresh_metadata_cache,
+)
+
+ENGINE_FAMILIES_KEY = (
+    'ol_infrastructure.lib.aws.rds_helper.engine_version_families:["postgres"]'
+)
+
+
+@pytest.fixture()
+def cache_path(monkeypatch, tmp_path):
+    metadata_path = tmp_path.joinpath("aws_metadata.json")
+    monkeypatch.setenv(METADATA_CACHE_ENV, str(metadata_path))
+    monkeypatch.setenv(METADATA_OFFLINE_ENV, "false")
+    return metadata_path
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(metadata_cache.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture()
+def refreshed(monkeypatch):
+    refreshed_lookups = []
+    lookups = [
+        ec2_helper.aws_regions,
+        ec2_helper.availability_zones,
+        elasticache_helper.cache_engines,
+        elasticache_helper.engine_version_families,
+        rds_helper.db_engines,
+        rds_helper.engine_version_families,
+    ]
+    for lookup in lookups:
+        monkeypatch.setattr(
+            lookup,
+            "refresh",
+            lambda *args, lookup_name=lookup.__qualname__: refreshed_lookups.append(
+                (lookup_name, args)
+            ),
+        )
+    return refreshed_lookups
+
+
+def test_entries_expire_after_their_ttl(cache_path, clock):
+    cache = MetadataCache(cache_path)
+    cache.set("regions", ["us-east-1"], ttl=60)
+
+    clock[0] += 59
+    assert cache.get("regions") == ["us-east-1"]
+    clock[0] += 2
+    with pytest.raises(KeyError):
+        cache.get("regions")
+    assert cache.get("regions", allow_expired=True) == ["us-east-1"]
+
+
+def test_offline_miss_does_not_call_the_lookup(cache_path, monkeypatch):
+    calls = []
+
+    @cached_metadata(ttl=60)
+    def regions():
+        calls.append("regions")
+        return ["us-east-1"]
+
+    monkeypatch.setenv(METADATA_OFFLINE_ENV, "true")
+    with pytest.raises(MetadataCacheMissError):
+        regions()
+    assert calls == []
+
+    monkeypatch.setenv(METADATA_OFFLINE_ENV, "false")
+    assert regions() == ["us-east-1"]
+    monkeypatch.setenv(METADATA_OFFLINE_ENV, "true")
+    assert regions() == ["us-east-1"]
+    assert calls == ["regions"]
+
+
+def test_offline_mode_serves_expired_entries(cache_path, clock, monkeypatch):
+    @cached_metadata(ttl=60)
+    def zones():
+        return ["us-east-1a"]
+
+    zones()
+    clock[0] += 120
+    monkeypatch.setenv(METADATA_OFFLINE_ENV, "true")
+
+    assert zones() == ["us-east-1a"]
+
+
+def test_writes_wait_for_the_file_lock(cache_path):
+    holder = MetadataCache(cache_path)
+    writer = MetadataCache(cache_path)
+    holder.set("first", 1, ttl=60)
+    with holder._file_lock():  # noqa: WPS437
+        write_thread = threading.Thread(target=writer.set, args=("second", 2, 60))
+        write_thread.start()
+        write_thread.join(timeout=0.2)
+        assert write_thread.is_alive()
+    write_thread.join(timeout=5)
+
+    assert not write_thread.is_alive()
+    assert set(json.loads(cache_path.read_text())) == {"first", "second"}
+    assert holder.get("second") == 2
+
+
+def test_refresh_covers_every_cached_lookup(cache_path, refreshed):
+    MetadataCache(cache_path).set(ENGINE_FAMILIES_KEY, {"14.2": "postgres14"}, 60)
+
+    refreshed_keys = refresh_metadata_cache()
+
+    assert ENGINE_FAMILIES_KEY in refreshed_keys
+    assert ("engine_version_families", ("postgres",)) in refreshed
+    assert ("aws_regions", ()) in refreshed
+
+
+def test_refresh_fails_on_unknown_lookups(cache_path, refreshed):
+    MetadataCache(cache_path).set("removed_module.lookup:[]", [], 60)
+
+    with pytest.raises(UnknownMetadataLookupError, match="removed_module.lookup"):
+        refresh_metadata_cache()
+    assert refreshed == []
+
+
+def test_refresh_from_the_command_line(cache_path, refreshed, monkeypatch):
+    MetadataCache(cache_path).set(ENGINE_FAMILIES_KEY, {"14.2": "postgres14"}, 60)
+    monkeypatch.setattr(sys, "argv", ["metadata_cache", "refresh"])
+
+    runpy.run_module("ol_infrastructure.lib.aws.metadata_cache", run_name="__main__")
+
+    assert ("engine_version_families", ("postgres",)) in refreshed
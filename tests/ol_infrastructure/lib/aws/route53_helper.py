@@ -0,0 +1,271 @@
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from ol_infrastructure.lib.aws import route53_helper
+from ol_infrastructure.lib.aws.route53_helper import (
+    ROUTE53_TAGS_BATCH_SIZE,
+    HostedZone,
+    HostedZoneIndex,
+    acm_certificate_validation_records,
+    zone_opts,
+)
+
+ZONE_COUNT = 23
+
+
+def hosted_zone(zone_number, name, private=False):
+    return {
+        "Id": f"/hostedzone/Z{zone_number}",
+        "Name": f"{name}.",
+        "CallerReference": str(zone_number),
+        "Config": {"PrivateZone": private},
+    }
+
+
+@pytest.fixture()
+def route53_stub(monkeypatch):
+    route53_client = boto3.client(
+        "route53",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",  # noqa: S106
+    )
+    monkeypatch.setattr(
+        route53_helper, "aws_client", lambda service_name: route53_client
+    )
+    with Stubber(route53_client) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+
+@pytest.fixture()
+def zone_index(monkeypatch):
+    index = HostedZoneIndex()
+    index.__dict__["zones_by_name"] = {
+        "odl.mit.edu": [
+            HostedZone("ZPRIVATE", "odl.mit.edu", private=True),
+            HostedZone("ZODL", "odl.mit.edu", private=False),
+        ],
+        "mitx.mit.edu": [
+            HostedZone(
+                "ZMITX", "mitx.mit.edu", private=False, tags={"pulumi_managed": "true"}
+            )
+        ],
+        "internal.mit.edu": [HostedZone("ZINTERNAL", "internal.mit.edu", private=True)],
+    }
+    monkeypatch.setattr(route53_helper, "hosted_zone_index", lambda: index)
+    return index
+
+
+@pytest.fixture()
+def tag_queue(monkeypatch):
+    queued = []
+    monkeypatch.setattr(
+        route53_helper.pulumi_managed_tag_queue,
+        "enqueue",
+        lambda service, zone_id: queued.append((service, zone_id)),
+    )
+    monkeypatch.setattr(route53_helper.pulumi.runtime, "is_dry_run", lambda: False)
+    return queued
+
+
+def test_index_lists_zones_and_fetches_tags_in_batches(route53_stub):
+    zones = [
+        hosted_zone(number, f"zone{number}.mit.edu") for number in range(ZONE_COUNT)
+    ]
+    route53_stub.add_response(
+        "list_hosted_zones",
+        {
+            "HostedZones": zones[:20],
+            "Marker": "",
+            "IsTruncated": True,
+            "NextMarker": "page-2",
+            "MaxItems": "20",
+        },
+        {},
+    )
+    route53_stub.add_response(
+        "list_hosted_zones",
+        {
+            "HostedZones": zones[20:],
+            "Marker": "page-2",
+            "IsTruncated": False,
+            "MaxItems": "20",
+        },
+        {"Marker": "page-2"},
+    )
+    zone_ids = [f"Z{number}" for number in range(ZONE_COUNT)]
+    for batch_start in range(0, ZONE_COUNT, ROUTE53_TAGS_BATCH_SIZE):
+        batch = zone_ids[batch_start : batch_start + ROUTE53_TAGS_BATCH_SIZE]
+        route53_stub.add_response(
+            "list_tags_for_resources",
+            {
+                "ResourceTagSets": [
+                    {
+                        "ResourceType": "hostedzone",
+                        "ResourceId": zone_id,
+                        "Tags": [{"Key": "Name", "Value": zone_id}],
+                    }
+                    for zone_id in batch
+                ]
+            },
+            {"ResourceType": "hostedzone", "ResourceIds": batch},
+        )
+    index = HostedZoneIndex()
+
+    zone = index.exact_match("ZONE22.mit.edu.")
+    assert zone == HostedZone("Z22", "zone22.mit.edu", private=False)
+    assert zone.tags == {"Name": "Z22"}
+    # Further lookups are served from memory.
+    assert index.exact_match("zone3.mit.edu").zone_id == "Z3"
+
+
+def test_parent_zone_is_the_most_specific_suffix(zone_index):
+    index = zone_index
+    index.zones_by_name["mit.edu"] = [HostedZone("ZMIT", "mit.edu", private=False)]
+
+    assert index.parent_zone("lms.odl.mit.edu").zone_id == "ZODL"
+    assert index.parent_zone("odl.mit.edu").zone_id == "ZODL"
+    assert index.parent_zone("app.internal.mit.edu").zone_id == "ZMIT"
+    assert index.parent_zone("app.internal.mit.edu", private_zone=True).zone_id == (
+        "ZINTERNAL"
+    )
+    assert index.parent_zone("example.com") is None
+
+
+def test_zone_opts_imports_an_unmanaged_public_zone(zone_index, tag_queue):
+    opts = zone_opts("odl.mit.edu")
+
+    assert opts.import_ == "ZODL"
+    assert opts.ignore_changes == ["tags", "comment"]
+    assert tag_queue == [("route53", "ZODL")]
+
+
+def test_zone_opts_leaves_managed_zones_alone(zone_index, tag_queue):
+    opts = zone_opts("mitx.mit.edu")
+
+    assert opts.import_ is None
+    assert tag_queue == []
+
+
+@pytest.mark.parametrize(
+    "domain",
+    [
+        # Only a private zone has this name.
+        "internal.mit.edu",
+        # Only a parent zone exists, so a new delegated zone is created.
+        "lms.odl.mit.edu",
+    ],
+)
+def test_zone_opts_creates_a_zone_without_an_exact_public_match(
+    zone_index, tag_queue, domain
+):
+    opts = zone_opts(domain)
+
+    assert opts.import_ is None
+    assert tag_queue == []
+
+
+def test_zone_opts_does_not_tag_during_previews(zone_index, tag_queue, monkeypatch):
+    monkeypatch.setattr(route53_helper.pulumi.runtime, "is_dry_run", lambda: True)
+
+    assert zone_opts("odl.mit.edu").import_ == "ZODL"
+    assert tag_queue == []
+
+
+class FakeRecord:
+    def __init__(self, resource_name, opts=None, **record_args):
+        self.resource_name = resource_name
+        self.record_args = record_args
+        self.alias_names = [alias.name for alias in (opts.aliases or [])]
+
+
+def validation_option(domain, token):
+    return {
+        "domain_name": domain,
+        "resource_record_name": f"_{token}.{domain.lstrip('*.')}.",
+        "resource_record_type": "CNAME",
+        "resource_record_value": f"_{token}-value.acm-validations.aws.",
+    }
+
+
+@pytest.fixture()
+def records(monkeypatch):
+    created = []
+
+    def record(resource_name, **record_args):
+        created.append(FakeRecord(resource_name, **record_args))
+        return created[-1]
+
+    monkeypatch.setattr(route53_helper.route53, "Record", record)
+    return created
+
+
+def test_validation_records_are_deduplicated(records):
+    validation_options = [
+        validation_option("lms.mitx.mit.edu", "abc"),
+        # A wildcard shares the validation record of its apex domain.
+        validation_option("*.lms.mitx.mit.edu", "abc"),
+        validation_option("studio.mitx.mit.edu", "def"),
+    ]
+
+    validation_records = acm_certificate_validation_records(
+        validation_options, zone_id="ZMITX", name_prefix="edxapp-validation"
+    )
+
+    assert [record.resource_name for record in validation_records] == [
+        "edxapp-validation-abc.lms.mitx.mit.edu",
+        "edxapp-validation-def.studio.mitx.mit.edu",
+    ]
+    assert validation_records[1].record_args["records"] == [
+        "_def-value.acm-validations.aws."
+    ]
+    assert validation_records[1].alias_names == []
+    assert records == validation_records
+
+
+def test_record_names_do_not_depend_on_order(records):
+    validation_options = [
+        validation_option("lms.mitx.mit.edu", "abc"),
+        validation_option("studio.mitx.mit.edu", "def"),
+    ]
+
+    forward, backward = (
+        {
+            record.resource_name
+            for record in acm_certificate_validation_records(options, "ZMITX")
+        }
+        for options in (validation_options, validation_options[::-1])
+    )
+
+    assert forward == backward
+
+
+def test_legacy_edxapp_names_are_aliased_by_position(records):
+    validation_options = [
+        validation_option("lms.mitx.mit.edu", "abc"),
+        validation_option("*.lms.mitx.mit.edu", "abc"),
+        validation_option("studio.mitx.mit.edu", "def"),
+    ]
+
+    validation_records = acm_certificate_validation_records(
+        validation_options,
+        zone_id="ZMITX",
+        name_prefix="edxapp-acm-cert-validation",
+        legacy_name_prefix="edxapp-acm-cert-validation-route53-record",
+    )
+
+    # The index of each record matches the index it was created with before it was
+    # deduplicated, so the existing resources are adopted rather than replaced.
+    assert [record.alias_names for record in validation_records] == [
+        ["edxapp-acm-cert-validation-route53-record-0"],
+        ["edxapp-acm-cert-validation-route53-record-2"],
+    ]
+    # The legacy record of the duplicate is kept rather than deleted, since deleting
+    # it would remove the CNAME shared with the first record.
+    assert [record.resource_name for record in records] == [
+        "edxapp-acm-cert-validation-abc.lms.mitx.mit.edu",
+        "edxapp-acm-cert-validation-route53-record-1",
+        "edxapp-acm-cert-validation-def.studio.mitx.mit.edu",
+    ]
@@ -0,0 +1,140 @@
+import pytest
+from botocore.exceptions import ClientError, NoCredentialsError
+
+from ol_infrastructure.lib.aws import tagging_helper
+from ol_infrastructure.lib.aws.tagging_helper import (
+    MAX_TAGGING_ATTEMPTS,
+    PULUMI_MANAGED_TAG,
+    PulumiManagedTagQueue,
+)
+
+
+def client_error(error_code, operation_name="CreateTags"):
+    return ClientError({"Error": {"Code": error_code}}, operation_name)
+
+
+class FakeTaggingClient:
+    def __init__(self, failures=None, invalid_ids=()):
+        self.calls = []
+        self.failures = list(failures or [])
+        self.invalid_ids = set(invalid_ids)
+
+    def _respond(self, resource_ids):
+        self.calls.append(resource_ids)
+        if self.failures:
+            raise self.failures.pop(0)
+        if self.invalid_ids & set(resource_ids):
+            raise client_error("InvalidID")
+
+    def create_tags(self, Resources, Tags):  # noqa: N803
+        assert Tags == [PULUMI_MANAGED_TAG]
+        self._respond(Resources)
+
+    def change_tags_for_resource(self, ResourceType, ResourceId, AddTags):  # noqa: N803
+        assert ResourceType == "hostedzone"
+        self._respond([ResourceId])
+
+
+@pytest.fixture()
+def sleeps(monkeypatch):
+    sleep_durations = []
+    monkeypatch.setattr(tagging_helper.time, "sleep", sleep_durations.append)
+    return sleep_durations
+
+
+@pytest.fixture()
+def queue(monkeypatch):
+    monkeypatch.setattr(tagging_helper.atexit, "register", lambda flush: None)
+    return PulumiManagedTagQueue()
+
+
+def use_client(monkeypatch, fake_client):
+    monkeypatch.setattr(tagging_helper, "aws_client", lambda service_name: fake_client)
+    return fake_client
+
+
+def test_ec2_ids_are_deduplicated_and_batched(monkeypatch, queue, sleeps):
+    fake_client = use_client(monkeypatch, FakeTaggingClient())
+    for resource_index in range(2500):
+        queue.enqueue("ec2", f"vpc-{resource_index}")
+    queue.enqueue("ec2", "vpc-0")
+
+    assert queue.flush() == {}
+    assert [len(batch) for batch in fake_client.calls] == [1000, 1000, 500]
+    assert queue.pending() == {"ec2": [], "route53": []}
+
+
+def test_route53_zones_are_tagged_one_at_a_time(monkeypatch, queue, sleeps):
+    fake_client = use_client(monkeypatch, FakeTaggingClient())
+    queue.enqueue("route53", "Z1")
+    queue.enqueue("route53", "Z2")
+
+    queue.flush()
+
+    assert fake_client.calls == [["Z1"], ["Z2"]]
+
+
+def test_throttling_is_retried_with_backoff(monkeypatch, queue, sleeps):
+    fake_client = use_client(
+        monkeypatch,
+        FakeTaggingClient(
+            failures=[client_error("RequestLimitExceeded"), client_error("Throttling")]
+        ),
+    )
+    queue.enqueue("ec2", "vpc-1")
+
+    assert queue.flush() == {}
+    assert len(fake_client.calls) == 3
+    assert len(sleeps) == 2
+    assert sleeps[1] > sleeps[0]
+
+
+def test_persistent_throttling_gives_up(monkeypatch, queue, sleeps):
+    use_client(
+        monkeypatch,
+        FakeTaggingClient(failures=[client_error("Throttling")] * MAX_TAGGING_ATTEMPTS),
+    )
+    queue.enqueue("ec2", "vpc-1")
+
+    assert queue.flush() == {"ec2": ["vpc-1"]}
+    assert len(sleeps) == MAX_TAGGING_ATTEMPTS - 1
+
+
+def test_a_bad_id_only_fails_itself(monkeypatch, queue, sleeps, caplog):
+    fake_client = use_client(monkeypatch, FakeTaggingClient(invalid_ids={"vpc-bad"}))
+    resource_ids = [f"vpc-{resource_index}" for resource_index in range(7)]
+    for resource_id in [*resource_ids[:3], "vpc-bad", *resource_ids[3:]]:
+        queue.enqueue("ec2", resource_id)
+
+    assert queue.flush() == {"ec2": ["vpc-bad"]}
+    tagged = {
+        resource_id
+        for batch in fake_client.calls
+        if "vpc-bad" not in batch
+        for resource_id in batch
+    }
+    assert tagged == set(resource_ids)
+    assert "vpc-bad" in caplog.text
+    assert sleeps == []
+
+
+def test_botocore_errors_are_reported_not_raised(monkeypatch, queue, caplog):
+    fake_client = use_client(
+        monkeypatch, FakeTaggingClient(failures=[NoCredentialsError()])
+    )
+    queue.enqueue("ec2", "vpc-1")
+    queue.enqueue("ec2", "vpc-2")
+
+    assert queue.flush() == {"ec2": ["vpc-1", "vpc-2"]}
+    assert len(fake_client.calls) == 1
+    assert "Unable to locate credentials" in caplog.text
+
+
+def test_flush_is_registered_at_exit_once(monkeypatch):
+    registered = []
+    monkeypatch.setattr(tagging_helper.atexit, "register", registered.append)
+    tag_queue = PulumiManagedTagQueue()
+    tag_queue.enqueue("ec2", "vpc-1")
+    tag_queue.enqueue("route53", "Z1")
+
+    assert registered == [tag_queue.flush]
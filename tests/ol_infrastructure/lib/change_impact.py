@@ -0,0 +1,183 @@
+import ast
+
+import pytest
+
+from ol_infrastructure.lib.change_impact import (
+    REPO_ROOT,
+    SECRETS_DIR,
+    SOURCE_ROOT,
+    ImportGraph,
+    _reads_secret,
+    _string_patterns,
+    analyze_changes,
+)
+from ol_infrastructure.lib.stack_graph import StackGraph
+
+APPLICATIONS = SOURCE_ROOT.joinpath("ol_infrastructure", "applications")
+COMPONENTS = SOURCE_ROOT.joinpath("ol_infrastructure", "components")
+
+
+@pytest.fixture()
+def stack_graph():
+    return StackGraph(
+        projects={
+            "applications.edxapp.QA": APPLICATIONS.joinpath("edxapp"),
+            "applications.edxapp.Production": APPLICATIONS.joinpath("edxapp"),
+            "applications.forum.QA": APPLICATIONS.joinpath("forum"),
+            "applications.forum.setup.QA": APPLICATIONS.joinpath("forum", "setup"),
+            "applications.tika.QA": APPLICATIONS.joinpath("tika"),
+        },
+        dependencies={"applications.forum.QA": {"applications.edxapp.QA"}},
+    )
+
+
+@pytest.fixture()
+def import_graph():
+    return ImportGraph(
+        modules={
+            "ol_infrastructure.components.database": COMPONENTS.joinpath("database.py"),
+            "ol_infrastructure.components.cache": COMPONENTS.joinpath("cache.py"),
+            "ol_infrastructure.applications.edxapp.__main__": APPLICATIONS.joinpath(
+                "edxapp", "__main__.py"
+            ),
+            "ol_infrastructure.applications.tika.__main__": APPLICATIONS.joinpath(
+                "tika", "__main__.py"
+            ),
+        },
+        imports={
+            "ol_infrastructure.components.database": set(),
+            "ol_infrastructure.components.cache": {
+                "ol_infrastructure.components.database"
+            },
+            "ol_infrastructure.applications.edxapp.__main__": {
+                "ol_infrastructure.components.cache"
+            },
+            "ol_infrastructure.applications.tika.__main__": set(),
+        },
+        strings={
+            "ol_infrastructure.components.database": set(),
+            "ol_infrastructure.components.cache": set(),
+            "ol_infrastructure.applications.edxapp.__main__": {
+                "edxapp/*.*.yaml",
+                "pulumi/consul.*.yaml",
+            },
+            "ol_infrastructure.applications.tika.__main__": {
+                "tika/tika.*.yaml",
+                "mitx-*",
+            },
+        },
+    )
+
+
+def analyze(stack_graph, import_graph, *changed_files, consumer_depth=0):
+    return analyze_changes(
+        list(changed_files),
+        stack_graph=stack_graph,
+        import_graph=import_graph,
+        consumer_depth=consumer_depth,
+    )
+
+
+def test_global_files_affect_every_project(stack_graph, import_graph):
+    impact = analyze(stack_graph, import_graph, REPO_ROOT.joinpath("poetry.lock"))
+    assert impact.stacks == set(stack_graph.projects)
+    # Only the top level file is global.
+    nested_lock = APPLICATIONS.joinpath("tika", "poetry.lock")
+    impact = analyze(stack_graph, import_graph, nested_lock)
+    assert impact.stacks == {"applications.tika.QA"}
+
+
+def test_files_map_to_the_most_deeply_nested_project(stack_graph, import_graph):
+    impact = analyze(
+        stack_graph, import_graph, APPLICATIONS.joinpath("forum", "setup", "main.tf")
+    )
+    assert impact.projects == {APPLICATIONS.joinpath("forum", "setup")}
+    assert impact.stacks == {"applications.forum.setup.QA"}
+    impact = analyze(stack_graph, import_graph, APPLICATIONS.joinpath("forum", "x.py"))
+    assert impact.stacks == {"applications.forum.QA"}
+
+
+def test_component_changes_fan_out_to_importing_projects(stack_graph, import_graph):
+    impact = analyze(stack_graph, import_graph, COMPONENTS.joinpath("database.py"))
+    assert impact.projects == {APPLICATIONS.joinpath("edxapp")}
+    assert impact.stacks == {"applications.edxapp.QA", "applications.edxapp.Production"}
+    impact = analyze(
+        stack_graph,
+        import_graph,
+        COMPONENTS.joinpath("database.py"),
+        consumer_depth=1,
+    )
+    assert impact.stacks == {
+        "applications.edxapp.QA",
+        "applications.edxapp.Production",
+        "applications.forum.QA",
+    }
+
+
+@pytest.mark.parametrize(
+    ("secret_path", "expected_stacks"),
+    [
+        (
+            "edxapp/mitx.qa.yaml",
+            {"applications.edxapp.QA", "applications.edxapp.Production"},
+        ),
+        (
+            "edxapp/mitx-staging.ci.yaml",
+            {"applications.edxapp.QA", "applications.edxapp.Production"},
+        ),
+        (
+            "pulumi/consul.qa.yaml",
+            {"applications.edxapp.QA", "applications.edxapp.Production"},
+        ),
+        ("tika/tika.production.yaml", {"applications.tika.QA"}),
+        # Other files in a directory that a program reads from.
+        ("pulumi/fastly.yaml", set()),
+        ("tika/other.qa.yaml", set()),
+        ("edxapp/nested/mitx.qa.yaml", set()),
+    ],
+)
+def test_secret_changes_affect_programs_reading_them(
+    stack_graph, import_graph, secret_path, expected_stacks
+):
+    impact = analyze(stack_graph, import_graph, SECRETS_DIR.joinpath(secret_path))
+    assert impact.stacks == expected_stacks
+
+
+def test_string_patterns_replace_formatted_values():
+    module = ast.parse(
+        'read_yaml_secrets(Path(f"pulumi/consul.{stack_info.env_suffix}.yaml"))\n'
+        'Path().joinpath("pulumi", f"vault.{env_prefix}.{env_suffix}.yaml")\n'
+    )
+    assert _string_patterns(module) == {
+        "pulumi/consul.*.yaml",
+        "pulumi",
+        "vault.*.*.yaml",
+    }
+
+
+@pytest.mark.parametrize(
+    ("pattern", "secret_path", "expected"),
+    [
+        ("fastly.yaml", "fastly.yaml", True),
+        ("vault.*.*.yaml", "pulumi/vault.mitx.qa.yaml", True),
+        ("pulumi/", "pulumi/vault.mitx.qa.yaml", False),
+        ("pulumi", "pulumi/vault.mitx.qa.yaml", False),
+        ("consul.env", "consul/consul.env", True),
+        # Names built from the environment which aren't paths.
+        ("mitx-*", "edxapp/mitx-staging.ci.yaml", False),
+        ("mitx-*", "mitx-staging.ci.yaml", False),
+        ("*.yaml", "pulumi/vault.mitx.qa.yaml", False),
+        ("pulumi/*.yaml", "pulumi/nested/vault.yaml", False),
+    ],
+)
+def test_reads_secret(pattern, secret_path, expected):
+    assert _reads_secret(pattern, secret_path) is expected
+
+
+def test_files_outside_the_repository_are_ignored(stack_graph, import_graph, tmp_path):
+    outside_file = tmp_path.joinpath("x.py")
+    impact = analyze(
+        stack_graph, import_graph, outside_file, APPLICATIONS.joinpath("tika", "a.py")
+    )
+    assert impact.ignored_files == [outside_file.resolve()]
+    assert impact.stacks == {"applications.tika.QA"}
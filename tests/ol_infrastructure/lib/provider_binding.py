@@ -0,0 +1,44 @@
+import pulumi
+
+from ol_infrastructure.lib.provider_binding import ProviderBinding
+
+
+def transformation_args(type_token, provider=None):
+    return pulumi.ResourceTransformationArgs(
+        resource=None,
+        type_=type_token,
+        name="test-resource",
+        props={},
+        opts=pulumi.ResourceOptions(provider=provider),
+    )
+
+
+def test_binds_providers_by_package():
+    created = []
+    vault_provider = object()
+    binding = ProviderBinding()
+    binding.bind("vault", lambda: created.append("vault") or vault_provider)
+    binding.bind("consul", lambda: created.append("consul"))
+
+    first = binding(transformation_args("vault:index/mount:Mount"))
+    second = binding(transformation_args("vault:generic/secret:Secret"))
+
+    assert first.opts.provider is vault_provider
+    assert second.opts.provider is vault_provider
+    assert created == ["vault"]
+    assert binding.stats.bound_by_package == {"vault": 2}
+
+
+def test_leaves_other_and_explicit_providers_alone():
+    explicit_provider = object()
+    binding = ProviderBinding()
+    binding.bind("consul", object)
+
+    assert binding(transformation_args("aws:s3/bucket:Bucket")) is None
+    assert binding(transformation_args("pulumi:providers:consul")) is None
+    assert (
+        binding(transformation_args("consul:index/keys:Keys", explicit_provider))
+        is None
+    )
+    assert binding.stats.resources_seen == 3
+    assert binding.stats.resources_bound == 0
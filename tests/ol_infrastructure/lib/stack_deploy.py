@@ -0,0 +1,105 @@
+import pytest
+
+from ol_infrastructure.lib import stack_deploy
+from ol_infrastructure.lib.stack_deploy import StackRun, critical_path, deploy_stacks
+from ol_infrastructure.lib.stack_graph import StackGraph
+
+
+@pytest.fixture()
+def graph():
+    # network <- database <- app <-> worker <- api, and network <- cache
+    return StackGraph(
+        projects={
+            stack: None
+            for stack in ("network", "database", "cache", "app", "worker", "api")
+        },
+        dependencies={
+            "network": set(),
+            "database": {"network"},
+            "cache": {"network"},
+            "app": {"database", "worker"},
+            "worker": {"app"},
+            "api": {"worker"},
+        },
+    )
+
+
+@pytest.fixture()
+def pulumi_runs(monkeypatch):
+    started = []
+    failures = set()
+
+    def fake_run_stack(graph, stack_run, action, log_dir):
+        assert action == "up"
+        started.append(stack_run.stack)
+        stack_run.status = "failed" if stack_run.stack in failures else "succeeded"
+        return stack_run
+
+    monkeypatch.setattr(stack_deploy, "run_stack", fake_run_stack)
+    return started, failures
+
+
+def test_deploy_stacks_runs_after_dependencies(graph, pulumi_runs, tmp_path):
+    started, _ = pulumi_runs
+    runs = deploy_stacks(graph, set(graph.projects), "up", log_dir=tmp_path)
+    assert {stack_run.status for stack_run in runs.values()} == {"succeeded"}
+    position = {stack: index for index, stack in enumerate(started)}
+    for stack, dependencies in graph.ordering_dependencies(graph.projects).items():
+        for dependency in dependencies:
+            assert position[dependency] < position[stack]
+    assert position["database"] < position["worker"]
+
+
+def test_deploy_stacks_fail_fast_stops_starting_stacks(graph, pulumi_runs, tmp_path):
+    started, failures = pulumi_runs
+    failures.add("network")
+    runs = deploy_stacks(graph, set(graph.projects), "up", log_dir=tmp_path)
+    assert started == ["network"]
+    assert runs["network"].status == "failed"
+    assert {runs[stack].status for stack in runs if stack != "network"} == {"skipped"}
+
+
+def test_deploy_stacks_without_fail_fast_skips_dependents(graph, pulumi_runs, tmp_path):
+    started, failures = pulumi_runs
+    failures.add("database")
+    runs = deploy_stacks(
+        graph,
+        set(graph.projects),
+        "up",
+        max_parallel=1,
+        fail_fast=False,
+        log_dir=tmp_path,
+    )
+    assert started == ["network", "cache", "database"]
+    assert {stack: stack_run.status for stack, stack_run in runs.items()} == {
+        "network": "succeeded",
+        "cache": "succeeded",
+        "database": "failed",
+        "app": "skipped",
+        "worker": "skipped",
+        "api": "skipped",
+    }
+
+
+def test_critical_path_follows_the_longest_chain(graph):
+    durations = {
+        "network": 10,
+        "database": 100,
+        "cache": 200,
+        "app": 5,
+        "worker": 50,
+        "api": 1,
+    }
+    runs = {
+        stack: StackRun(stack, "succeeded", started_at=0, finished_at=duration)
+        for stack, duration in durations.items()
+    }
+    assert critical_path(graph, runs) == ["network", "cache"]
+    runs["cache"].finished_at = 20
+    assert critical_path(graph, runs) == ["network", "database", "worker", "api"]
+
+
+def test_critical_path_ignores_stacks_that_did_not_run(graph):
+    runs = {stack: StackRun(stack, "skipped") for stack in graph.projects}
+    runs["network"] = StackRun("network", "failed", started_at=5, finished_at=8)
+    assert critical_path(graph, runs)[-1] == "network"
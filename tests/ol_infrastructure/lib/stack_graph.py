@@ -0,0 +1,98 @@
+import pytest
+
+from ol_infrastructure.lib.stack_graph import StackGraph, build_stack_graph
+
+PROGRAMS = {
+    "infrastructure/aws/dns": ("infrastructure.aws.dns", ""),
+    "infrastructure/aws/network": ("infrastructure.aws.network.QA", ""),
+    "applications/app": (
+        "applications.app.QA",
+        """
+worker_stack = f"applications.worker.{stack_info.name}"
+vpc = vpc_output(stack_info, "apps_vpc")
+worker = StackReference(worker_stack)
+""",
+    ),
+    "applications/worker": (
+        "applications.worker.QA",
+        """
+app = StackReference(f"applications.app.{stack_info.name}")
+zone_id = dns_zone_id()
+""",
+    ),
+    "applications/api": (
+        "applications.api.QA",
+        """
+app = stack_reference(f"applications.app.{stack_info.name}")
+other = StackReference(lookup_stack_name())
+""",
+    ),
+}
+
+
+@pytest.fixture()
+def graph(tmp_path):
+    for project, (stack, program) in PROGRAMS.items():
+        project_dir = tmp_path.joinpath(project)
+        project_dir.mkdir(parents=True)
+        project_dir.joinpath(f"Pulumi.{stack}.yaml").write_text("config: {}\n")
+        project_dir.joinpath("__main__.py").write_text(program)
+    # Stack configuration without a program is not a stack.
+    tmp_path.joinpath("Pulumi.orphan.QA.yaml").write_text("config: {}\n")
+    return build_stack_graph(tmp_path)
+
+
+def test_build_stack_graph_resolves_references(graph, tmp_path):
+    assert graph.projects["applications.app.QA"] == tmp_path.joinpath(
+        "applications/app"
+    )
+    assert "orphan.QA" not in graph.projects
+    assert graph.dependencies == {
+        "infrastructure.aws.dns": set(),
+        "infrastructure.aws.network.QA": set(),
+        "applications.app.QA": {
+            "applications.worker.QA",
+            "infrastructure.aws.network.QA",
+        },
+        "applications.worker.QA": {"applications.app.QA", "infrastructure.aws.dns"},
+        "applications.api.QA": {"applications.app.QA"},
+    }
+    assert graph.unresolved == {"applications.api.QA": ["lookup_stack_name()"]}
+
+
+def test_select_by_environment_and_pattern(graph):
+    assert graph.select("Production") == {"infrastructure.aws.dns"}
+    assert graph.select("QA", ["applications.a*"]) == {
+        "applications.app.QA",
+        "applications.api.QA",
+    }
+
+
+def test_waves_deploy_mutually_dependent_stacks_together(graph):
+    stacks = graph.select("QA")
+    assert graph.cycles(stacks) == [["applications.app.QA", "applications.worker.QA"]]
+    assert graph.waves(stacks) == [
+        ["infrastructure.aws.dns", "infrastructure.aws.network.QA"],
+        ["applications.app.QA", "applications.worker.QA"],
+        ["applications.api.QA"],
+    ]
+
+
+def test_waves_ignore_stacks_outside_the_selection(graph):
+    assert graph.waves({"applications.api.QA", "applications.worker.QA"}) == [
+        ["applications.api.QA", "applications.worker.QA"]
+    ]
+
+
+def test_cycle_waits_for_dependencies_of_every_member():
+    graph = StackGraph(
+        projects={stack: None for stack in ("a", "b", "c", "d")},
+        dependencies={"a": {"b"}, "b": {"a", "c"}, "c": {"d"}, "d": set()},
+    )
+    assert graph.ordering_dependencies(graph.projects) == {
+        "a": {"c"},
+        "b": {"c"},
+        "c": {"d"},
+        "d": set(),
+    }
+    assert graph.waves(graph.projects) == [["d"], ["c"], ["a", "b"]]
@@ -0,0 +1,71 @@
+import json
+
+import pulumi
+import pytest
+
+from ol_infrastructure.lib import pulumi_helper
+from ol_infrastructure.lib.stack_snapshot import (
+    MASKED_SECRET,
+    SNAPSHOT_FORMAT_VERSION,
+    STACK_SNAPSHOT_ENV,
+    StackSnapshotError,
+)
+
+
+class NoopMocks(pulumi.runtime.Mocks):
+    def new_resource(self, args):
+        raise AssertionError(f"Unexpected resource {args.typ} created in snapshot mode")
+
+    def call(self, args):
+        return {}
+
+
+@pytest.fixture()
+def stack_snapshot(monkeypatch, tmp_path):
+    snapshot_file = tmp_path.joinpath("stack_outputs.json")
+    snapshot_file.write_text(
+        json.dumps(
+            {
+                "version": SNAPSHOT_FORMAT_VERSION,
+                "stacks": {
+                    "infrastructure.aws.network.QA": {
+                        "data_vpc": {"id": "vpc-1234", "cidr": "10.2.0.0/16"}
+                    },
+                    "infrastructure.aws.dns": {
+                        "odl_zone_id": "Z0123",
+                        "api_token": MASKED_SECRET,
+                    },
+                },
+            }
+        )
+    )
+    monkeypatch.setenv(STACK_SNAPSHOT_ENV, str(snapshot_file))
+    monkeypatch.setattr(pulumi_helper, "_stack_references", {})
+    pulumi.runtime.set_mocks(NoopMocks())
+    return snapshot_file
+
+
+@pulumi.runtime.test
+def test_outputs_are_served_from_snapshot(stack_snapshot):
+    stack_info = pulumi_helper.StackInfo(
+        name="QA", namespace="applications.test", env_suffix="qa", env_prefix="test"
+    )
+    dns_stack = pulumi_helper.stack_reference(pulumi_helper.DNS_STACK)
+    assert pulumi_helper.stack_reference(pulumi_helper.DNS_STACK) is dns_stack
+    with pytest.raises(KeyError):
+        dns_stack.require_output("missing_output")
+
+    def check_outputs(outputs):
+        vpc_id, zone_id = outputs
+        assert vpc_id == "vpc-1234"
+        assert zone_id == "Z0123"
+
+    return pulumi.Output.all(
+        pulumi_helper.vpc_output(stack_info, "data_vpc")["id"],
+        pulumi_helper.dns_zone_id(),
+    ).apply(check_outputs)
+
+
+def test_stacks_missing_from_snapshot_are_reported(stack_snapshot):
+    with pytest.raises(StackSnapshotError, match="stack_snapshot export"):
+        pulumi_helper.stack_reference("infrastructure.aws.kms.QA")
@@ -0,0 +1,37 @@
+import hvac
+import pytest
+
+from ol_infrastructure.lib import vault_bootstrap
+from ol_infrastructure.lib.vault_bootstrap import VaultBootstrapError, wait_for
+
+
+@pytest.fixture()
+def fake_clock(monkeypatch):
+    clock = {"now": 0.0, "sleeps": []}
+
+    def sleep(seconds):
+        clock["sleeps"].append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(vault_bootstrap.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(vault_bootstrap.time, "sleep", sleep)
+    return clock
+
+
+def test_wait_for_backs_off_until_ready(fake_clock):
+    attempts = iter([hvac.exceptions.VaultDown(), False, False, True])
+
+    def probe():
+        attempt = next(attempts)
+        if isinstance(attempt, Exception):
+            raise attempt
+        return attempt
+
+    wait_for(probe, "Vault", deadline=60, initial_delay=1, max_delay=3)
+    assert fake_clock["sleeps"] == [1, 2, 3]
+
+
+def test_wait_for_stops_at_deadline(fake_clock):
+    with pytest.raises(VaultBootstrapError, match="Timed out waiting for Vault"):
+        wait_for(lambda: False, "Vault", deadline=10, initial_delay=4)
+    assert sum(fake_clock["sleeps"]) == 10
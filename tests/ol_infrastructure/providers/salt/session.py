@@ -0,0 +1,58 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pepper import PepperException
+
+from ol_infrastructure.providers.salt import session
+
+
+class FakePepper:
+    def __init__(self, api_url):
+        self.api_url = api_url
+        self.auth = {}
+        self.logins = 0
+        self.revoked_tokens = set()
+
+    def login(self, username=None, password=None, eauth=None):
+        self.logins += 1
+        self.auth = {"token": f"token-{self.logins}", "expire": time.time() + 3600}
+        return self.auth
+
+    def wheel(self, fun, **kwargs):
+        if self.auth["token"] in self.revoked_tokens:
+            raise PepperException("Authentication denied")
+        return {"return": [{"data": {"return": {"fun": fun}}}]}
+
+
+@pytest.fixture(autouse=True)
+def fake_pepper(monkeypatch):
+    monkeypatch.setattr(session, "Pepper", FakePepper)
+    monkeypatch.setattr(session, "_salt_sessions", {})
+
+
+def test_sessions_are_shared_across_threads():
+    def wheel_call(minion_id):
+        salt_session = session.salt_api_session(
+            "https://salt.example.com", "pulumi", "password", "pam"
+        )
+        return salt_session.wheel("key.print", match=[minion_id])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(wheel_call, range(50)))
+    salt_session = session.salt_api_session(
+        "https://salt.example.com", "pulumi", "password", "pam"
+    )
+    assert salt_session.logins == 1
+
+
+def test_expired_and_rejected_tokens_log_in_again():
+    salt_session = session.salt_api_session(
+        "https://salt.example.com", "pulumi", "password"
+    )
+    salt_session.wheel("key.print")
+    salt_session._client.auth["expire"] = time.time()
+    salt_session.wheel("key.print")
+    salt_session._client.revoked_tokens.add(salt_session._client.auth["token"])
+    salt_session.wheel("key.print")
+    assert salt_session.logins == 3